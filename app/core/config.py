@@ -88,6 +88,8 @@ class Settings(BaseSettings):
     # Monitoring
     SENTRY_DSN: str = ""
     ENABLE_METRICS: bool = True
+    # Time every rule check (adds two clock reads per rule; off in production)
+    PROFILE_RULES: bool = False
 
     # Logging
     LOG_LEVEL: str = "INFO"
@@ -24,7 +24,7 @@ from typing import Dict, Any
 from sqlalchemy.orm import Session
 from app.models.schemas import TransactionCheckRequest, TransactionCheckResponse, FraudFlag
 from app.models.database import Transaction, Client
-from app.services.rules import FraudRulesEngine
+from app.services.rules import get_rules_engine
 from app.services.consortium import ConsortiumService
 from app.services.fingerprint_rules import FingerprintFraudRules
 from app.core.security import hash_device_id, hash_bvn, hash_phone, hash_email
@@ -70,8 +70,8 @@ class FraudDetector:
         self.db = db
         self.client_id = client_id
 
-        # Initialize fraud rules engine (contains all 29 detection rules)
-        self.rules_engine = FraudRulesEngine()
+        # Shared fraud rules engine (contains all 29 detection rules)
+        self.rules_engine = get_rules_engine()
 
         # Initialize device fingerprint fraud detector (catches loan stacking)
         self.fingerprint_rules = FingerprintFraudRules()
@@ -189,9 +189,11 @@ class FraudDetector:
         # The rules engine now filters rules by industry vertical
         # For example, crypto rules only run for crypto transactions
         # This improves accuracy by focusing on relevant fraud patterns
-        industry = str(transaction.industry) if hasattr(transaction.industry, 'value') else transaction.industry
+        # mode="full": the flags are returned to the client and stored as the
+        # decision's explanation, so none may be cut off at the score cap
+        industry = getattr(transaction.industry, "value", transaction.industry)
         risk_score, risk_level, decision, flags = self.rules_engine.evaluate(
-            transaction, context, industry=industry
+            transaction, context, industry=industry, mode="full"
         )
 
         # Step 2.5: Run device fingerprint fraud rules (NEW!)
@@ -804,7 +806,7 @@ class FraudDetector:
             # Transaction details
             amount=transaction.amount,
             transaction_type=str(transaction.transaction_type) if hasattr(transaction.transaction_type, 'value') else transaction.transaction_type,
-            industry=str(transaction.industry) if hasattr(transaction.industry, 'value') else transaction.industry,  # Store industry vertical
+            industry=getattr(transaction.industry, "value", transaction.industry),  # Store industry vertical
 
             # Device and network info (hashed for privacy)
             device_id=device_hash,              # SHA-256 hash of device ID
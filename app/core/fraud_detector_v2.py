@@ -2,11 +2,12 @@
 
 import time
 import asyncio
+from functools import partial
 from typing import Dict, Any, Optional
 from sqlalchemy.orm import Session
 from app.models.schemas import TransactionCheckRequest, TransactionCheckResponse, FraudFlag
 from app.models.database import Transaction, Client
-from app.services.rules import FraudRulesEngine
+from app.services.rules import get_rules_engine
 from app.services.consortium import ConsortiumService
 from app.services.redis_service import get_redis_service
 from app.services.ml_detector import get_ml_detector
@@ -34,7 +35,7 @@ class EnhancedFraudDetector:
     def __init__(self, db: Session, client_id: str):
         self.db = db
         self.client_id = client_id
-        self.rules_engine = FraudRulesEngine()
+        self.rules_engine = get_rules_engine()
         self.consortium = ConsortiumService(db, client_id)
         self.redis = get_redis_service()
         self.ml_detector = get_ml_detector()
@@ -125,9 +126,10 @@ class EnhancedFraudDetector:
         # Build context for fraud detection
         context = await self._build_context(transaction)
 
-        # Run fraud detection rules
+        # Run fraud detection rules; every flag is reported, so none may be
+        # cut off at the score cap
         rule_risk_score, _, _, rule_flags = self.rules_engine.evaluate(
-            transaction, context
+            transaction, context, mode="full"
         )
 
         # Run ML prediction (if enabled for client)
@@ -253,52 +255,78 @@ class EnhancedFraudDetector:
         - Velocity data from Redis
         - Device history
         - Location history
+
+        The Redis round trips don't use the DB session, so they are sent to
+        worker threads up front and overlap with the DB queries, which stay
+        serial on this thread because the session isn't thread-safe.
         """
         context = {}
+        velocity_future = None
+        device_usage_future = None
 
         try:
-            # Consortium intelligence (if enabled)
-            if settings.ENABLE_CONSORTIUM:
-                consortium_data = self.consortium.check_fraud_patterns(transaction)
-                context["consortium"] = consortium_data
-
-                # Also check loan stacking specifically
-                stacking_data = self.consortium.check_loan_stacking(transaction)
-                context["consortium"]["client_count"] = max(
-                    consortium_data.get("client_count", 0),
-                    stacking_data.get("client_count", 0)
-                )
-                context["consortium"]["lenders"] = stacking_data.get("lenders", [])
+            loop = asyncio.get_running_loop()
 
             # Track velocity in Redis
             if transaction.user_id:
-                velocity_data = self.redis.track_transaction_velocity(
+                velocity_future = loop.run_in_executor(None, partial(
+                    self.redis.track_transaction_velocity,
                     user_id=transaction.user_id,
                     client_id=self.client_id,
                     amount=transaction.amount
-                )
-                context["velocity"] = velocity_data
-
-            # Check if device is new
-            context["new_device"] = self._is_new_device(transaction)
+                ))
 
             # Track device usage in Redis
             if transaction.device_id:
-                user_count = self.redis.track_device_usage(
+                device_usage_future = loop.run_in_executor(None, partial(
+                    self.redis.track_device_usage,
                     device_id=hash_device_id(transaction.device_id),
                     user_id=transaction.user_id,
                     client_id=self.client_id
-                )
-                context["device_usage"] = {"account_count": user_count}
+                ))
 
-            # Last location (for impossible travel detection)
-            context["last_location"] = self._get_last_location(transaction)
-
-            # VPN detection (simplified)
-            context["is_vpn"] = self._is_vpn(transaction)
-
-            # Max loan amount (from client config)
-            context["max_loan_amount"] = self._get_max_loan_amount()
+            try:
+                # Consortium intelligence (if enabled)
+                if settings.ENABLE_CONSORTIUM:
+                    consortium_data = self.consortium.check_fraud_patterns(transaction)
+                    context["consortium"] = consortium_data
+
+                    # Also check loan stacking specifically
+                    stacking_data = self.consortium.check_loan_stacking(transaction)
+                    context["consortium"]["client_count"] = max(
+                        consortium_data.get("client_count", 0),
+                        stacking_data.get("client_count", 0)
+                    )
+                    context["consortium"]["lenders"] = stacking_data.get("lenders", [])
+
+                # Check if device is new
+                context["new_device"] = self._is_new_device(transaction)
+
+                # Last location (for impossible travel detection)
+                context["last_location"] = self._get_last_location(transaction)
+
+                # VPN detection (simplified)
+                context["is_vpn"] = self._is_vpn(transaction)
+
+                # Max loan amount (from client config)
+                context["max_loan_amount"] = self._get_max_loan_amount()
+            finally:
+                # Always collect the Redis results, so a failing DB step
+                # neither leaves them unretrieved nor drops them from the
+                # partial context
+                pending = {
+                    key: future
+                    for key, future in (("velocity", velocity_future), ("device_usage", device_usage_future))
+                    if future is not None
+                }
+                results = await asyncio.gather(*pending.values(), return_exceptions=True)
+                for key, result in zip(pending, results):
+                    if isinstance(result, Exception):
+                        logger.error(f"Error building context: {result}")
+                    elif key == "device_usage":
+                        context["device_usage"] = {"account_count": result}
+                    else:
+                        context["velocity"] = result
 
         except Exception as e:
             logger.error(f"Error building context: {e}")
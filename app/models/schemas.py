@@ -936,6 +936,10 @@ class FraudFlag(BaseModel):
     confidence: Optional[float] = Field(None, description="Confidence level (0.0-1.0)", ge=0, le=1)
     metadata: Optional[Dict[str, Any]] = Field(None, description="Additional context (varies by flag type)")
 
+    class Config:
+        # Rules hand out shared prebuilt flags, so flags must not be mutated
+        frozen = True
+
 
 class TransactionCheckResponse(BaseModel):
     """
@@ -1,10 +1,11 @@
 """Services package"""
 
-from app.services.rules import FraudRulesEngine, FraudRule
+from app.services.rules import FraudRulesEngine, FraudRule, get_rules_engine
 from app.services.consortium import ConsortiumService
 
 __all__ = [
     "FraudRulesEngine",
     "FraudRule",
+    "get_rules_engine",
     "ConsortiumService",
 ]
@@ -0,0 +1,503 @@
+"""Batch scoring: vectorized Phase 3 and field-only engine rules, and a process-parallel engine runner"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from operator import eq, gt, itemgetter, lt
+from typing import Any, Callable, Dict, List, Mapping, Optional, Sequence, Tuple, Type, Union
+
+import numpy as np
+
+try:  # Optional: compiles the batch kernel when installed
+    from numba import njit, prange
+except ImportError:  # pragma: no cover - exercised only without numba
+    njit = None
+    prange = range
+
+try:  # Optional: GPU scoring for very large backfills
+    import cupy as cp
+except ImportError:  # pragma: no cover - exercised only without cupy
+    cp = None
+
+from app.models.schemas import FraudFlag, TransactionCheckRequest
+from app.services import rules as r
+from app.services.rules import MAX_RISK_SCORE, VERTICAL_BIT, FraudRule, FraudRulesEngine, ThresholdRule, compile_threshold_rules, get_rules_engine
+
+
+# Comparison codes for the vectorized evaluator, keyed by ThresholdRule.op
+OP_GT = 0  # value > threshold
+OP_LT = 1  # value < threshold
+OP_EQ = 2  # value == threshold (boolean fields)
+OP_CODES = {gt: OP_GT, lt: OP_LT, eq: OP_EQ}
+
+# Storage type of the field matrix and thresholds, with NaN as the
+# missing-value marker. float64 is what check() compares in: a narrower type
+# would round values just past a threshold (e.g. 0.8) onto it, and large
+# amounts off their exact value, so batch and online results could differ.
+FIELD_DTYPE = np.float64
+
+# Integer type of the rule tables, vertical bits and per-row scores. Rule
+# scores and vertical masks are < 256 and row scores are capped at 100, so
+# int16 carries them at a quarter of the int64 footprint with room to spare.
+SCORE_DTYPE = np.int16
+
+# Batches at least this large are scored on the GPU when CuPy and a CUDA
+# device are available; below it the host<->device copies cost more than the
+# comparisons they replace
+GPU_MIN_ROWS = 1_000_000
+
+# Phase 3 rules that compare one transaction field against a constant.
+# Each is a ThresholdRule, so its field/op/threshold double as the batch table.
+PHASE3_BATCH_RULES: Tuple[Type[ThresholdRule], ...] = (
+    r.KeystrokeDynamicsRule,
+    r.MobileSwipePatternRule,
+    r.TouchPressureInconsistencyRule,
+    r.DeviceAccelerationPatternRule,
+    r.ScrollBehaviorAnomalyRule,
+    r.SharedAccountDetectionRule,
+    r.EmailFraudLinkageRule,
+    r.BVNFraudMatchRule,
+    r.PhoneFraudLinkageRule,
+    r.DeviceFraudLinkageRule,
+    r.IPFraudLinkageRule,
+    r.IllegalEmailDomainRule,
+    r.HighRiskPhoneCarrierRule,
+    r.FamilyFraudLinkRule,
+    r.KnownFraudsterPatternRule,
+    r.SyntheticIdentityRule,
+    r.CrossVerticalVelocityRule,
+    r.AccountResurrectionRule,
+    r.DeclinedTransactionHistoryRule,
+    r.RefundAbuseSerialRule,
+    r.ChargebackAbuseSerialRule,
+    r.HistoricalFraudPatternRule,
+    r.EntropyAnomalyRule,
+    r.MLAnomalyDetectionRule,
+    r.LowLegitimacyScoreRule,
+    r.ProfileDeviationRule,
+    r.EmulatorDetectionRule,
+    r.JailbreakDetectionRule,
+    r.MalwareAppDetectionRule,
+    r.LendingCrossSellRule,
+    r.EcommerceDropshippingRule,
+    r.CryptoPumpDumpRule,
+    r.BettingArbitrageHighLikelihoodRule,
+    r.MarketplaceCollusionRule,
+    r.TransactionPatternEntropyRule,
+    r.LowBehavioralConsistencyRule,
+    r.AccountVelocityRatioRule,
+    r.LowGeographicConsistencyRule,
+    r.LowTemporalConsistencyRule,
+    r.CrossAccountFundingRule,
+    r.RoundTripTransactionRule,
+    r.TestTransactionPatternRule,
+    r.RapidProgressionRule,
+    r.BeneficiaryPatternAnomalyRule,
+    r.DeepLearningScoreRule,
+    r.EnsembleConfidenceRule,
+)
+
+
+def _score_kernel(values, ops, thresholds, base_scores, score_offsets, score_per_unit, score_caps, vertical_masks, industry_bits, hits, scores):
+    """
+    Fused per-row loop over the rule table (compiled with Numba when available)
+
+    Writes the (N, K) hit matrix and the capped per-row score in one pass over
+    contiguous float64 rows. NaN compares False, so missing fields never fire.
+    Count-scaled rules (score_per_unit > 0) score min(offset + per_unit * value, cap).
+    """
+    n_rows, n_rules = values.shape
+    for i in prange(n_rows):
+        total = 0
+        for k in range(n_rules):
+            if vertical_masks[k] & industry_bits[i] == 0:
+                continue
+            value = values[i, k]
+            op = ops[k]
+            if op == OP_GT:
+                fired = value > thresholds[k]
+            elif op == OP_LT:
+                fired = value < thresholds[k]
+            else:
+                fired = value == thresholds[k]
+            if fired:
+                hits[i, k] = True
+                if score_per_unit[k]:
+                    total += min(score_offsets[k] + score_per_unit[k] * int(value), score_caps[k])
+                else:
+                    total += base_scores[k]
+        scores[i] = min(total, MAX_RISK_SCORE)
+
+
+if njit is not None:
+    # nogil: the compiled loop never touches Python objects, so it releases the
+    # GIL and batches scored from different request threads run concurrently
+    _score_kernel = njit(parallel=True, cache=True, nogil=True)(_score_kernel)
+
+
+def _industry_bits(industries: Union[str, Sequence[str]], n_rows: int) -> np.ndarray:
+    """Vertical bit per row, from one vertical for all rows or one per row"""
+    if isinstance(industries, str):
+        return np.full(n_rows, VERTICAL_BIT.get(industries, 0), dtype=SCORE_DTYPE)
+    return np.array([VERTICAL_BIT.get(industry, 0) for industry in industries], dtype=SCORE_DTYPE)
+
+
+def _python_value(value: Any) -> Any:
+    """Plain Python value of one column cell, as the request model would hold it"""
+    if isinstance(value, np.generic):
+        value = value.item()
+    # Integer columns holding NaN arrive as floats; keep counts integral in messages
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return value
+
+
+class BatchRuleScorer:
+    """
+    Scores many transactions against the table-driven rules in one pass
+
+    Scoring a backfill one transaction at a time pays a Python method call per
+    rule per row. Here the rule table is held as parallel NumPy arrays, the
+    referenced fields are gathered into an (N, K) matrix (NaN = missing), and
+    all K rules are evaluated for all N rows with a few array ops. FraudFlag
+    objects are only built for the cells that actually fire.
+    """
+
+    def __init__(self, rule_classes: Sequence[Type[ThresholdRule]] = PHASE3_BATCH_RULES):
+        self.rules: List[ThresholdRule] = [rule_class() for rule_class in rule_classes]
+        self.fields = [rule.attr for rule in self.rules]
+        # Column order of the field matrix; one C-level itemgetter call pulls a
+        # row's values straight out of the model's __dict__
+        self.field_index = {field: i for i, field in enumerate(self.fields)}
+        self._gather_row = itemgetter(*self.fields)
+        self.ops = np.array([OP_CODES[rule.op] for rule in self.rules], dtype=np.int8)
+        self.thresholds = np.array([rule.threshold for rule in self.rules], dtype=FIELD_DTYPE)
+        self.base_scores = np.array([rule.base_score for rule in self.rules], dtype=SCORE_DTYPE)
+        self.score_offsets = np.array([rule.score_offset for rule in self.rules], dtype=SCORE_DTYPE)
+        self.score_per_unit = np.array([rule.score_per_unit for rule in self.rules], dtype=SCORE_DTYPE)
+        self.score_caps = np.array([rule.score_cap for rule in self.rules], dtype=SCORE_DTYPE)
+        self.vertical_masks = np.array([rule.vertical_mask for rule in self.rules], dtype=SCORE_DTYPE)
+        # Straight-line version of the same table for scoring one transaction,
+        # where array set-up would cost more than the comparisons
+        self._evaluate_all = compile_threshold_rules(self.rules)
+        # Scorers over the rules whose fields a column set provides, keyed by
+        # which fields are present (see evaluate_columns)
+        self._subset_scorers: Dict[Tuple[bool, ...], "BatchRuleScorer"] = {}
+
+    def field_matrix(self, transactions: Sequence[TransactionCheckRequest]) -> np.ndarray:
+        """Gather the table's fields into an (N, K) float matrix, NaN where missing"""
+        # Pydantic keeps field values in the instance __dict__; a float array
+        # converts None to NaN and bools to 0/1 on the way in
+        gather_row = self._gather_row
+        return np.array(
+            [gather_row(txn.__dict__) for txn in transactions],
+            dtype=FIELD_DTYPE,
+        ).reshape(len(transactions), len(self.fields))
+
+    def hits(self, values: np.ndarray, industry_bits: np.ndarray, xp=np) -> np.ndarray:
+        """
+        Evaluate every rule on every row; returns an (N, K) bool matrix
+
+        xp is the array module the inputs live in (NumPy, or CuPy for device arrays).
+        """
+        ops = xp.asarray(self.ops)
+        thresholds = xp.asarray(self.thresholds)
+        # NaN compares False under every op, so missing fields never fire
+        fired = xp.where(
+            ops == OP_GT, values > thresholds,
+            xp.where(ops == OP_LT, values < thresholds, values == thresholds),
+        )
+        applies = (xp.asarray(self.vertical_masks) & industry_bits[:, None]) != 0
+        return fired & applies
+
+    def row_scores(self, values: np.ndarray, hits: np.ndarray, xp=np) -> np.ndarray:
+        """Capped per-row score for an (N, K) hit matrix (xp as in hits())"""
+        score_per_unit = xp.asarray(self.score_per_unit)
+        # Count-scaled rules score from the observed value; cells that didn't
+        # fire (including NaN) contribute nothing
+        scaled = xp.minimum(
+            xp.asarray(self.score_offsets) + score_per_unit * xp.where(hits, values, 0).astype(np.int64),
+            xp.asarray(self.score_caps),
+        )
+        cell_scores = xp.where(score_per_unit != 0, scaled, xp.asarray(self.base_scores))
+        return xp.minimum(xp.where(hits, cell_scores, 0).sum(axis=1), MAX_RISK_SCORE).astype(SCORE_DTYPE)
+
+    def evaluate(self, transaction: TransactionCheckRequest, industry: str = None) -> Tuple[int, List[FraudFlag]]:
+        """
+        Score a single transaction
+
+        Args:
+            transaction: Transaction to score
+            industry: Vertical to score as. If None, the transaction's own industry is used
+
+        Returns:
+            Tuple of (risk score capped at 100, flags)
+        """
+        if industry is None:
+            industry = transaction.industry
+        flags: List[FraudFlag] = []
+        total = self._evaluate_all(transaction, VERTICAL_BIT.get(industry, 0), flags)
+        return min(total, MAX_RISK_SCORE), flags
+
+    def evaluate_batch(
+        self,
+        transactions: Sequence[TransactionCheckRequest],
+        industry: str = None
+    ) -> Tuple[np.ndarray, List[List[FraudFlag]]]:
+        """
+        Score a batch of transactions
+
+        Args:
+            transactions: Transactions to score
+            industry: Vertical to score all rows as. If None, each row's own industry is used
+
+        Returns:
+            Tuple of (risk scores capped at 100, flags per transaction)
+        """
+        if industry is None:
+            industry_bits = np.array([VERTICAL_BIT.get(txn.industry, 0) for txn in transactions], dtype=SCORE_DTYPE)
+        else:
+            industry_bits = np.full(len(transactions), VERTICAL_BIT.get(industry, 0), dtype=SCORE_DTYPE)
+
+        scores, hits = self._score(self.field_matrix(transactions), industry_bits)
+
+        flags: List[List[FraudFlag]] = [[] for _ in transactions]
+        for row, col in zip(*np.nonzero(hits)):
+            rule = self.rules[col]
+            flags[row].append(rule.flag_for(getattr(transactions[row], rule.attr)))
+
+        return scores, flags
+
+    def evaluate_columns(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        industries: Union[str, Sequence[str]]
+    ) -> Tuple[np.ndarray, List[List[FraudFlag]]]:
+        """
+        Score column-oriented data without building request models
+
+        For backtests over stored transactions: each field is read as one
+        array (e.g. a pandas DataFrame column) instead of row by row.
+
+        Fields with no column at all (e.g. a signal the source never
+        recorded) are dropped from the rule table up front rather than
+        compared as all-NaN columns.
+
+        Args:
+            columns: Field name -> values; None/NaN mark missing values
+            industries: Vertical for all rows, or one vertical per row
+
+        Returns:
+            Tuple of (risk scores capped at 100, flags per row)
+
+        Raises:
+            ValueError: If columns holds none of the scored fields
+        """
+        present = tuple(field in columns for field in self.fields)
+        if not all(present):
+            if not any(present):
+                raise ValueError("columns contain none of the scored fields")
+            return self._subset_scorer(present).evaluate_columns(columns, industries)
+
+        raw = {field: np.asarray(columns[field]) for field in self.fields}
+        values = np.column_stack([raw[field].astype(FIELD_DTYPE) for field in self.fields])
+        industry_bits = _industry_bits(industries, len(values))
+
+        scores, hits = self._score(values, industry_bits)
+
+        flags: List[List[FraudFlag]] = [[] for _ in range(len(values))]
+        for row, col in zip(*np.nonzero(hits)):
+            rule = self.rules[col]
+            flags[row].append(rule.flag_for(_python_value(raw[rule.attr][row])))
+
+        return scores, flags
+
+    def _subset_scorer(self, present: Tuple[bool, ...]) -> "BatchRuleScorer":
+        """Scorer over only the rules whose field is present, built once per field set"""
+        scorer = self._subset_scorers.get(present)
+        if scorer is None:
+            scorer = BatchRuleScorer([type(rule) for rule, has_field in zip(self.rules, present) if has_field])
+            self._subset_scorers[present] = scorer
+        return scorer
+
+    def _score(self, values: np.ndarray, industry_bits: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Capped per-row scores and the (N, K) hit matrix for a field matrix"""
+        if cp is not None and len(values) >= GPU_MIN_ROWS and cp.cuda.is_available():
+            device_values = cp.asarray(values)
+            hits = self.hits(device_values, cp.asarray(industry_bits), xp=cp)
+            scores = self.row_scores(device_values, hits, xp=cp)
+            return cp.asnumpy(scores), cp.asnumpy(hits)
+        if njit is not None:
+            hits = np.zeros(values.shape, dtype=np.bool_)
+            scores = np.empty(len(values), dtype=SCORE_DTYPE)
+            _score_kernel(values, self.ops, self.thresholds, self.base_scores, self.score_offsets, self.score_per_unit, self.score_caps, self.vertical_masks, industry_bits, hits, scores)
+        else:
+            hits = self.hits(values, industry_bits)
+            scores = self.row_scores(values, hits)
+        return scores, hits
+
+
+# Engine rules whose check() reads only transaction fields, as masks over
+# float64 columns (NaN = missing, so comparisons on it are False, like the
+# None checks in the rules). float64 keeps amounts exact at the thresholds.
+# MaximumFirstTransactionRule reads max_loan_amount from context; column
+# data has none, so its mask uses the rule's default.
+COLUMN_RULE_MASKS: Dict[Type[FraudRule], Callable[[Callable[[str], np.ndarray]], np.ndarray]] = {
+    r.NewAccountLargeAmountRule: lambda col: (col("account_age_days") < 7) & (col("amount") > 100000),
+    r.RoundAmountRule: lambda col: np.isin(col("amount"), list(r.ROUND_AMOUNTS)) & (col("account_age_days") < 14),
+    r.MaximumFirstTransactionRule: lambda col: (col("is_first_transaction") == 1) & (col("amount") >= 500000 * 0.95),
+    r.DormantAccountActivationRule: lambda col: col("dormant_days") >= 90,
+    r.ShippingMismatchRule: lambda col: (col("shipping_address_matches_billing") == 0) & (col("amount") > 50000),
+    r.ExcessiveWithdrawalsRule: lambda col: col("withdrawal_count_today") >= 5,
+    # These two test truthiness, so a 0 rating/age never fires
+    r.LowRatedSellerRule: lambda col: (col("seller_rating") != 0) & (col("seller_rating") < 2.5) & (col("amount") > 50000),
+    r.NewSellerHighValueRule: lambda col: (col("seller_account_age_days") != 0) & (col("seller_account_age_days") < 7) & (col("is_high_value_item") == 1),
+}
+
+
+class _ColumnRow:
+    """Read-only attribute view of one row of column data, passed to check()"""
+
+    __slots__ = ("_columns", "_row")
+
+    def __init__(self, columns: Dict[str, np.ndarray], row: int):
+        self._columns = columns
+        self._row = row
+
+    def __getattr__(self, name: str) -> Any:
+        column = self._columns.get(name)
+        if column is None:
+            return None
+        value = _python_value(column[self._row])
+        # NaN marks a missing value; the model field would hold None
+        return None if isinstance(value, float) and value != value else value
+
+
+class ColumnRuleScorer:
+    """
+    Scores column data against the engine's field-only rules with array masks
+
+    The multi-field engine rules listed in COLUMN_RULE_MASKS are evaluated as
+    one boolean mask per rule over whole columns. check() then runs only for
+    the rows a mask selects, against a row view, so flags carry the same
+    messages as online evaluation. Context-dependent rules aren't covered;
+    score those rows through FraudRulesEngine.
+    """
+
+    def __init__(self, rule_classes: Sequence[Type[FraudRule]] = tuple(COLUMN_RULE_MASKS)):
+        self.rules: List[FraudRule] = [rule_class() for rule_class in rule_classes]
+        self.masks = [COLUMN_RULE_MASKS[rule_class] for rule_class in rule_classes]
+        self.vertical_masks = np.array([rule.vertical_mask for rule in self.rules], dtype=SCORE_DTYPE)
+
+    def hits(self, columns: Mapping[str, Sequence[Any]], industry_bits: np.ndarray) -> Tuple[np.ndarray, Dict[str, np.ndarray]]:
+        """
+        Evaluate every rule mask; returns the (N, K) bool matrix and the float columns read
+
+        Fields with no column are treated as missing for every row.
+        """
+        n_rows = len(industry_bits)
+        floats: Dict[str, np.ndarray] = {}
+
+        def col(field: str) -> np.ndarray:
+            if field not in floats:
+                floats[field] = (
+                    np.asarray(columns[field], dtype=np.float64) if field in columns
+                    else np.full(n_rows, np.nan)
+                )
+            return floats[field]
+
+        fired = np.column_stack([mask(col) for mask in self.masks])
+        return fired & ((self.vertical_masks & industry_bits[:, None]) != 0), floats
+
+    def evaluate_columns(
+        self,
+        columns: Mapping[str, Sequence[Any]],
+        industries: Union[str, Sequence[str]]
+    ) -> Tuple[np.ndarray, List[List[FraudFlag]]]:
+        """
+        Score column-oriented data (e.g. a pandas DataFrame) without building request models
+
+        Args:
+            columns: Field name -> values; None/NaN mark missing values. Must
+                include an amount column
+            industries: Vertical for all rows, or one vertical per row
+
+        Returns:
+            Tuple of (risk scores capped at 100, flags per row)
+        """
+        n_rows = len(columns["amount"])
+        industry_bits = _industry_bits(industries, n_rows)
+        hits, floats = self.hits(columns, industry_bits)
+
+        # check() sees the original values (e.g. False rather than 0.0), read
+        # only for the fields the masks used
+        raw = {field: np.asarray(columns[field]) for field in floats if field in columns}
+        flags: List[List[FraudFlag]] = [[] for _ in range(n_rows)]
+        for row, col in zip(*np.nonzero(hits)):
+            flag = self.rules[col].check(_ColumnRow(raw, row), {})
+            if flag is not None:
+                flags[row].append(flag)
+
+        scores = np.array([min(sum(flag.score for flag in row_flags), MAX_RISK_SCORE) for row_flags in flags], dtype=SCORE_DTYPE)
+        return scores, flags
+
+
+# Engine owned by each worker process, built once by the pool initializer
+_worker_engine: Optional[FraudRulesEngine] = None
+
+
+def _init_worker() -> None:
+    """Build the worker's engine once so chunks don't pay rule construction"""
+    global _worker_engine
+    _worker_engine = get_rules_engine()
+
+
+def _evaluate_chunk(
+    chunk: Sequence[Tuple[TransactionCheckRequest, Dict[str, Any]]],
+    industry: Optional[str]
+) -> List[Tuple[int, str, str, List[FraudFlag]]]:
+    """Evaluate one chunk of (transaction, context) pairs in a worker"""
+    return [_worker_engine.evaluate(transaction, context, industry) for transaction, context in chunk]
+
+
+def evaluate_parallel(
+    transactions: Sequence[TransactionCheckRequest],
+    contexts: Optional[Sequence[Dict[str, Any]]] = None,
+    industry: str = None,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 1024
+) -> List[Tuple[int, str, str, List[FraudFlag]]]:
+    """
+    Run the full rules engine over a batch using a process pool
+
+    Rule checks are pure Python and hold the GIL, so batch ingest is split into
+    chunks and spread over processes rather than threads. Batches that fit in a
+    single chunk run inline, where pool start-up would cost more than it saves.
+    Workers are spawned, so this is meant for large backfills, not requests.
+
+    Args:
+        transactions: Transactions to evaluate
+        contexts: Per-transaction context dicts (empty context if None)
+        industry: Vertical to evaluate as. If None, each transaction's own industry is used
+        max_workers: Worker processes (defaults to the CPU count)
+        chunk_size: Transactions sent to a worker per task
+
+    Returns:
+        One (risk_score, risk_level, decision, flags) tuple per transaction, in input order
+    """
+    if contexts is None:
+        contexts = [{} for _ in transactions]
+    pairs = list(zip(transactions, contexts))
+
+    if len(pairs) <= chunk_size:
+        engine = get_rules_engine()
+        return [engine.evaluate(transaction, context, industry) for transaction, context in pairs]
+
+    chunks = [pairs[i:i + chunk_size] for i in range(0, len(pairs), chunk_size)]
+    results: List[Tuple[int, str, str, List[FraudFlag]]] = []
+    # Spawn rather than fork: forking after NumPy/Numba have started worker
+    # threads can deadlock the child
+    mp_context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context, initializer=_init_worker) as pool:
+        for chunk_results in pool.map(_evaluate_chunk, chunks, [industry] * len(chunks)):
+            results.extend(chunk_results)
+    return results
@@ -1,13 +1,70 @@
 """Consortium Intelligence Service - Privacy-preserving cross-lender fraud detection"""
 
+import math
+import threading
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
+from sqlalchemy import or_
 from sqlalchemy.orm import Session
 from app.models.database import ConsortiumIntelligence, Transaction
 from app.core.security import hash_device_id, hash_bvn, hash_phone, hash_email
 from app.models.schemas import TransactionCheckRequest
 
 
+class HashBloomFilter:
+    """
+    Bloom filter over hex SHA-256 identifier hashes
+
+    Answers "might this hash be in the consortium table?" in memory. There
+    are no false negatives, so a miss means the database lookup can be
+    skipped. Bit positions are derived from the digest itself (double
+    hashing), so membership tests don't hash again.
+    """
+
+    def __init__(self, capacity: int = 1_000_000, error_rate: float = 1e-4):
+        # Optimal bit count and hash count for the target false-positive rate
+        self.size = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        # Setting a bit is a read-modify-write of its byte; two unsynchronised
+        # adds sharing a byte could lose one, i.e. a false negative
+        self._write_lock = threading.Lock()
+
+    def _positions(self, digest: str):
+        h1 = int(digest[:16], 16)
+        h2 = int(digest[16:32], 16) | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, digest: str) -> None:
+        bits = self.bits
+        with self._write_lock:
+            for position in self._positions(digest):
+                bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, digest: str) -> bool:
+        bits = self.bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(digest))
+
+
+# In-process filter of every hash in the consortium table, shared by all
+# ConsortiumService instances. It is loaded once per process; after that one
+# request every KNOWN_HASHES_RESYNC_SECONDS catches it up with the rows added
+# since, and misses in between are trusted without a database round trip.
+# Reports made through this process are added immediately; reports made
+# through other processes become visible within one resync interval.
+#
+# Row ids can commit out of order, so each catch-up re-reads the rows above
+# the max id seen one catch-up earlier: a row that commits late is picked up
+# at most one interval later.
+KNOWN_HASHES_RESYNC_SECONDS = 60
+_known_hashes: Optional[HashBloomFilter] = None
+_known_hashes_lock = threading.Lock()  # Held by whoever loads or catches up the filter
+_known_hashes_synced_at = 0.0  # time.monotonic() of the last load or catch-up
+_known_hashes_max_id = 0  # Highest row id added to the filter
+_known_hashes_sync_from = 0  # The next catch-up reads rows above this id
+
+
 class ConsortiumService:
     """
     Consortium Intelligence Service
@@ -49,36 +106,31 @@ class ConsortiumService:
         phone_hash = hash_phone(transaction.phone) if transaction.phone else None
         email_hash = hash_email(transaction.email) if transaction.email else None
 
-        # Check consortium database for matches
-        matches = []
-
-        if device_hash:
-            match = self.db.query(ConsortiumIntelligence).filter(
-                ConsortiumIntelligence.device_hash == device_hash
-            ).first()
-            if match:
-                matches.append(match)
+        # Check consortium database for matches. All identifiers go out in one
+        # OR query (one round trip per transaction instead of one per
+        # identifier); the first record per identifier is then picked locally.
+        identifiers = [
+            (ConsortiumIntelligence.device_hash, device_hash),
+            (ConsortiumIntelligence.bvn_hash, bvn_hash),
+            (ConsortiumIntelligence.phone_hash, phone_hash),
+            (ConsortiumIntelligence.email_hash, email_hash),
+        ]
+        # Most identifiers have never been reported; the Bloom filter rules
+        # those out without a database round trip
+        known_hashes = self._get_known_hashes()
+        identifiers = [(column, value) for column, value in identifiers if value and value in known_hashes]
 
-        if bvn_hash:
-            match = self.db.query(ConsortiumIntelligence).filter(
-                ConsortiumIntelligence.bvn_hash == bvn_hash
-            ).first()
-            if match:
-                matches.append(match)
+        matches = []
 
-        if phone_hash:
-            match = self.db.query(ConsortiumIntelligence).filter(
-                ConsortiumIntelligence.phone_hash == phone_hash
-            ).first()
-            if match:
-                matches.append(match)
+        if identifiers:
+            records = self.db.query(ConsortiumIntelligence).filter(
+                or_(*(column == value for column, value in identifiers))
+            ).order_by(ConsortiumIntelligence.id).all()
 
-        if email_hash:
-            match = self.db.query(ConsortiumIntelligence).filter(
-                ConsortiumIntelligence.email_hash == email_hash
-            ).first()
-            if match:
-                matches.append(match)
+            for column, value in identifiers:
+                match = next((record for record in records if getattr(record, column.key) == value), None)
+                if match:
+                    matches.append(match)
 
         # Process matches
         if matches:
@@ -167,6 +219,65 @@ class ConsortiumService:
 
         self.db.commit()
 
+        # Make the new hashes visible to this process's lookups right away
+        if _known_hashes is not None:
+            for identifier_hash in (device_hash, bvn_hash, phone_hash, email_hash):
+                if identifier_hash:
+                    _known_hashes.add(identifier_hash)
+
+    def _get_known_hashes(self) -> HashBloomFilter:
+        """Return the shared Bloom filter of consortium hashes, catching it up when a resync is due"""
+        if _known_hashes is None:
+            # One full load per process; concurrent first requests wait for it
+            # instead of each scanning the table
+            with _known_hashes_lock:
+                if _known_hashes is None:
+                    self._sync_known_hashes()
+        elif time.monotonic() - _known_hashes_synced_at >= KNOWN_HASHES_RESYNC_SECONDS:
+            # One request catches up; the others keep using the current filter
+            if _known_hashes_lock.acquire(blocking=False):
+                try:
+                    if time.monotonic() - _known_hashes_synced_at >= KNOWN_HASHES_RESYNC_SECONDS:
+                        self._sync_known_hashes()
+                finally:
+                    _known_hashes_lock.release()
+
+        return _known_hashes
+
+    def _sync_known_hashes(self) -> None:
+        """Load the filter, or add the rows written since the last sync; caller holds _known_hashes_lock"""
+        global _known_hashes, _known_hashes_synced_at, _known_hashes_max_id, _known_hashes_sync_from
+
+        query = self.db.query(
+            ConsortiumIntelligence.id,
+            ConsortiumIntelligence.device_hash,
+            ConsortiumIntelligence.bvn_hash,
+            ConsortiumIntelligence.phone_hash,
+            ConsortiumIntelligence.email_hash
+        )
+        full_load = _known_hashes is None
+        if full_load:
+            known_hashes = HashBloomFilter()
+            previous_max_id = 0
+        else:
+            known_hashes = _known_hashes
+            previous_max_id = _known_hashes_max_id
+            query = query.filter(ConsortiumIntelligence.id > _known_hashes_sync_from)
+
+        max_id = previous_max_id
+        for row_id, *identifier_hashes in query.yield_per(10000):
+            max_id = max(max_id, row_id)
+            for identifier_hash in identifier_hashes:
+                if identifier_hash:
+                    known_hashes.add(identifier_hash)
+
+        _known_hashes = known_hashes
+        _known_hashes_max_id = max_id
+        # A full load has nothing earlier to re-read; after a catch-up the
+        # next one re-reads from this one's starting high-water mark
+        _known_hashes_sync_from = max_id if full_load else previous_max_id
+        _known_hashes_synced_at = time.monotonic()
+
     def _update_consortium_record(
         self,
         device_hash: Optional[str] = None,
@@ -9,6 +9,11 @@ import xgboost as xgb
 from sklearn.preprocessing import StandardScaler
 from app.models.schemas import TransactionCheckRequest
 
+try:  # Optional: serves ONNX exports of the models (pip install onnxruntime)
+    import onnxruntime as ort
+except ImportError:  # pragma: no cover - exercised only without onnxruntime
+    ort = None
+
 
 class MLFraudDetector:
     """
@@ -29,11 +34,15 @@ class MLFraudDetector:
         self.model: Optional[xgb.Booster] = None
         self.scaler: Optional[StandardScaler] = None
         self.feature_names: List[str] = []
+        # ONNX Runtime session for the same model, used for predictions when
+        # an exported fraud_model.onnx sits next to the .json model
+        self.onnx_session = None
 
         # Per-vertical models (NEW)
         self.vertical_models: Dict[str, Optional[xgb.Booster]] = {}
         self.vertical_scalers: Dict[str, Optional[StandardScaler]] = {}
         self.vertical_features: Dict[str, List[str]] = {}
+        self.vertical_onnx_sessions: Dict[str, Any] = {}
 
         # Supported verticals for ML
         self.supported_verticals = ["lending", "crypto", "ecommerce", "betting", "fintech", "payments", "marketplace"]
@@ -59,6 +68,7 @@ class MLFraudDetector:
                     model = xgb.Booster()
                     model.load_model(vertical_model_path)
                     self.vertical_models[vertical] = model
+                    self.vertical_onnx_sessions[vertical] = self._load_onnx_session(vertical_model_path)
 
                     # Load scaler and features
                     scaler_path = vertical_model_path.replace('.json', '_scaler.pkl')
@@ -82,6 +92,7 @@ class MLFraudDetector:
         try:
             self.model = xgb.Booster()
             self.model.load_model(path)
+            self.onnx_session = self._load_onnx_session(path)
 
             # Load scaler and feature names
             scaler_path = path.replace('.json', '_scaler.pkl')
@@ -101,6 +112,31 @@ class MLFraudDetector:
             print(f"❌ Error loading model: {e}")
             return False
 
+    def _load_onnx_session(self, model_path: str):
+        """
+        Open an ONNX Runtime session for the model's .onnx export, if present
+
+        The export is written by scripts/ml/train_model.py. ONNX Runtime runs
+        the trees natively with all graph optimizations, avoiding the DMatrix
+        construction XGBoost needs on every single-row prediction.
+
+        Returns:
+            InferenceSession, or None when onnxruntime or the export is missing
+        """
+        onnx_path = model_path.replace('.json', '.onnx')
+        if ort is None or not os.path.exists(onnx_path):
+            return None
+
+        try:
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            session = ort.InferenceSession(onnx_path, options, providers=["CPUExecutionProvider"])
+            print(f"✅ ONNX model loaded from {onnx_path}")
+            return session
+        except Exception as e:
+            print(f"⚠️  Error loading ONNX model {onnx_path}: {e}")
+            return None
+
     def predict(
         self,
         transaction: TransactionCheckRequest,
@@ -119,18 +155,20 @@ class MLFraudDetector:
             Dictionary with fraud probability and confidence
         """
         # Determine which model to use
-        industry = industry or (str(transaction.industry) if hasattr(transaction.industry, 'value') else str(transaction.industry))
+        industry = industry or str(getattr(transaction.industry, "value", transaction.industry))
 
         # Try to use vertical-specific model first (NEW)
         model = self.vertical_models.get(industry)
         scaler = self.vertical_scalers.get(industry)
         feature_names = self.vertical_features.get(industry)
+        onnx_session = self.vertical_onnx_sessions.get(industry)
 
         # Fall back to global model if vertical model not available
         if model is None:
             model = self.model
             scaler = self.scaler
             feature_names = self.feature_names
+            onnx_session = self.onnx_session
 
         if model is None:
             return {
@@ -151,11 +189,14 @@ class MLFraudDetector:
         if scaler:
             feature_array = scaler.transform(feature_array)
 
-        # Create DMatrix for prediction
-        dmatrix = xgb.DMatrix(feature_array, feature_names=feature_names)
-
         # Predict
-        fraud_probability = float(model.predict(dmatrix)[0])
+        if onnx_session is not None:
+            # Exported classifier: "probabilities" is [P(legit), P(fraud)] per row
+            probabilities = onnx_session.run(["probabilities"], {"features": feature_array.astype(np.float32)})[0]
+            fraud_probability = float(probabilities[0, 1])
+        else:
+            dmatrix = xgb.DMatrix(feature_array, feature_names=feature_names)
+            fraud_probability = float(model.predict(dmatrix)[0])
 
         # Convert to risk score (0-100)
         ml_risk_score = int(fraud_probability * 100)
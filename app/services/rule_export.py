@@ -0,0 +1,149 @@
+"""Export table-driven rules as a GoRules JDM decision and evaluate them with Zen"""
+
+import json
+from operator import eq, gt, lt
+from typing import Any, Dict, List, Optional, Sequence
+
+from app.models.schemas import FraudFlag, TransactionCheckRequest
+from app.services.batch_scoring import PHASE3_BATCH_RULES
+from app.services.rules import ThresholdRule
+
+try:  # Optional: Rust-backed JDM evaluator (pip install zen-engine)
+    import zen
+except ImportError:  # pragma: no cover - exercised only without zen-engine
+    zen = None
+
+
+# Zen unary-expression prefix for each ThresholdRule operator
+JDM_OPERATORS = {gt: "> ", lt: "< ", eq: ""}
+
+
+def _jdm_condition(rule: ThresholdRule) -> str:
+    """Render a rule's comparison as a Zen unary expression (e.g. "< 30", "true")"""
+    return JDM_OPERATORS[rule.op] + json.dumps(rule.threshold)
+
+
+def to_jdm(rules: Sequence[ThresholdRule]) -> Dict[str, Any]:
+    """
+    Export threshold rules as a JDM (JSON Decision Model) graph
+
+    The graph is input -> one "collect" decision table -> output. Each rule is a
+    table row with a condition on its own field and on the industry column; a
+    null field never matches, the same as ThresholdRule.check(). Rows output
+    only the rule's type so flags are still built from the Python rule objects.
+
+    Args:
+        rules: ThresholdRule instances to export
+
+    Returns:
+        JDM document, ready for json.dumps() or ZenEngine.create_decision()
+    """
+    fields = list(dict.fromkeys(rule.attr for rule in rules))
+    inputs = [{"id": f"in_{field}", "name": field, "field": field} for field in fields]
+    inputs.append({"id": "in_industry", "name": "industry", "field": "industry"})
+
+    rows = []
+    for index, rule in enumerate(rules):
+        row = {input_column["id"]: "" for input_column in inputs}
+        row["_id"] = f"rule_{index}"
+        row[f"in_{rule.attr}"] = _jdm_condition(rule)
+        row["in_industry"] = ", ".join(json.dumps(vertical) for vertical in rule.verticals)
+        row["out_type"] = json.dumps(rule.name)
+        rows.append(row)
+
+    return {
+        "nodes": [
+            {"id": "request", "type": "inputNode", "name": "Request", "position": {"x": 0, "y": 0}},
+            {
+                "id": "rules",
+                "type": "decisionTableNode",
+                "name": "Fraud rules",
+                "position": {"x": 300, "y": 0},
+                "content": {
+                    "hitPolicy": "collect",
+                    "inputs": inputs,
+                    "outputs": [{"id": "out_type", "name": "type", "field": "type"}],
+                    "rules": rows,
+                },
+            },
+            {"id": "response", "type": "outputNode", "name": "Response", "position": {"x": 600, "y": 0}},
+        ],
+        "edges": [
+            {"id": "request_rules", "sourceId": "request", "targetId": "rules", "type": "edge"},
+            {"id": "rules_response", "sourceId": "rules", "targetId": "response", "type": "edge"},
+        ],
+    }
+
+
+def save_jdm(path: str, rules: Sequence[ThresholdRule] = None) -> None:
+    """
+    Write the JDM export of the rules to a file
+
+    Args:
+        path: Destination .json file
+        rules: Rules to export (defaults to the Phase 3 threshold table)
+    """
+    if rules is None:
+        rules = [rule_class() for rule_class in PHASE3_BATCH_RULES]
+    with open(path, "w") as f:
+        json.dump(to_jdm(rules), f, indent=2)
+
+
+class ZenRuleEvaluator:
+    """
+    Evaluates threshold rules through a compiled Zen decision
+
+    All rules are matched in one call into the Rust engine; FraudFlag objects
+    are then built from the matching Python rules (prebuilt templates where
+    the message is constant).
+
+    With jdm_path the decision is loaded from a JDM file (e.g. one written by
+    save_jdm() and then tuned), so thresholds can change without a deploy;
+    call reload() after editing it. Each row's output type must name one of
+    the Python rules, which still supply severity, score and message.
+    """
+
+    def __init__(self, rule_classes: Sequence[type] = PHASE3_BATCH_RULES, jdm_path: Optional[str] = None):
+        if zen is None:
+            raise ImportError("zen-engine is not installed; install it to use ZenRuleEvaluator")
+
+        self.rules: List[ThresholdRule] = [rule_class() for rule_class in rule_classes]
+        self.rules_by_name = {rule.name: rule for rule in self.rules}
+        self.fields = list(dict.fromkeys(rule.attr for rule in self.rules))
+        self.jdm_path = jdm_path
+        self.engine = zen.ZenEngine()
+        self.decision = None
+        self.reload()
+
+    def reload(self) -> None:
+        """(Re)compile the decision from jdm_path, or from the Python rules when unset"""
+        if self.jdm_path is None:
+            content = json.dumps(to_jdm(self.rules))
+        else:
+            with open(self.jdm_path) as f:
+                content = f.read()
+        # Compile before swapping so a bad file leaves the current decision in place
+        self.decision = self.engine.create_decision(content)
+
+    def evaluate(self, transaction: TransactionCheckRequest, industry: str = None) -> List[FraudFlag]:
+        """
+        Evaluate the rules for one transaction
+
+        Args:
+            transaction: Transaction data
+            industry: Industry vertical. If None, uses transaction.industry
+
+        Returns:
+            Flags for the rules that fired, in table order
+        """
+        if industry is None:
+            industry = transaction.industry
+        values = transaction.__dict__
+        request: Dict[str, Optional[Any]] = {field: values[field] for field in self.fields}
+        request["industry"] = getattr(industry, "value", industry)
+
+        flags: List[FraudFlag] = []
+        for match in self.decision.evaluate(request)["result"]:
+            rule = self.rules_by_name[match["type"]]
+            flags.append(rule.flag_for(values[rule.attr]))
+        return flags
@@ -1,22 +1,129 @@
 """Fraud detection rules engine - 15+ detection rules"""
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Callable, Final, Iterable
 from datetime import datetime, time
+from operator import attrgetter, eq, gt, lt
+import ipaddress
+import math
 import re
-from app.models.schemas import FraudFlag, TransactionCheckRequest
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+from hashlib import blake2b
+from time import perf_counter_ns
+from functools import lru_cache, partial
+from app.models.schemas import FraudFlag, TransactionCheckRequest, TransactionType
+
+
+# Bit assigned to each industry vertical. A rule's verticals are folded into a
+# single int mask so vertical filtering is one AND instead of a list scan.
+VERTICAL_BIT: Dict[str, int] = {
+    "lending": 1,
+    "fintech": 2,
+    "payments": 4,
+    "ecommerce": 8,
+    "betting": 16,
+    "crypto": 32,
+    "marketplace": 64,
+    "gaming": 128,
+}
+
+# Shared vertical groupings. Tuples are immutable and shared by every rule
+# that uses them instead of each instance allocating its own list.
+ALL_VERTICALS = ("lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming")
+NON_GAMING_VERTICALS = ("lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace")
+PAYMENT_VERTICALS = ("lending", "fintech", "payments", "ecommerce", "betting", "marketplace")
+FINANCIAL_VERTICALS = ("lending", "fintech", "payments")
+ECOM_VERTICALS = ("ecommerce", "marketplace")
+
+
+def vertical_mask(verticals: Sequence[str]) -> int:
+    """Fold a list of vertical names into a VERTICAL_BIT mask"""
+    mask = 0
+    for vertical in verticals:
+        mask |= VERTICAL_BIT.get(vertical, 0)
+    return mask
+
+
+# Flags are built only from engine-controlled values (rule name, severity,
+# literal scores/confidences), so the hot path skips pydantic validation.
+# Response models accept these instances as-is.
+make_flag = FraudFlag.model_construct
+
+# Hits whose fields are all constants for the rule (fixed message, base
+# score) return one shared flag per call site instead of building a new one.
+# Keys are the rule's own interned strings and literals, so the cache is
+# bounded by the number of such call sites.
+shared_flag = lru_cache(maxsize=None)(make_flag)
+
+# Evaluation priority per severity; higher runs first
+SEVERITY_PRIORITY: Dict[str, int] = {"critical": 3, "high": 2, "medium": 1, "low": 0}
+
+# FraudRulesEngine.evaluate() modes, from cheapest to most complete
+EVALUATE_MODES = ("any_critical", "score_gate", "full")
+
+# Risk scores are capped at 100, so nothing after this point can change the outcome
+MAX_RISK_SCORE = 100
+
+# (risk_level, decision) per ten-point band of the capped score; the 40 and
+# 70 cut-offs fall on band edges, so score // 10 picks the row
+RISK_LEVEL_TABLE = tuple(
+    ("high", "decline") if band * 10 >= 70 else ("medium", "review") if band * 10 >= 40 else ("low", "approve")
+    for band in range(MAX_RISK_SCORE // 10 + 1)
+)
+
+# Default for absent blacklist/whitelist context entries
+EMPTY_SET: frozenset = frozenset()
+
+# Transaction types rules test membership in. TransactionType is a str enum,
+# so a frozenset lookup is one cached string hash instead of a list scan.
+CASH_OUT_TYPES = frozenset((TransactionType.WITHDRAWAL, TransactionType.LOAN_DISBURSEMENT))
+BETTING_WITHDRAWAL_TYPES = frozenset((TransactionType.BET_WITHDRAWAL, TransactionType.WITHDRAWAL))
+
+
+def changed_since_last(value: Any, context: Dict[str, Any], key: str) -> bool:
+    """True when value and the previous value stored under context[key] are both set and differ"""
+    if not value:
+        return False
+    previous = context.get(key)
+    return bool(previous) and previous != value
 
 
 class FraudRule:
     """Base class for fraud detection rules"""
 
-    def __init__(self, name: str, description: str, base_score: int, severity: str, verticals: List[str] = None):
-        self.name = name
-        self.description = description
+    # Rules are long-lived singletons read on every check; slots keep
+    # attribute access off the instance dict. Subclasses that don't declare
+    # their own __slots__ still get a __dict__ for extra attributes.
+    __slots__ = ("name", "description", "base_score", "severity", "verticals", "vertical_mask", "required_context_keys", "required_fields", "_flag_template")
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        base_score: int,
+        severity: str,
+        verticals: Sequence[str] = None,
+        required_context_keys: Sequence[str] = (),
+        required_fields: Sequence[str] = (),
+    ):
+        # Interned so every flag, metric label and dict key built from these
+        # shares one string object and equality checks short-circuit on identity
+        self.name = sys.intern(name)
+        self.description = sys.intern(description)
         self.base_score = base_score
-        self.severity = severity
-        # Vertical industries this rule applies to (e.g., ["lending", "fintech", "payments"])
+        self.severity = sys.intern(severity)
+        # Vertical industries this rule applies to (e.g., FINANCIAL_VERTICALS)
         # If None, rule applies to all verticals
-        self.verticals = verticals or ["lending", "fintech", "payments", "crypto", "ecommerce", "betting", "marketplace", "gaming"]
+        self.verticals = verticals or ALL_VERTICALS
+        self.vertical_mask = vertical_mask(self.verticals)
+        # Context keys the rule cannot fire without; the engine skips the rule
+        # when none of them are present (e.g. first-time users)
+        self.required_context_keys = frozenset(required_context_keys)
+        # Transaction fields check() only looks at when set; the compiled
+        # dispatch skips the call when any of them is None. Most fields are
+        # optional, so on a typical request most rules never get called.
+        self.required_fields = tuple(required_fields)
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         """
@@ -33,11 +140,234 @@ class FraudRule:
 
     def applies_to_vertical(self, industry: str) -> bool:
         """Check if this rule applies to the given industry vertical"""
-        return industry in self.verticals
+        return bool(self.vertical_mask & VERTICAL_BIT.get(industry, 0))
+
+    def flag_template(self, confidence: float, message: str) -> FraudFlag:
+        """
+        Build the flag this rule returns on every hit
+
+        For rules whose hit always carries base_score and a constant message,
+        build it once in __init__ and return the same (immutable) instance.
+        """
+        return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=confidence, message=message)
+
+
+def _threshold_check(getter: Callable[[Any], Any], op: Callable[[Any, Any], bool], threshold: float, template: Optional[FraudFlag], flag_for: Callable[[Any], FraudFlag]):
+    """
+    Build a ThresholdRule's check() as a closure over its configuration
+
+    Everything the check needs is bound as a default argument, so the hot
+    path reads fast locals instead of looking attributes up on the rule.
+    """
+    if template is not None:
+        def check(transaction, context, getter=getter, op=op, threshold=threshold, template=template):
+            value = getter(transaction)
+            return template if value is not None and op(value, threshold) else None
+    else:
+        def check(transaction, context, getter=getter, op=op, threshold=threshold, flag_for=flag_for):
+            value = getter(transaction)
+            return flag_for(value) if value is not None and op(value, threshold) else None
+    return check
+
+
+# Message whose only placeholder is the value at fixed precision, e.g. "Score: {value:.2f}"
+_VALUE_PRECISION = re.compile(r"[^{}]*\{value:\.(\d)f\}[^{}]*")
+
+
+class ThresholdRule(FraudRule):
+    """
+    Data-driven rule: fires when a single transaction attribute crosses a threshold
+
+    Subclasses only supply configuration; the shared check reads the attribute
+    once, treats None as missing (0 is real data) and formats the message with
+    the observed value. check() is built per instance by _threshold_check(),
+    so changing attr/op/threshold after construction has no effect.
+
+    A hit scores base_score, or, when score_per_unit is set, scales with the
+    observed count: min(score_offset + score_per_unit * value, score_cap).
+    """
+
+    __slots__ = ("attr", "_getter", "op", "threshold", "confidence", "message", "score_offset", "score_per_unit", "score_cap", "value_precision", "_flag_for_message", "_flag_for_value", "check")
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        base_score: int,
+        severity: str,
+        verticals: Sequence[str],
+        attr: str,
+        op: Callable[[Any, Any], bool],
+        threshold: float,
+        confidence: float,
+        message: str,
+        score_offset: int = 0,
+        score_per_unit: int = 0,
+        score_cap: int = MAX_RISK_SCORE,
+    ):
+        super().__init__(name=name, description=description, base_score=base_score, severity=severity, verticals=verticals, required_fields=(attr,))
+        self.attr = attr
+        self._getter = attrgetter(attr)
+        self.op = op
+        self.threshold = threshold
+        self.confidence = confidence
+        self.message = sys.intern(message)
+        self.score_offset = score_offset
+        self.score_per_unit = score_per_unit
+        self.score_cap = score_cap
+        # Hits with a constant message and score never change, so reuse one flag
+        self._flag_template = None if "{" in message or score_per_unit else self.flag_template(confidence, message)
+        # Formatted messages repeat (counts, scores shown to two decimals) and
+        # building a flag costs far more than formatting, so reuse flags per message
+        self._flag_for_message = lru_cache(maxsize=256)(partial(self.flag_template, confidence))
+        # A message showing the value at fixed precision ("{value:.2f}") can only
+        # render a few distinct strings, so round to that precision and look the
+        # flag up by value, skipping the float formatting on repeat hits.
+        # round() and the format spec round identically, so messages don't change.
+        precision = _VALUE_PRECISION.fullmatch(message)
+        self.value_precision = int(precision.group(1)) if precision else None
+        self._flag_for_value = lru_cache(maxsize=256)(self._format_flag)
+        self.check = _threshold_check(self._getter, op, threshold, self._flag_template, self.flag_for)
+
+    def flag_for(self, value: Any) -> FraudFlag:
+        """Flag for a hit on the observed value (the shared template when the message is constant)"""
+        if self._flag_template is not None:
+            return self._flag_template
+        if self.score_per_unit:
+            return make_flag(type=self.name, severity=self.severity, score=self.hit_score(value), confidence=self.confidence, message=self.message.format(value=value))
+        if self.value_precision is not None:
+            return self._flag_for_value(round(value, self.value_precision))
+        return self._format_flag(value)
+
+    def _format_flag(self, value: Any) -> FraudFlag:
+        """Flag carrying the formatted message for value, shared per distinct message"""
+        return self._flag_for_message(self.message.format(value=value))
+
+    def hit_score(self, value: Any) -> int:
+        """Score of a hit on the observed value"""
+        if self.score_per_unit:
+            return min(self.score_offset + self.score_per_unit * value, self.score_cap)
+        return self.base_score
+
+
+# Python source for each ThresholdRule operator, used by compile_threshold_rules()
+OP_SOURCE = {gt: ">", lt: "<", eq: "=="}
+
+
+def compile_threshold_rules(rules: Sequence[ThresholdRule]) -> Callable[[TransactionCheckRequest, int, List[FraudFlag]], int]:
+    """
+    Generate one straight-line function that evaluates a fixed ThresholdRule table
+
+    The rule set and thresholds don't change after start-up, so instead of a
+    loop calling check() on each rule the comparisons are written out as
+    source, compiled once, and run as a single function: field reads, vertical
+    masks, thresholds and scores are all constants in the bytecode and every
+    intermediate lives in fast locals. For example:
+
+        def evaluate_all(tx, industry_bit, out):
+            total = 0
+            if industry_bit & 1:
+                v = tx.keystroke_dynamics_score
+                if v is not None and v < 30:
+                    out.append(FLAG_0)
+                    total += 20
+            ...
+            return total
+
+    Args:
+        rules: ThresholdRule instances, in evaluation order
+
+    Returns:
+        evaluate_all(transaction, industry_bit, out): appends the flags that
+        fire to out and returns their summed (uncapped) score
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def evaluate_all(tx, industry_bit, out):", "    total = 0"]
+    for i, rule in enumerate(rules):
+        if type(rule).check is not ThresholdRule.check:
+            raise ValueError(f"Rule {rule.name} overrides check() and can't be compiled")
+        if rule._flag_template is not None:
+            namespace[f"FLAG_{i}"] = rule._flag_template
+            append = f"out.append(FLAG_{i})"
+        else:
+            namespace[f"FLAG_FOR_{i}"] = rule.flag_for
+            append = f"out.append(FLAG_FOR_{i}(v))"
+        if rule.score_per_unit:
+            score = f"min({rule.score_offset} + {rule.score_per_unit} * v, {rule.score_cap})"
+        else:
+            score = str(rule.base_score)
+        lines += [
+            f"    if industry_bit & {rule.vertical_mask}:",
+            f"        v = tx.{rule.attr}",
+            f"        if v is not None and v {OP_SOURCE[rule.op]} {rule.threshold!r}:",
+            f"            {append}",
+            f"            total += {score}",
+        ]
+    lines.append("    return total")
+    exec(compile("\n".join(lines), "<threshold rules>", "exec"), namespace)
+    return namespace["evaluate_all"]
+
+
+def compile_rule_dispatch(rules: Sequence[FraudRule]) -> Callable[[TransactionCheckRequest, Dict[str, Any], List[FraudFlag], float, bool], int]:
+    """
+    Generate one straight-line function that runs an ordered rule list
+
+    Hand-written rules can't be turned into expressions the way threshold
+    tables can, but the loop around them can go: each rule's bound check()
+    and required-context set become constants, required fields become inline
+    None tests in front of the call, and the engine's early-exit tests are
+    written out after every call. For example:
+
+        def evaluate_rules(tx, context, flags, limit, stop_on_critical):
+            total = 0
+            if tx.account_age_days is not None:
+                flag = CHECK_0(tx, context)
+                if flag is not None:
+                    flags.append(flag)
+                    total += flag.score
+                    if total >= limit or (stop_on_critical and flag.severity == "critical"):
+                        return total
+            if not REQUIRED_1.isdisjoint(context):
+                flag = CHECK_1(tx, context)
+                ...
+            return total
+
+    Args:
+        rules: Rules in evaluation order
+
+    Returns:
+        evaluate_rules(transaction, context, flags, limit, stop_on_critical):
+        appends the flags that fire to flags and returns their summed
+        (uncapped) score, stopping once it reaches limit
+    """
+    namespace: Dict[str, Any] = {}
+    lines = ["def evaluate_rules(tx, context, flags, limit, stop_on_critical):", "    total = 0"]
+    for i, rule in enumerate(rules):
+        namespace[f"CHECK_{i}"] = rule.check
+        indent = "    "
+        if rule.required_fields:
+            lines.append(indent + "if " + " and ".join(f"tx.{field} is not None" for field in rule.required_fields) + ":")
+            indent += "    "
+        if rule.required_context_keys:
+            namespace[f"REQUIRED_{i}"] = rule.required_context_keys
+            lines.append(f"{indent}if not REQUIRED_{i}.isdisjoint(context):")
+            indent += "    "
+        lines += [
+            f"{indent}flag = CHECK_{i}(tx, context)",
+            f"{indent}if flag is not None:",
+            f"{indent}    flags.append(flag)",
+            f"{indent}    total += flag.score",
+            f"{indent}    if total >= limit or (stop_on_critical and flag.severity == 'critical'):",
+            f"{indent}        return total",
+        ]
+    lines.append("    return total")
+    exec(compile("\n".join(lines), "<rule dispatch>", "exec"), namespace)
+    return namespace["evaluate_rules"]
 
 
 class NewAccountLargeAmountRule(FraudRule):
     """Rule 1: New Account Large Amount - Account <7 days + amount >₦100k"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -45,13 +375,14 @@ class NewAccountLargeAmountRule(FraudRule):
             description="New account with large transaction",
             base_score=30,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]  # Applies to most verticals
+            verticals=NON_GAMING_VERTICALS,  # Applies to most verticals
+            required_fields=("account_age_days",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.account_age_days is not None and transaction.account_age_days < 7:
             if transaction.amount > 100000:  # ₦100k
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"Account only {transaction.account_age_days} days old requesting ₦{transaction.amount:,.0f}",
@@ -63,6 +394,7 @@ class NewAccountLargeAmountRule(FraudRule):
 
 class LoanStackingRule(FraudRule):
     """Rule 2: Loan Stacking - Applied to 3+ lenders in 7 days"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -70,7 +402,7 @@ class LoanStackingRule(FraudRule):
             description="Applied to multiple lenders recently",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments"]  # Lending-specific
+            verticals=FINANCIAL_VERTICALS  # Lending-specific
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
@@ -79,7 +411,7 @@ class LoanStackingRule(FraudRule):
 
         if client_count >= 3:
             lenders = consortium_data.get("lenders", [])
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"Applied to {client_count} other lenders this week",
@@ -92,6 +424,7 @@ class LoanStackingRule(FraudRule):
 
 class SIMSwapPatternRule(FraudRule):
     """Rule 3: SIM Swap Pattern - Phone changed + new device + withdrawal"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -99,13 +432,14 @@ class SIMSwapPatternRule(FraudRule):
             description="Pattern indicating SIM swap attack",
             base_score=45,
             severity="critical",
-            verticals=["lending", "fintech", "payments"]  # Fintech-specific
+            verticals=FINANCIAL_VERTICALS,  # Fintech-specific
+            required_fields=("phone_changed_recently",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.phone_changed_recently and context.get("new_device", False):
-            if transaction.transaction_type in ["withdrawal", "loan_disbursement"]:
-                return FraudFlag(
+            if transaction.transaction_type in CASH_OUT_TYPES:
+                return shared_flag(
                     type=self.name,
                     severity=self.severity,
                     message="Phone changed + new device + withdrawal - classic SIM swap pattern",
@@ -115,8 +449,14 @@ class SIMSwapPatternRule(FraudRule):
         return None
 
 
+# Local-time window (inclusive) in which SuspiciousHoursRule fires
+SUSPICIOUS_HOURS_START = time(2, 0)
+SUSPICIOUS_HOURS_END = time(5, 0)
+
+
 class SuspiciousHoursRule(FraudRule):
     """Rule 4: Suspicious Hours - Transaction 2am-5am"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -124,24 +464,28 @@ class SuspiciousHoursRule(FraudRule):
             description="Transaction during suspicious hours",
             base_score=15,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]  # Universal
+            verticals=ALL_VERTICALS  # Universal
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        current_time = datetime.now().time()
-        if time(2, 0) <= current_time <= time(5, 0):
-            return FraudFlag(
-                type=self.name,
-                severity=self.severity,
-                message=f"Transaction at {current_time.strftime('%I:%M %p')} - unusual hours",
-                score=self.base_score,
-                confidence=0.65
-            )
+        now = datetime.now()
+        # The hour alone rules out most of the day without building time objects
+        if SUSPICIOUS_HOURS_START.hour <= now.hour <= SUSPICIOUS_HOURS_END.hour:
+            current_time = now.time()
+            if SUSPICIOUS_HOURS_START <= current_time <= SUSPICIOUS_HOURS_END:
+                return make_flag(
+                    type=self.name,
+                    severity=self.severity,
+                    message=f"Transaction at {current_time.strftime('%I:%M %p')} - unusual hours",
+                    score=self.base_score,
+                    confidence=0.65
+                )
         return None
 
 
 class VelocityCheckRule(FraudRule):
     """Rule 5: Velocity Check - >3 transactions in 10 minutes"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -149,7 +493,7 @@ class VelocityCheckRule(FraudRule):
             description="Too many transactions in short time",
             base_score=30,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]  # Universal
+            verticals=ALL_VERTICALS  # Universal
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
@@ -157,7 +501,7 @@ class VelocityCheckRule(FraudRule):
         count_10min = velocity_data.get("transaction_count_10min", 0)
 
         if count_10min > 3:
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"{count_10min} transactions in last 10 minutes",
@@ -169,6 +513,7 @@ class VelocityCheckRule(FraudRule):
 
 class ContactChangeWithdrawalRule(FraudRule):
     """Rule 6: Contact Change + Withdrawal - Phone/email changed + withdrawal <48hrs"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -176,14 +521,14 @@ class ContactChangeWithdrawalRule(FraudRule):
             description="Contact information changed before withdrawal",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments", "betting", "crypto"]
+            verticals=("lending", "fintech", "payments", "betting", "crypto")
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         contact_changed = transaction.phone_changed_recently or transaction.email_changed_recently
 
-        if contact_changed and transaction.transaction_type in ["withdrawal", "loan_disbursement"]:
-            return FraudFlag(
+        if contact_changed and transaction.transaction_type in CASH_OUT_TYPES:
+            return shared_flag(
                 type=self.name,
                 severity=self.severity,
                 message="Contact info changed recently followed by withdrawal",
@@ -195,6 +540,7 @@ class ContactChangeWithdrawalRule(FraudRule):
 
 class NewDeviceRule(FraudRule):
     """Rule 7: New Device - First time device + large amount"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -202,12 +548,12 @@ class NewDeviceRule(FraudRule):
             description="First time device with large transaction",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if context.get("new_device", False) and transaction.amount > 50000:
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"First time device requesting ₦{transaction.amount:,.0f}",
@@ -217,8 +563,13 @@ class NewDeviceRule(FraudRule):
         return None
 
 
+# Exact amounts RoundAmountRule treats as suspicious on new accounts
+ROUND_AMOUNTS = frozenset((50000, 100000, 200000, 500000, 1000000))
+
+
 class RoundAmountRule(FraudRule):
     """Rule 8: Round Amount - Exactly ₦50k, ₦100k, ₦500k + new account"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -226,15 +577,15 @@ class RoundAmountRule(FraudRule):
             description="Suspiciously round transaction amount",
             base_score=15,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("account_age_days",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        round_amounts = [50000, 100000, 200000, 500000, 1000000]
         is_new_account = transaction.account_age_days is not None and transaction.account_age_days < 14
 
-        if transaction.amount in round_amounts and is_new_account:
-            return FraudFlag(
+        if transaction.amount in ROUND_AMOUNTS and is_new_account:
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"Exact amount ₦{transaction.amount:,.0f} on new account",
@@ -246,6 +597,7 @@ class RoundAmountRule(FraudRule):
 
 class MaximumFirstTransactionRule(FraudRule):
     """Rule 9: Maximum First Transaction - First txn = max loan amount"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -253,14 +605,15 @@ class MaximumFirstTransactionRule(FraudRule):
             description="First transaction at maximum amount",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("is_first_transaction",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.is_first_transaction:
             max_loan = context.get("max_loan_amount", 500000)
             if transaction.amount >= max_loan * 0.95:  # Within 95% of max
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"First transaction at maximum amount (₦{transaction.amount:,.0f})",
@@ -270,8 +623,25 @@ class MaximumFirstTransactionRule(FraudRule):
         return None
 
 
+EARTH_RADIUS_KM = 6371.0
+
+
+def haversine_km(
+    lat1: float, lon1: float, lat2: float, lon2: float,
+    sin=math.sin, cos=math.cos, asin=math.asin, sqrt=math.sqrt, radians_per_degree=math.pi / 180,
+) -> float:
+    """Great-circle distance in km between two (latitude, longitude) points in degrees"""
+    # Math functions are bound as defaults so the body runs on fast locals,
+    # and only the three angles the formula uses are converted to radians
+    lat1 *= radians_per_degree
+    lat2 *= radians_per_degree
+    a = sin((lat2 - lat1) / 2) ** 2 + cos(lat1) * cos(lat2) * sin((lon2 - lon1) * radians_per_degree / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * asin(sqrt(a))
+
+
 class ImpossibleTravelRule(FraudRule):
     """Rule 10: Impossible Travel Detection - Accounts for legitimate travel methods"""
+    __slots__ = ("transport_speeds", "nigerian_routes")
 
     def __init__(self):
         super().__init__(
@@ -279,7 +649,7 @@ class ImpossibleTravelRule(FraudRule):
             description="Geographically impossible travel considering legitimate transport methods",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS
         )
 
         # Realistic maximum speeds for different transport methods
@@ -339,7 +709,7 @@ class ImpossibleTravelRule(FraudRule):
             max_flight_speed = self.transport_speeds["flight"]
             if calculated_speed_kmh > max_flight_speed:
                 # Speed exceeded even maximum flight capability (impossible)
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity="critical",
                     message=f"Impossible: {distance_km:.0f}km in {time_diff_hours:.1f}h ({calculated_speed_kmh:.0f}km/h) - exceeds flight speed",
@@ -353,7 +723,7 @@ class ImpossibleTravelRule(FraudRule):
         # SCENARIO 4: Speed is impossible (faster than any transport method)
         max_possible_speed = self.transport_speeds["flight"]
         if calculated_speed_kmh > max_possible_speed:
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity="critical",
                 message=f"Impossible: {distance_km:.0f}km in {time_diff_hours:.1f}h ({calculated_speed_kmh:.0f}km/h)",
@@ -364,7 +734,7 @@ class ImpossibleTravelRule(FraudRule):
         # SCENARIO 5: Speed is suspicious but possible (e.g., 200-500 km/h range)
         # This could be fraud trying to use impossible travel or could be account across time zones
         if calculated_speed_kmh > max_possible_speed * 0.5:  # Over 450 km/h
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity="high",
                 message=f"Highly suspicious travel: {distance_km:.0f}km in {time_diff_hours:.1f}h ({calculated_speed_kmh:.0f}km/h) - requires flight verification",
@@ -403,41 +773,111 @@ class ImpossibleTravelRule(FraudRule):
         return time_hours >= flight_time and time_hours <= max_realistic_time + 2.0
 
     def _calculate_distance(self, lat1, lon1, lat2, lon2):
-        """
-        Calculate distance using simplified formula (Haversine approximation)
-
-        In production, use proper geolocation library like geopy
-        This is simplified: 1 degree latitude ≈ 111 km, 1 degree longitude varies by latitude
-        """
+        """Great-circle distance in km between the two points (0 if the previous point is unknown)"""
         if lat2 is None or lon2 is None:
             return 0
+        return haversine_km(float(lat1), float(lon1), float(lat2), float(lon2))
+
+
+class IPRangeSet:
+    """
+    Set of IP ranges (CIDR blocks) with O(log n) membership tests
 
-        # Simple approximation: treat as rectangular grid
-        lat_diff = abs(float(lat1) - float(lat2)) * 111  # km per degree latitude
-        lon_diff = abs(float(lon1) - float(lon2)) * 111 * 0.73  # km per degree longitude (at Nigeria's latitude)
+    Blocks are merged into sorted, non-overlapping [start, end] integer
+    ranges per IP version, so a lookup is one bisect over the starts however
+    many blocks a feed contains. Unparseable addresses are never members.
+    """
 
-        # Pythagorean distance
-        return (lat_diff ** 2 + lon_diff ** 2) ** 0.5
+    __slots__ = ("_starts", "_ends", "_count")
+
+    def __init__(self, cidrs: Sequence[str] = ()):
+        ranges: Dict[int, List[List[int]]] = {4: [], 6: []}
+        networks = (ipaddress.ip_network(cidr, strict=False) for cidr in cidrs)
+        for network in sorted(networks, key=lambda n: (n.version, int(n.network_address))):
+            start, end = int(network.network_address), int(network.broadcast_address)
+            merged = ranges[network.version]
+            if merged and start <= merged[-1][1] + 1:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self._starts = {version: [r[0] for r in merged] for version, merged in ranges.items()}
+        self._ends = {version: [r[1] for r in merged] for version, merged in ranges.items()}
+        self._count = sum(len(merged) for merged in ranges.values())
+
+    def __contains__(self, ip: Any) -> bool:
+        if not self._count:
+            return False
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        value = int(address)
+        i = bisect_right(self._starts[address.version], value) - 1
+        return i >= 0 and value <= self._ends[address.version][i]
+
+    def __len__(self) -> int:
+        """Number of merged ranges"""
+        return self._count
+
+
+class HashedStringSet:
+    """
+    Compact membership set for very large string blacklists (wallets, BINs, ...)
+
+    Stores a sorted array of 8-byte BLAKE2b digests instead of the strings,
+    about 8 bytes per entry against ~100+ for a Python set of 42-64 character
+    addresses, and answers `in` with one hash and a bisect. Two different
+    strings share a digest with probability ~n / 2**64, so false positives
+    are negligible; there are no false negatives. Pass it as e.g.
+    context["blacklisted_wallets"] in place of a set.
+    """
+
+    __slots__ = ("_digests",)
+
+    def __init__(self, values: Iterable[str] = ()):
+        self._digests = array("Q", sorted(set(map(self._digest, values))))
+
+    @staticmethod
+    def _digest(value: str) -> int:
+        return int.from_bytes(blake2b(value.encode(), digest_size=8).digest(), "little")
+
+    def __contains__(self, value: Any) -> bool:
+        if not isinstance(value, str):
+            return False
+        digest = self._digest(value)
+        digests = self._digests
+        i = bisect_left(digests, digest)
+        return i < len(digests) and digests[i] == digest
+
+    def __len__(self) -> int:
+        return len(self._digests)
 
 
 class VPNProxyRule(FraudRule):
     """Rule 11: VPN/Proxy - IP from known VPN service"""
+    __slots__ = ("vpn_ranges",)
 
-    def __init__(self):
+    def __init__(self, vpn_cidrs: Sequence[str] = ()):
+        """
+        Args:
+            vpn_cidrs: Known VPN/proxy CIDR blocks (e.g. from a provider feed).
+                Addresses in them are flagged even when context["is_vpn"] isn't set.
+        """
         super().__init__(
             name="vpn_proxy",
             description="IP from known VPN/proxy service",
             base_score=20,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("ip_address",)
         )
         # Known VPN IP ranges (simplified - use a proper service like IPHub in production)
-        self.vpn_indicators = ["10.", "172.", "192.168."]
+        self.vpn_ranges = IPRangeSet(vpn_cidrs)
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ip_address:
-            if context.get("is_vpn", False):
-                return FraudFlag(
+            if context.get("is_vpn", False) or transaction.ip_address in self.vpn_ranges:
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"IP {transaction.ip_address} identified as VPN/proxy",
@@ -449,6 +889,7 @@ class VPNProxyRule(FraudRule):
 
 class DisposableEmailRule(FraudRule):
     """Rule 12: Disposable Email - Email from tempmail, guerrillamail, etc"""
+    __slots__ = ("disposable_domains", "_domain_pattern")
 
     def __init__(self):
         super().__init__(
@@ -456,30 +897,34 @@ class DisposableEmailRule(FraudRule):
             description="Disposable/temporary email address",
             base_score=20,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("email",)
         )
         self.disposable_domains = [
             "tempmail.com", "guerrillamail.com", "10minutemail.com",
             "throwaway.email", "mailinator.com", "temp-mail.org"
         ]
+        # One case-insensitive alternation scans the address once, however
+        # long the domain list grows
+        self._domain_pattern = re.compile("|".join(map(re.escape, self.disposable_domains)), re.IGNORECASE)
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.email:
-            email_lower = transaction.email.lower()
-            for domain in self.disposable_domains:
-                if domain in email_lower:
-                    return FraudFlag(
-                        type=self.name,
-                        severity=self.severity,
-                        message=f"Disposable email service detected: {domain}",
-                        score=self.base_score,
-                        confidence=0.95
-                    )
+            match = self._domain_pattern.search(transaction.email)
+            if match:
+                return make_flag(
+                    type=self.name,
+                    severity=self.severity,
+                    message=f"Disposable email service detected: {match.group().lower()}",
+                    score=self.base_score,
+                    confidence=0.95
+                )
         return None
 
 
 class DeviceSharingRule(FraudRule):
     """Rule 13: Device Sharing - Same device used for 5+ accounts"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -487,7 +932,7 @@ class DeviceSharingRule(FraudRule):
             description="Device used by multiple accounts",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
@@ -495,7 +940,7 @@ class DeviceSharingRule(FraudRule):
         account_count = device_usage.get("account_count", 0)
 
         if account_count >= 5:
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"Device used by {account_count} different accounts",
@@ -505,8 +950,9 @@ class DeviceSharingRule(FraudRule):
         return None
 
 
-class DormantAccountActivationRule(FraudRule):
+class DormantAccountActivationRule(ThresholdRule):
     """Rule 14: Dormant Account Activation - No activity 90 days, suddenly active"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -514,23 +960,21 @@ class DormantAccountActivationRule(FraudRule):
             description="Long-dormant account suddenly active",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="dormant_days",
+            op=gt,
+            threshold=89,  # >= 90 days (whole days)
+            confidence=0.68,
+            message="Account dormant for {value} days, suddenly active"
         )
 
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.dormant_days and transaction.dormant_days >= 90:
-            return FraudFlag(
-                type=self.name,
-                severity=self.severity,
-                message=f"Account dormant for {transaction.dormant_days} days, suddenly active",
-                score=self.base_score,
-                confidence=0.68
-            )
-        return None
+
+SEQUENTIAL_EMAIL_PATTERN = re.compile(r'(?:user|test|demo|temp)\d+@', re.IGNORECASE)
 
 
 class SequentialApplicationsRule(FraudRule):
     """Rule 15: Sequential Applications - Pattern like user1@, user2@, user3@"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -538,21 +982,20 @@ class SequentialApplicationsRule(FraudRule):
             description="Sequential email/user ID pattern",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("email",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.email:
-            # Check for patterns like user1@, user2@, test1@, etc.
-            pattern = r'(user|test|demo|temp)\d+@'
-            if re.search(pattern, transaction.email.lower()):
-                return FraudFlag(
-                    type=self.name,
-                    severity=self.severity,
-                    message=f"Sequential pattern detected in email: {transaction.email}",
-                    score=self.base_score,
-                    confidence=0.81
-                )
+        # Check for patterns like user1@, user2@, test1@, etc.
+        if transaction.email and SEQUENTIAL_EMAIL_PATTERN.search(transaction.email):
+            return make_flag(
+                type=self.name,
+                severity=self.severity,
+                message=f"Sequential pattern detected in email: {transaction.email}",
+                score=self.base_score,
+                confidence=0.81
+            )
         return None
 
 
@@ -560,6 +1003,7 @@ class SequentialApplicationsRule(FraudRule):
 
 class CardBINFraudRule(FraudRule):
     """Rule 16: Card BIN Fraud - High-risk card BINs"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -567,15 +1011,18 @@ class CardBINFraudRule(FraudRule):
             description="Card from high-risk BIN",
             base_score=35,
             severity="high",
-            verticals=["ecommerce", "fintech", "payments"]  # E-commerce specific
+            verticals=("ecommerce", "fintech", "payments"),  # E-commerce specific
+            required_context_keys=("high_risk_bins",),
+            required_fields=("card_bin",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.card_bin:
-            # Check against known high-risk BINs (would be loaded from database in production)
-            high_risk_bins = context.get("high_risk_bins", [])
+            # Check against known high-risk BINs (would be loaded from database in production).
+            # Callers should pass a set/frozenset built once, so this is a hash lookup.
+            high_risk_bins = context.get("high_risk_bins", EMPTY_SET)
             if transaction.card_bin in high_risk_bins:
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"Card BIN {transaction.card_bin} flagged as high-risk",
@@ -587,6 +1034,7 @@ class CardBINFraudRule(FraudRule):
 
 class MultipleFailedPaymentsRule(FraudRule):
     """Rule 17: Multiple Failed Payments - Card testing fraud"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -594,7 +1042,7 @@ class MultipleFailedPaymentsRule(FraudRule):
             description="Multiple failed payment attempts",
             base_score=40,
             severity="critical",
-            verticals=["ecommerce", "fintech", "payments"]  # E-commerce specific
+            verticals=("ecommerce", "fintech", "payments")  # E-commerce specific
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
@@ -602,7 +1050,7 @@ class MultipleFailedPaymentsRule(FraudRule):
         failed_count_1hour = velocity_data.get("failed_payment_count_1hour", 0)
 
         if failed_count_1hour >= 3:
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"{failed_count_1hour} failed payment attempts in last hour - possible card testing",
@@ -614,6 +1062,7 @@ class MultipleFailedPaymentsRule(FraudRule):
 
 class ShippingMismatchRule(FraudRule):
     """Rule 18: Shipping/Billing Mismatch - Different addresses"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -621,13 +1070,13 @@ class ShippingMismatchRule(FraudRule):
             description="Shipping and billing addresses don't match",
             base_score=25,
             severity="medium",
-            verticals=["ecommerce"]  # E-commerce specific
+            verticals=("ecommerce",)  # E-commerce specific
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.shipping_address_matches_billing is False:
             if transaction.amount > 50000:  # High-value purchase
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"₦{transaction.amount:,.0f} purchase with mismatched shipping/billing",
@@ -639,6 +1088,7 @@ class ShippingMismatchRule(FraudRule):
 
 class DigitalGoodsHighValueRule(FraudRule):
     """Rule 19: Digital Goods High Value - High-risk for chargebacks"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -646,13 +1096,14 @@ class DigitalGoodsHighValueRule(FraudRule):
             description="High-value digital goods purchase",
             base_score=20,
             severity="medium",
-            verticals=["ecommerce"]  # E-commerce specific
+            verticals=("ecommerce",),  # E-commerce specific
+            required_fields=("is_digital_goods",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.is_digital_goods and transaction.amount > 100000:
             if transaction.account_age_days and transaction.account_age_days < 30:
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"New account purchasing ₦{transaction.amount:,.0f} in digital goods",
@@ -666,6 +1117,7 @@ class DigitalGoodsHighValueRule(FraudRule):
 
 class BonusAbuseRule(FraudRule):
     """Rule 20: Bonus Abuse - Suspicious bonus claiming patterns"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -673,7 +1125,7 @@ class BonusAbuseRule(FraudRule):
             description="Potential bonus abuse pattern",
             base_score=35,
             severity="high",
-            verticals=["betting", "gaming"]  # Betting/gaming specific
+            verticals=("betting", "gaming")  # Betting/gaming specific
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
@@ -683,7 +1135,7 @@ class BonusAbuseRule(FraudRule):
             account_count = device_usage.get("account_count", 0)
 
             if account_count >= 3:
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"Bonus claim from device with {account_count} accounts - multi-accounting suspected",
@@ -695,6 +1147,7 @@ class BonusAbuseRule(FraudRule):
 
 class WithdrawalWithoutWageringRule(FraudRule):
     """Rule 21: Withdrawal Without Wagering - Money laundering risk"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -702,15 +1155,15 @@ class WithdrawalWithoutWageringRule(FraudRule):
             description="Withdrawal without sufficient wagering",
             base_score=45,
             severity="critical",
-            verticals=["betting", "gaming"]  # Betting/gaming specific
+            verticals=("betting", "gaming")  # Betting/gaming specific
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.transaction_type in ["bet_withdrawal", "withdrawal"]:
+        if transaction.transaction_type in BETTING_WITHDRAWAL_TYPES:
             wagering_ratio = context.get("wagering_ratio", 0)  # Ratio of bets to deposits
 
             if wagering_ratio < 0.5 and transaction.amount > 100000:
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"₦{transaction.amount:,.0f} withdrawal with minimal wagering - possible money laundering",
@@ -720,8 +1173,9 @@ class WithdrawalWithoutWageringRule(FraudRule):
         return None
 
 
-class ArbitrageBettingRule(FraudRule):
+class ArbitrageBettingRule(ThresholdRule):
     """Rule 22: Arbitrage Betting - Betting on all outcomes"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -729,23 +1183,18 @@ class ArbitrageBettingRule(FraudRule):
             description="Arbitrage betting pattern detected",
             base_score=30,
             severity="medium",
-            verticals=["betting", "gaming"]  # Betting/gaming specific
+            verticals=("betting", "gaming"),  # Betting/gaming specific
+            attr="bet_pattern_unusual",
+            op=eq,
+            threshold=True,
+            confidence=0.75,
+            message="Unusual betting pattern suggests arbitrage betting"
         )
 
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.bet_pattern_unusual:
-            return FraudFlag(
-                type=self.name,
-                severity=self.severity,
-                message="Unusual betting pattern suggests arbitrage betting",
-                score=self.base_score,
-                confidence=0.75
-            )
-        return None
-
 
-class ExcessiveWithdrawalsRule(FraudRule):
+class ExcessiveWithdrawalsRule(ThresholdRule):
     """Rule 23: Excessive Withdrawals - Multiple withdrawals in short time"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -753,25 +1202,20 @@ class ExcessiveWithdrawalsRule(FraudRule):
             description="Too many withdrawal attempts",
             base_score=25,
             severity="medium",
-            verticals=["betting", "gaming", "lending", "fintech", "payments"]  # Common withdrawal fraud
+            verticals=("betting", "gaming", "lending", "fintech", "payments"),  # Common withdrawal fraud
+            attr="withdrawal_count_today",
+            op=gt,
+            threshold=4,  # 5+ withdrawals
+            confidence=0.71,
+            message="{value} withdrawals today - possible structuring"
         )
 
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.withdrawal_count_today and transaction.withdrawal_count_today >= 5:
-            return FraudFlag(
-                type=self.name,
-                severity=self.severity,
-                message=f"{transaction.withdrawal_count_today} withdrawals today - possible structuring",
-                score=self.base_score,
-                confidence=0.71
-            )
-        return None
-
 
 ### CRYPTO FRAUD RULES ###
 
 class NewWalletHighValueRule(FraudRule):
     """Rule 24: New Wallet High Value - New wallet with large transaction"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -779,12 +1223,13 @@ class NewWalletHighValueRule(FraudRule):
             description="New crypto wallet with high-value transaction",
             base_score=35,
             severity="high",
-            verticals=["crypto"]  # Crypto specific
+            verticals=("crypto",),  # Crypto specific
+            required_fields=("is_new_wallet",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.is_new_wallet and transaction.amount > 500000:
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"First-time wallet attempting ₦{transaction.amount:,.0f} transaction",
@@ -796,6 +1241,7 @@ class NewWalletHighValueRule(FraudRule):
 
 class SuspiciousWalletRule(FraudRule):
     """Rule 25: Suspicious Wallet - Wallet linked to fraud/scams"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -803,15 +1249,17 @@ class SuspiciousWalletRule(FraudRule):
             description="Wallet address flagged as suspicious",
             base_score=50,
             severity="critical",
-            verticals=["crypto"]  # Crypto specific
+            verticals=("crypto",),  # Crypto specific
+            required_context_keys=("blacklisted_wallets",),
+            required_fields=("wallet_address",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.wallet_address:
-            # Check against blacklisted wallets
-            blacklisted_wallets = context.get("blacklisted_wallets", [])
+            # Check against blacklisted wallets (a set/frozenset, or HashedStringSet for very large lists)
+            blacklisted_wallets = context.get("blacklisted_wallets", EMPTY_SET)
             if transaction.wallet_address in blacklisted_wallets:
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"Wallet {transaction.wallet_address[:10]}... flagged for fraud/scam activity",
@@ -823,6 +1271,7 @@ class SuspiciousWalletRule(FraudRule):
 
 class P2PVelocityRule(FraudRule):
     """Rule 26: P2P High Velocity - Too many P2P trades"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -830,7 +1279,7 @@ class P2PVelocityRule(FraudRule):
             description="Excessive P2P trading activity",
             base_score=30,
             severity="high",
-            verticals=["crypto"]  # Crypto specific
+            verticals=("crypto",)  # Crypto specific
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
@@ -839,7 +1288,7 @@ class P2PVelocityRule(FraudRule):
             p2p_count_24h = velocity_data.get("p2p_count_24hour", 0)
 
             if p2p_count_24h > 10:
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"{p2p_count_24h} P2P trades in 24 hours - possible money laundering",
@@ -853,6 +1302,7 @@ class P2PVelocityRule(FraudRule):
 
 class NewSellerHighValueRule(FraudRule):
     """Rule 27: New Seller High Value - New seller with expensive items"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -860,13 +1310,14 @@ class NewSellerHighValueRule(FraudRule):
             description="New seller listing high-value items",
             base_score=35,
             severity="high",
-            verticals=["marketplace"]  # Marketplace specific
+            verticals=("marketplace",),  # Marketplace specific
+            required_fields=("seller_account_age_days",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.seller_account_age_days and transaction.seller_account_age_days < 7:
             if transaction.is_high_value_item:
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"Seller account only {transaction.seller_account_age_days} days old selling high-value items",
@@ -878,6 +1329,7 @@ class NewSellerHighValueRule(FraudRule):
 
 class LowRatedSellerRule(FraudRule):
     """Rule 28: Low Rated Seller - Poor seller rating"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -885,13 +1337,14 @@ class LowRatedSellerRule(FraudRule):
             description="Seller has poor rating",
             base_score=25,
             severity="medium",
-            verticals=["marketplace"]  # Marketplace specific
+            verticals=("marketplace",),  # Marketplace specific
+            required_fields=("seller_rating",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.seller_rating and transaction.seller_rating < 2.5:
             if transaction.amount > 50000:
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"Seller rating {transaction.seller_rating}/5.0 for ₦{transaction.amount:,.0f} transaction",
@@ -901,8 +1354,12 @@ class LowRatedSellerRule(FraudRule):
         return None
 
 
+HIGH_RISK_CATEGORIES = frozenset(("electronics", "phones", "gift_cards", "luxury_goods", "gadgets"))
+
+
 class HighRiskCategoryRule(FraudRule):
     """Rule 29: High Risk Category - Electronics, phones, gift cards"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -910,21 +1367,23 @@ class HighRiskCategoryRule(FraudRule):
             description="High-risk product category",
             base_score=15,
             severity="low",
-            verticals=["marketplace", "ecommerce"]  # Marketplace & e-commerce
+            verticals=ECOM_VERTICALS,  # Marketplace & e-commerce
+            required_fields=("product_category",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.product_category:
-            high_risk_categories = ["electronics", "phones", "gift_cards", "luxury_goods", "gadgets"]
-            if transaction.product_category.lower() in high_risk_categories:
-                if transaction.account_age_days and transaction.account_age_days < 14:
-                    return FraudFlag(
-                        type=self.name,
-                        severity=self.severity,
-                        message=f"New account purchasing {transaction.product_category} - high fraud category",
-                        score=self.base_score,
-                        confidence=0.64
-                    )
+        # Account age first: it is a plain comparison, lower() allocates
+        account_age_days = transaction.account_age_days
+        if account_age_days and account_age_days < 14:
+            category = transaction.product_category
+            if category and category.lower() in HIGH_RISK_CATEGORIES:
+                return make_flag(
+                    type=self.name,
+                    severity=self.severity,
+                    message=f"New account purchasing {category} - high fraud category",
+                    score=self.base_score,
+                    confidence=0.64
+                )
         return None
 
 
@@ -934,13 +1393,15 @@ class HighRiskCategoryRule(FraudRule):
 
 class EmailDomainLegitimacyRule(FraudRule):
     """Email domain legitimacy check"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="email_domain_legitimacy",
             description="Email from suspicious domain",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.email:
@@ -948,68 +1409,74 @@ class EmailDomainLegitimacyRule(FraudRule):
                 domain = transaction.identity_features.email.domain.lower()
                 suspicious_domains = ['tempmail.com', 'guerrillamail.com', 'mailinator.com', '10minutemail.com']
                 if any(d in domain for d in suspicious_domains):
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"Suspicious email domain: {domain}")
+                    return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"Suspicious email domain: {domain}")
         return None
 
 class EmailVerificationMismatchRule(FraudRule):
     """Unverified email with high-value transaction"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="email_verification_mismatch",
             description="Unverified email with suspicious activity",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.email:
             if not transaction.identity_features.email.verification_status and transaction.amount > 500000:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Unverified email with large transaction")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Unverified email with large transaction")
         return None
 
 class PhoneVerificationFailureRule(FraudRule):
     """Phone fails verification attempts"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="phone_verification_failure",
             description="Phone fails multiple verification attempts",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting")
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         verification_attempts = context.get("phone_verification_attempts", 0)
         if verification_attempts > 3:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Phone failed {verification_attempts} verification attempts")
+            return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Phone failed {verification_attempts} verification attempts")
         return None
 
 class PhoneCountryMismatchRule(FraudRule):
     """Phone country differs from IP country"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="phone_country_mismatch",
             description="Phone country differs from location",
             base_score=22,
             severity="medium",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.phone and transaction.identity_features.network:
             phone_country = transaction.identity_features.phone.country_code
             ip_country = transaction.identity_features.network.ip_country
             if phone_country and ip_country and phone_country != ip_country:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"Phone ({phone_country}) != IP ({ip_country})")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"Phone ({phone_country}) != IP ({ip_country})")
         return None
 
 class BVNAgeInconsistencyRule(FraudRule):
     """BVN age inconsistent with other indicators"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="bvn_age_inconsistency",
             description="BVN age mismatches account age",
             base_score=26,
             severity="high",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         bvn_age = context.get("bvn_age_days", 0)
@@ -1017,53 +1484,58 @@ class BVNAgeInconsistencyRule(FraudRule):
         if bvn_age > 0 and account_age > 0:
             age_diff = abs(bvn_age - account_age)
             if age_diff > 365:  # More than 1 year difference
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"BVN age ({bvn_age}d) vs account ({account_age}d)")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"BVN age ({bvn_age}d) vs account ({account_age}d)")
         return None
 
 class DeviceFingerprintChangeRule(FraudRule):
     """Device fingerprint changed recently"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="device_fingerprint_change",
             description="Device fingerprint changed from historical",
             base_score=24,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         current_fingerprint = transaction.device_fingerprint
         previous_fingerprint = context.get("previous_device_fingerprint")
         if current_fingerprint and previous_fingerprint and current_fingerprint != previous_fingerprint:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Device fingerprint changed from historical")
+            return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Device fingerprint changed from historical")
         return None
 
 class BrowserVersionAnomalyRule(FraudRule):
     """Browser version is outdated or anomalous"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="browser_version_anomaly",
             description="Browser version is outdated or anomalous",
             base_score=18,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
             browser_version = transaction.identity_features.device.browser_version
             # Check if browser version is outdated (simplified check)
             if browser_version and int(browser_version.split('.')[0] if browser_version else 0) < 50:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Outdated browser version: {browser_version}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Outdated browser version: {browser_version}")
         return None
 
 class GPUFingerprintAnomalyRule(FraudRule):
     """GPU fingerprint indicates emulator/VM"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="gpu_fingerprint_anomaly",
             description="GPU fingerprint suggests emulation",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
@@ -1071,18 +1543,19 @@ class GPUFingerprintAnomalyRule(FraudRule):
             if gpu:
                 suspicious_gpus = ['swiftshader', 'llvmpipe', 'virtualbox', 'qemu', 'vmware', 'hyper-v']
                 if any(s in gpu.lower() for s in suspicious_gpus):
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"Suspicious GPU: {gpu}")
+                    return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"Suspicious GPU: {gpu}")
         return None
 
 class IPLocationConsistencyRule(FraudRule):
     """IP geolocation inconsistent with user profile"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="ip_location_consistency",
             description="IP location inconsistent with profile",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         user_city = context.get("user_city")
@@ -1090,192 +1563,208 @@ class IPLocationConsistencyRule(FraudRule):
         if user_city and ip_city and user_city.lower() != ip_city.lower():
             previous_txn = context.get("previous_txn_timestamp")
             if previous_txn:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"IP location ({ip_city}) != user city ({user_city})")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"IP location ({ip_city}) != user city ({user_city})")
         return None
 
 class ISPReputationRule(FraudRule):
     """ISP has poor reputation"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="isp_reputation",
             description="ISP known for fraud/spam",
             base_score=15,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         isp_fraud_score = context.get("isp_fraud_score", 0)
         if isp_fraud_score > 0.7:  # High fraud ISP
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"ISP fraud score: {isp_fraud_score:.2f}")
+            return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"ISP fraud score: {isp_fraud_score:.2f}")
         return None
 
 class ASNBlacklistRule(FraudRule):
     """ASN is on fraud blacklist"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="asn_blacklist",
             description="ASN on fraud blacklist",
             base_score=35,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         asn_blacklisted = context.get("asn_blacklisted", False)
         if asn_blacklisted:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.95, message="ASN on fraud blacklist")
+            return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.95, message="ASN on fraud blacklist")
         return None
 
 class MultipleEmailsDeviceRule(FraudRule):
     """Device has multiple email addresses"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="multiple_emails_device",
             description="Multiple emails linked to device",
             base_score=23,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         email_count = context.get("device_email_count", 1)
         if email_count > 5:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"Device linked to {email_count} emails")
+            return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"Device linked to {email_count} emails")
         return None
 
 class DeviceOSChangedRule(FraudRule):
     """Device OS changed between transactions"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="device_os_changed",
             description="Device OS changed between transactions",
             base_score=26,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         previous_os = context.get("previous_device_os")
         if transaction.identity_features and transaction.identity_features.device and previous_os:
             current_os = transaction.identity_features.device.os
             if current_os and current_os.lower() != previous_os.lower():
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"OS changed: {previous_os} → {current_os}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"OS changed: {previous_os} → {current_os}")
         return None
 
 class CanvasFingerprinterRule(FraudRule):
     """Canvas fingerprint used for tracking/fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="canvas_fingerprinter",
             description="Canvas fingerprint detected",
             base_score=19,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
             if transaction.identity_features.device.canvas_fingerprint:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.58, message="Canvas fingerprinting detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.58, message="Canvas fingerprinting detected")
         return None
 
 class WebGLFingerprintRule(FraudRule):
     """WebGL fingerprint indicates targeted tracking"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="webgl_fingerprint",
             description="WebGL fingerprint tracking detected",
             base_score=17,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
             if transaction.identity_features.device.webgl_fingerprint:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.55, message="WebGL fingerprinting detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.55, message="WebGL fingerprinting detected")
         return None
 
 class FontListAnomalyRule(FraudRule):
     """Installed fonts list is unusual"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="font_list_anomaly",
             description="Installed fonts list is anomalous",
             base_score=16,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
             fonts = transaction.identity_features.device.installed_fonts
             if fonts and len(fonts) < 5:  # Very few fonts suggests VM/emulator
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.62, message=f"Unusual font list ({len(fonts)} fonts)")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.62, message=f"Unusual font list ({len(fonts)} fonts)")
         return None
 
 class CPUCoreAnomalyRule(FraudRule):
     """CPU core count is unusual"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="cpu_core_anomaly",
             description="CPU core count is unusual",
             base_score=14,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
             cores = transaction.identity_features.device.cpu_cores
             if cores and cores == 1:  # Single core very suspicious
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"Unusual CPU: {cores} core(s)")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"Unusual CPU: {cores} core(s)")
         return None
 
 class BatteryDrainAnomalyRule(FraudRule):
     """Battery level indicates intensive activity"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="battery_drain_anomaly",
             description="Battery level suggests emulator/bot",
             base_score=12,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
             battery = transaction.identity_features.device.battery_level
             if battery is not None and (battery == 100 or battery == 0):  # Always full or always zero = suspicious
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Suspicious battery level: {battery}%")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Suspicious battery level: {battery}%")
         return None
 
 class TimezoneOffsetAnomalyRule(FraudRule):
     """Timezone offset inconsistent with location"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="timezone_offset_anomaly",
             description="Timezone offset inconsistent with IP location",
             base_score=18,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         expected_offset = context.get("expected_timezone_offset", 0)
         if transaction.identity_features and transaction.identity_features.device:
             device_offset = context.get("device_timezone_offset", 0)
             if abs(expected_offset - device_offset) > 2:  # More than 2 hour difference
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.62, message=f"TZ offset mismatch: {device_offset} vs {expected_offset}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.62, message=f"TZ offset mismatch: {device_offset} vs {expected_offset}")
         return None
 
 class ScreenResolutionHistoryRule(FraudRule):
     """Screen resolution changed unexpectedly"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="screen_resolution_history",
             description="Screen resolution changed between txns",
             base_score=15,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         prev_resolution = context.get("previous_screen_resolution")
         if transaction.identity_features and transaction.identity_features.device and prev_resolution:
             current_resolution = transaction.identity_features.device.screen_resolution
             if current_resolution and current_resolution != prev_resolution:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.55, message=f"Resolution changed: {prev_resolution} → {current_resolution}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.55, message=f"Resolution changed: {prev_resolution} → {current_resolution}")
         return None
 
 # ============================================================================
@@ -1284,169 +1773,187 @@ class ScreenResolutionHistoryRule(FraudRule):
 
 class MouseMovementSuspiciousRule(FraudRule):
     """Mouse movement pattern is too perfect/robotic"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="mouse_movement_suspicious",
             description="Mouse movement pattern is robotic",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             score = transaction.behavioral_features.session.mouse_movement_score
             if score is not None and score > 95:  # Too perfect = likely bot
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Mouse pattern too perfect: {score}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Mouse pattern too perfect: {score}")
         return None
 
 class TypingSpeedConstantRule(FraudRule):
     """Typing speed is unnaturally constant"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="typing_speed_constant",
             description="Typing speed unnaturally consistent",
             base_score=26,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce")
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         typing_variance = context.get("typing_speed_variance", 0)
         if typing_variance < 0.1:  # Very low variance = bot
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"Typing speed variance too low: {typing_variance}")
+            return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"Typing speed variance too low: {typing_variance}")
         return None
 
 class KeystrokeDynamicsFailureRule(FraudRule):
     """Keystroke dynamics fails to match user profile"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="keystroke_dynamics_failure",
             description="Keystroke pattern differs from user profile",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             current_score = transaction.behavioral_features.session.keystroke_dynamics_score
             user_baseline = context.get("user_keystroke_baseline", 75)
             if current_score and abs(current_score - user_baseline) > 20:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message=f"Keystroke pattern deviation: {current_score} vs {user_baseline}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message=f"Keystroke pattern deviation: {current_score} vs {user_baseline}")
         return None
 
 class CopyPasteAbuseRule(FraudRule):
     """Excessive copy/paste indicating automated fill"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="copy_paste_abuse",
             description="Excessive copy/paste activity",
             base_score=24,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             paste_count = transaction.behavioral_features.session.copy_paste_count
             if paste_count and paste_count > 10:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Excessive copy/paste: {paste_count} times")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Excessive copy/paste: {paste_count} times")
         return None
 
 class SessionDurationAnomalyRule(FraudRule):
     """Session duration is unusually short or long"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="session_duration_anomaly",
             description="Session duration is anomalous",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             duration = transaction.behavioral_features.session.session_duration_seconds
             if duration and (duration < 5 or duration > 3600):  # Too fast or too slow
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"Anomalous session: {duration}s")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"Anomalous session: {duration}s")
         return None
 
 class LoginFailureAccelerationRule(FraudRule):
     """Failed login attempts accelerating"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="login_failure_acceleration",
             description="Failed login attempts accelerating",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.login:
             attempts = transaction.behavioral_features.login.failed_login_attempts_24h
             velocity = transaction.behavioral_features.login.failed_login_velocity
             if attempts and velocity and velocity > 5:  # High velocity
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.83, message=f"Failed login velocity: {velocity} attempts/min")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.83, message=f"Failed login velocity: {velocity} attempts/min")
         return None
 
 class PasswordResetWithdrawalRule(FraudRule):
     """Password reset immediately followed by withdrawal"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="password_reset_withdrawal",
             description="Password reset → transaction within hours",
             base_score=38,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.login:
             gap = transaction.behavioral_features.login.password_reset_txn_time_gap
             if gap and gap < 2:  # Within 2 hours
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.91, message=f"Password reset {gap}h before txn")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.91, message=f"Password reset {gap}h before txn")
         return None
 
 class TwoFactorBypassRule(FraudRule):
     """2FA disabled before high-value transaction"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="two_factor_bypass",
             description="2FA disabled before transaction",
             base_score=42,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.login:
             was_2fa_enabled = context.get("previous_2fa_enabled", True)
             is_2fa_enabled = transaction.behavioral_features.login.two_factor_enabled
             if was_2fa_enabled and not is_2fa_enabled:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.89, message="2FA disabled before transaction")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.89, message="2FA disabled before transaction")
         return None
 
 class BiometricAuthFailureRule(FraudRule):
     """Biometric authentication fails, password used instead"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="biometric_auth_failure",
             description="Biometric auth failed, fallback to password",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce")
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         biometric_available = context.get("biometric_available", False)
         if transaction.behavioral_features and transaction.behavioral_features.login:
             biometric_used = transaction.behavioral_features.login.biometric_auth
             if biometric_available and not biometric_used:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Biometric auth skipped, password used")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Biometric auth skipped, password used")
         return None
 
 class TransactionVelocityAccelerationRule(FraudRule):
     """Transaction velocity is accelerating"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="transaction_velocity_acceleration",
             description="Transaction velocity increasing over time",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.transaction:
@@ -1454,18 +1961,20 @@ class TransactionVelocityAccelerationRule(FraudRule):
             daily = transaction.behavioral_features.transaction.velocity_last_day or 0
             weekly = transaction.behavioral_features.transaction.velocity_last_week or 0
             if hourly > 5 and daily > 10 and weekly > 20:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Velocity: {hourly}h, {daily}d, {weekly}w")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Velocity: {hourly}h, {daily}d, {weekly}w")
         return None
 
 class FirstTransactionAmountDeviation(FraudRule):
     """First transaction vastly different from subsequent"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="first_transaction_deviation",
             description="First txn amount deviates from avg",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.transaction:
@@ -1474,189 +1983,210 @@ class FirstTransactionAmountDeviation(FraudRule):
             if first and avg and avg > 0:
                 deviation = abs(first - avg) / avg
                 if deviation > 2:  # More than 2x deviation
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message=f"First txn {deviation:.1f}x avg")
+                    return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message=f"First txn {deviation:.1f}x avg")
         return None
 
 class UnusualTimingPatternRule(FraudRule):
     """Transaction timing is unusually consistent"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="unusual_timing_pattern",
             description="Transactions occur at consistent intervals",
             base_score=22,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         timing_variance = context.get("transaction_timing_variance", 0)
         if timing_variance < 0.05:  # Very consistent timing = bot
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"Transaction timing too regular")
+            return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"Transaction timing too regular")
         return None
 
 class FormFillingSpeedRule(FraudRule):
     """Form filled too quickly"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="form_filling_speed",
             description="Form filled faster than human possible",
             base_score=24,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             field_time = transaction.behavioral_features.session.form_field_time_seconds
             if field_time and field_time < 2:  # Less than 2 seconds for entire form
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Form filled in {field_time}s")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Form filled in {field_time}s")
         return None
 
 class HesitationDetectionRule(FraudRule):
     """No hesitation in form completion (bot indicator)"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="hesitation_absence",
             description="No hesitation detected (bot behavior)",
             base_score=21,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             hesitation = transaction.behavioral_features.session.hesitation_detected
             if hesitation is False:  # No hesitation at all
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message="No hesitation detected in session")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message="No hesitation detected in session")
         return None
 
 class ErrorCorrectionPatternRule(FraudRule):
     """Error correction pattern indicates typing"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="error_correction_pattern",
             description="Error correction pattern suggests human",
             base_score=10,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             corrections = transaction.behavioral_features.session.error_corrections
             if corrections is not None and corrections == 0:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.50, message="No error corrections (likely bot)")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.50, message="No error corrections (likely bot)")
         return None
 
 class TabSwitchingRule(FraudRule):
     """Excessive tab switching indicates fraud research"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="tab_switching",
             description="Excessive tab switching",
             base_score=19,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             switches = transaction.behavioral_features.session.tab_switches
             if switches and switches > 15:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Excessive tab switches: {switches}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Excessive tab switches: {switches}")
         return None
 
 class WindowResizeActivityRule(FraudRule):
     """Window resizing indicates testing/automation"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="window_resize_activity",
             description="Window resized during session",
             base_score=16,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             resized = transaction.behavioral_features.session.window_resized
             if resized:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.55, message="Window resized during session")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.55, message="Window resized during session")
         return None
 
 class APIErrorVelocityRule(FraudRule):
     """High API error rate suggests probing/testing"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="api_error_velocity",
             description="High rate of API errors",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "crypto"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.interaction:
             api_errors = transaction.behavioral_features.interaction.api_errors
             api_calls = transaction.behavioral_features.interaction.api_calls_made
             if api_calls and api_calls > 0 and api_errors and api_errors / api_calls > 0.3:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"API error rate: {100*api_errors/api_calls:.0f}%")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"API error rate: {100*api_errors/api_calls:.0f}%")
         return None
 
 class MobileGestureAnomalyRule(FraudRule):
     """Mobile gestures are unnatural"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="mobile_gesture_anomaly",
             description="Mobile gestures are unnatural",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.interaction:
             swipes = transaction.behavioral_features.interaction.swipe_gestures_count
             pinches = transaction.behavioral_features.interaction.pinch_zoom_count
             if swipes and pinches and (swipes == 0 and pinches == 0):
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.62, message="No natural mobile gestures")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.62, message="No natural mobile gestures")
         return None
 
 class AppSwitchingRule(FraudRule):
     """Excessive app switching (fraud research pattern)"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="app_switching",
             description="Excessive app switching activity",
             base_score=17,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.interaction:
             switches = transaction.behavioral_features.interaction.app_switches
             if switches and switches > 10:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.58, message=f"App switches: {switches}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.58, message=f"App switches: {switches}")
         return None
 
 class ScreenOrientationAnomalyRule(FraudRule):
     """Screen orientation changes indicate device type change"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="screen_orientation_anomaly",
             description="Unusual screen orientation changes",
             base_score=14,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.interaction:
             rotations = transaction.behavioral_features.interaction.screen_orientation_changes
             if rotations and rotations > 5:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Screen rotations: {rotations}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Screen rotations: {rotations}")
         return None
 
 class NotificationInteractionRule(FraudRule):
     """Interaction with push notifications"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="notification_interaction",
             description="User interacted with push notification",
             base_score=5,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.interaction:
@@ -1667,71 +2197,79 @@ class NotificationInteractionRule(FraudRule):
 
 class PageRefreshAnomalyRule(FraudRule):
     """Excessive page refreshes"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="page_refresh_anomaly",
             description="Excessive page refreshes",
             base_score=15,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.interaction:
             refreshes = transaction.behavioral_features.interaction.page_refresh_count
             if refreshes and refreshes > 5:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Page refreshes: {refreshes}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Page refreshes: {refreshes}")
         return None
 
 class DeepLinkBypassRule(FraudRule):
     """Deep link used to skip authentication"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="deeplink_bypass",
             description="Deep link used to bypass normal flow",
             base_score=27,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.interaction:
             if transaction.behavioral_features.interaction.deeplink_used:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Deep link used in session")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Deep link used in session")
         return None
 
 class CampaignTrackingAnomalyRule(FraudRule):
     """Suspicious campaign tracking parameters"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="campaign_tracking_anomaly",
             description="Suspicious campaign parameters",
             base_score=18,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.interaction:
             campaign = transaction.behavioral_features.interaction.campaign_tracking
             suspicious_campaigns = ['test', 'fraud', 'abuse', 'bot', 'attack']
             if campaign and any(s in campaign.lower() for s in suspicious_campaigns):
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"Suspicious campaign: {campaign}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"Suspicious campaign: {campaign}")
         return None
 
 class ReferrerSourceAnomalyRule(FraudRule):
     """Suspicious referrer source"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="referrer_anomaly",
             description="Suspicious referrer source",
             base_score=16,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.interaction:
             referrer = transaction.behavioral_features.interaction.referrer_source
             suspicious_referrers = ['none', '(direct)', 'proxy', 'vpn', 'anonymous']
             if referrer and any(s in referrer.lower() for s in suspicious_referrers):
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Suspicious referrer: {referrer}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message=f"Suspicious referrer: {referrer}")
         return None
 
 # ============================================================================
@@ -1740,349 +2278,383 @@ class ReferrerSourceAnomalyRule(FraudRule):
 
 class CardAgeNewRule(FraudRule):
     """Card is very new"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="card_age_new",
             description="Card issued within last 7 days",
             base_score=22,
             severity="medium",
-            verticals=["ecommerce", "payments", "betting"]
+            verticals=("ecommerce", "payments", "betting"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.card:
             age = transaction.transaction_features.card.card_age_days
             if age and age < 7:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"Card only {age} days old")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"Card only {age} days old")
         return None
 
 class CardTestingPatternRule(FraudRule):
     """Card testing pattern detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="card_testing_pattern",
             description="Multiple small transactions followed by large",
             base_score=30,
             severity="high",
-            verticals=["ecommerce", "payments", "betting"]
+            verticals=("ecommerce", "payments", "betting"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.card:
             if transaction.transaction_features.card.card_testing_pattern:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Card testing pattern detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Card testing pattern detected")
         return None
 
 class CardReputationLowRule(FraudRule):
     """Card has poor reputation"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="card_reputation_low",
             description="Card reputation score is low",
             base_score=25,
             severity="medium",
-            verticals=["ecommerce", "payments", "betting"]
+            verticals=("ecommerce", "payments", "betting"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.card:
             rep = transaction.transaction_features.card.card_reputation_score
             if rep and rep < 30:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Card reputation: {rep}/100")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Card reputation: {rep}/100")
         return None
 
 class NewBankAccountWithdrawalRule(FraudRule):
     """New bank account with immediate withdrawal"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="new_bank_account_withdrawal",
             description="New bank account with withdrawal",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.banking:
             age = transaction.transaction_features.banking.account_age_days
             if age and age < 7 and transaction.transaction_features.banking.new_account_withdrawal:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"New bank account ({age}d) with withdrawal")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"New bank account ({age}d) with withdrawal")
         return None
 
 class BankAccountVerificationFailRule(FraudRule):
     """Bank account fails verification"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="bank_account_verification_fail",
             description="Bank account not verified",
             base_score=24,
             severity="medium",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.banking:
             verified = transaction.transaction_features.banking.account_verification
             if verified is False and transaction.amount > 500000:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Unverified bank account with large transaction")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Unverified bank account with large transaction")
         return None
 
 class AddressDistanceAnomalyRule(FraudRule):
     """Billing and shipping addresses too far apart"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="address_distance_anomaly",
             description="Billing/shipping address distance suspicious",
             base_score=20,
             severity="medium",
-            verticals=["ecommerce", "marketplace"]
+            verticals=ECOM_VERTICALS,
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.address:
             distance = transaction.transaction_features.address.address_distance_km
             if distance and distance > 1000:  # More than 1000km apart
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message=f"Addresses {distance}km apart")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message=f"Addresses {distance}km apart")
         return None
 
 class CryptoNewWalletHighValueRule(FraudRule):
     """New wallet with high-value transaction"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="crypto_new_wallet_high_value",
             description="New crypto wallet with large transaction",
             base_score=32,
             severity="high",
-            verticals=["crypto"]
+            verticals=("crypto",),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.crypto:
             age = transaction.transaction_features.crypto.wallet_age_days
             if age and age < 7 and transaction.amount > 5000000:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"New wallet ({age}d) with large transaction")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"New wallet ({age}d) with large transaction")
         return None
 
 class CryptoWithdrawalAfterDepositRule(FraudRule):
     """Immediate withdrawal after deposit (coin tumbling)"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="crypto_withdrawal_after_deposit",
             description="Withdrawal immediately after deposit",
             base_score=35,
             severity="critical",
-            verticals=["crypto"]
+            verticals=("crypto",),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.crypto:
             if transaction.transaction_features.crypto.withdrawal_after_deposit:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="Withdrawal after deposit (coin tumbling)")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="Withdrawal after deposit (coin tumbling)")
         return None
 
 class MerchantHighRiskCategoryRule(FraudRule):
     """Merchant in high-risk category"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="merchant_high_risk_category",
             description="Merchant category is high-risk",
             base_score=20,
             severity="medium",
-            verticals=["ecommerce", "marketplace", "payments"]
+            verticals=("ecommerce", "marketplace", "payments"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.merchant:
             if transaction.transaction_features.merchant.merchant_high_risk:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="High-risk merchant category")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="High-risk merchant category")
         return None
 
 class MerchantChargebackRateRule(FraudRule):
     """Merchant has high chargeback rate"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="merchant_chargeback_rate",
             description="Merchant high chargeback rate",
             base_score=18,
             severity="low",
-            verticals=["ecommerce", "marketplace"]
+            verticals=ECOM_VERTICALS,
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.merchant:
             rate = transaction.transaction_features.merchant.merchant_chargeback_rate
             if rate and rate > 0.05:  # >5% chargeback rate
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"Merchant chargeback rate: {rate:.1%}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"Merchant chargeback rate: {rate:.1%}")
         return None
 
 class MerchantRefundRateRule(FraudRule):
     """Merchant has high refund rate"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="merchant_refund_rate",
             description="Merchant high refund rate",
             base_score=17,
             severity="low",
-            verticals=["ecommerce", "marketplace"]
+            verticals=ECOM_VERTICALS,
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.merchant:
             rate = transaction.transaction_features.merchant.merchant_refund_rate
             if rate and rate > 0.10:  # >10% refund rate
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message=f"Merchant refund rate: {rate:.1%}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message=f"Merchant refund rate: {rate:.1%}")
         return None
 
 class MultipleCardsDeviceRule(FraudRule):
     """Multiple cards used on same device"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="multiple_cards_device",
             description="Multiple cards linked to device",
             base_score=25,
             severity="medium",
-            verticals=["ecommerce", "payments", "betting"]
+            verticals=("ecommerce", "payments", "betting"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.card:
             count = transaction.transaction_features.card.multiple_cards_same_device
             if count and count > 5:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"Device linked to {count} cards")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"Device linked to {count} cards")
         return None
 
 class CardBINMismatchRule(FraudRule):
     """Card BIN doesn't match stated country"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="card_bin_mismatch",
             description="Card issuing country suspicious",
             base_score=19,
             severity="low",
-            verticals=["ecommerce", "payments"]
+            verticals=("ecommerce", "payments"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.card:
             card_country = transaction.transaction_features.card.card_country
             user_country = transaction.country
             if card_country and user_country and card_country.lower() != user_country.lower():
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.63, message=f"Card ({card_country}) != user country ({user_country})")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.63, message=f"Card ({card_country}) != user country ({user_country})")
         return None
 
 class ExpiredCardRule(FraudRule):
     """Card is expired or expiring soon"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="expired_card",
             description="Card expired or expiring soon",
             base_score=23,
             severity="medium",
-            verticals=["ecommerce", "payments"]
+            verticals=("ecommerce", "payments")
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         expiry = context.get("card_expiry_months_remaining", 12)
         if expiry < 1:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="Card expired or expiring")
+            return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="Card expired or expiring")
         return None
 
 class DigitalGoodsHighAmountRule(FraudRule):
     """High-value digital goods transaction"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="digital_goods_high_amount",
             description="High-value digital goods",
             base_score=21,
             severity="medium",
-            verticals=["ecommerce"]
+            verticals=("ecommerce",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         is_digital = context.get("is_digital_goods", False)
         if is_digital and transaction.amount > 1000000:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"High-value digital goods: ₦{transaction.amount:,.0f}")
+            return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"High-value digital goods: ₦{transaction.amount:,.0f}")
         return None
 
 class BulkDigitalGoodsRule(FraudRule):
     """Bulk digital goods purchase"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="bulk_digital_goods",
             description="Bulk digital goods purchase",
             base_score=24,
             severity="medium",
-            verticals=["ecommerce"]
+            verticals=("ecommerce",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         is_digital = context.get("is_digital_goods", False)
         quantity = context.get("item_quantity", 1)
         if is_digital and quantity > 50:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"Bulk digital goods: {quantity} items")
+            return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"Bulk digital goods: {quantity} items")
         return None
 
 class FirstTimeCardRule(FraudRule):
     """Card used for first time"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="first_time_card",
             description="Card used for first time",
             base_score=18,
             severity="low",
-            verticals=["ecommerce", "payments"]
+            verticals=("ecommerce", "payments")
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         previous_txns = context.get("card_previous_transactions", 1)
         if previous_txns == 0:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message="Card used for first time")
+            return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message="Card used for first time")
         return None
 
 class CardVelocityRule(FraudRule):
     """Card velocity is suspicious"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="card_velocity",
             description="Multiple transactions on card in short time",
             base_score=22,
             severity="medium",
-            verticals=["ecommerce", "payments", "betting"]
+            verticals=("ecommerce", "payments", "betting")
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         card_txns_hour = context.get("card_transactions_last_hour", 0)
         if card_txns_hour > 5:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Card velocity: {card_txns_hour} txns/hour")
+            return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Card velocity: {card_txns_hour} txns/hour")
         return None
 
 class DuplicateTransactionRule(FraudRule):
     """Duplicate transaction detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="duplicate_transaction",
             description="Same transaction duplicated",
             base_score=26,
             severity="high",
-            verticals=["ecommerce", "payments", "betting", "crypto"]
+            verticals=("ecommerce", "payments", "betting", "crypto")
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         is_duplicate = context.get("is_duplicate_transaction", False)
         if is_duplicate:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.95, message="Duplicate transaction detected")
+            return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.95, message="Duplicate transaction detected")
         return None
 
 class TransactionAmountMismatchRule(FraudRule):
     """Amount doesn't match merchant receipt"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="transaction_amount_mismatch",
             description="Amount discrepancy with merchant",
             base_score=28,
             severity="high",
-            verticals=["ecommerce", "payments"]
+            verticals=("ecommerce", "payments")
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         expected_amount = context.get("expected_transaction_amount")
         if expected_amount and abs(transaction.amount - expected_amount) > 1000:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Amount mismatch: ₦{transaction.amount:,.0f} vs ₦{expected_amount:,.0f}")
+            return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Amount mismatch: ₦{transaction.amount:,.0f} vs ₦{expected_amount:,.0f}")
         return None
 
 class RoundAmountSuspiciousRule(FraudRule):
     """Round amount transaction"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="round_amount_suspicious",
             description="Suspiciously round amount",
             base_score=14,
             severity="low",
-            verticals=["ecommerce", "payments", "betting"]
+            verticals=("ecommerce", "payments", "betting")
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.amount > 0 and transaction.amount % 100000 == 0:  # Perfect round number
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.55, message=f"Suspiciously round amount: ₦{transaction.amount:,.0f}")
+            return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.55, message=f"Suspiciously round amount: ₦{transaction.amount:,.0f}")
         return None
 
 # ============================================================================
@@ -2091,273 +2663,305 @@ class RoundAmountSuspiciousRule(FraudRule):
 
 class ConsortiumEmailFrequencyRule(FraudRule):
     """Email seen at many lenders recently"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="consortium_email_frequency",
             description="Email appearing at multiple lenders",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.consortium_matching:
             if transaction.network_features.consortium_matching.email_seen_elsewhere:
                 count = context.get("email_lender_count", 2)
                 if count > 3:
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"Email at {count} other lenders")
+                    return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"Email at {count} other lenders")
         return None
 
 class ConsortiumPhoneFrequencyRule(FraudRule):
     """Phone seen at many lenders"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="consortium_phone_frequency",
             description="Phone at multiple lenders",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.consortium_matching:
             if transaction.network_features.consortium_matching.phone_seen_elsewhere:
                 count = context.get("phone_lender_count", 2)
                 if count > 3:
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"Phone at {count} other lenders")
+                    return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"Phone at {count} other lenders")
         return None
 
 class ConsortiumDeviceFrequencyRule(FraudRule):
     """Device seen at many institutions"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="consortium_device_frequency",
             description="Device at multiple institutions",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.consortium_matching:
             if transaction.network_features.consortium_matching.device_seen_elsewhere:
                 count = context.get("device_institution_count", 2)
                 if count > 5:
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"Device at {count} institutions")
+                    return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"Device at {count} institutions")
         return None
 
 class ConsortiumBVNFrequencyRule(FraudRule):
     """BVN seen with multiple identities"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="consortium_bvn_frequency",
             description="BVN linked to multiple accounts",
             base_score=35,
             severity="critical",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.consortium_matching:
             if transaction.network_features.consortium_matching.bvn_seen_elsewhere:
                 count = context.get("bvn_account_count", 2)
                 if count > 2:
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message=f"BVN linked to {count} accounts")
+                    return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message=f"BVN linked to {count} accounts")
         return None
 
 class NetworkVelocityEmailRule(FraudRule):
     """High velocity across email"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="network_velocity_email",
             description="High transaction velocity on email",
             base_score=26,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.velocity:
             velocity = transaction.network_features.velocity.velocity_email
             if velocity and velocity > 10:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Email velocity: {velocity} txns")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Email velocity: {velocity} txns")
         return None
 
 class NetworkVelocityPhoneRule(FraudRule):
     """High velocity across phone"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="network_velocity_phone",
             description="High transaction velocity on phone",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.velocity:
             velocity = transaction.network_features.velocity.velocity_phone
             if velocity and velocity > 10:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"Phone velocity: {velocity} txns")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"Phone velocity: {velocity} txns")
         return None
 
 class NetworkVelocityDeviceRule(FraudRule):
     """High velocity across device"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="network_velocity_device",
             description="High transaction velocity on device",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "crypto"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.velocity:
             velocity = transaction.network_features.velocity.velocity_device
             if velocity and velocity > 15:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"Device velocity: {velocity} txns")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"Device velocity: {velocity} txns")
         return None
 
 class NetworkVelocityIPRule(FraudRule):
     """High velocity across IP"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="network_velocity_ip",
             description="High transaction velocity on IP",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.velocity:
             velocity = transaction.network_features.velocity.velocity_ip
             if velocity and velocity > 20:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"IP velocity: {velocity} txns")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"IP velocity: {velocity} txns")
         return None
 
 class SameIPMultipleUsersRule(FraudRule):
     """Multiple users from same IP"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="same_ip_multiple_users",
             description="Multiple users on same IP",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.graph_analysis:
             count = transaction.network_features.graph_analysis.same_ip_multiple_users
             if count and count > 10:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"{count} users on same IP")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"{count} users on same IP")
         return None
 
 class SameDeviceMultipleUsersRule(FraudRule):
     """Multiple users on same device"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="same_device_multiple_users",
             description="Multiple users on same device",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "crypto"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.graph_analysis:
             count = transaction.network_features.graph_analysis.same_device_multiple_users
             if count and count > 5:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"{count} users on same device (loan stacking)")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"{count} users on same device (loan stacking)")
         return None
 
 class SameAddressMultipleUsersRule(FraudRule):
     """Multiple users at same address"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="same_address_multiple_users",
             description="Multiple users at same address",
             base_score=24,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.graph_analysis:
             count = transaction.network_features.graph_analysis.same_address_multiple_users
             if count and count > 10:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"{count} users at same address")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"{count} users at same address")
         return None
 
 class EmailFraudHistoryRule(FraudRule):
     """Email linked to confirmed fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="email_fraud_history",
             description="Email linked to fraud cases",
             base_score=35,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.fraud_linkage:
             if transaction.network_features.fraud_linkage.email_linked_to_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.95, message="Email linked to confirmed fraud")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.95, message="Email linked to confirmed fraud")
         return None
 
 class PhoneFraudHistoryRule(FraudRule):
     """Phone linked to confirmed fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="phone_fraud_history",
             description="Phone linked to fraud cases",
             base_score=34,
             severity="critical",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.fraud_linkage:
             if transaction.network_features.fraud_linkage.phone_linked_to_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.94, message="Phone linked to confirmed fraud")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.94, message="Phone linked to confirmed fraud")
         return None
 
 class DeviceFraudHistoryRule(FraudRule):
     """Device linked to confirmed fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="device_fraud_history",
             description="Device linked to fraud cases",
             base_score=36,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "crypto"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.fraud_linkage:
             if transaction.network_features.fraud_linkage.device_linked_to_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.96, message="Device linked to confirmed fraud")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.96, message="Device linked to confirmed fraud")
         return None
 
 class AddressFraudHistoryRule(FraudRule):
     """Address linked to confirmed fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="address_fraud_history",
             description="Address linked to fraud cases",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.fraud_linkage:
             if transaction.network_features.fraud_linkage.address_linked_to_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="Address linked to confirmed fraud")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="Address linked to confirmed fraud")
         return None
 
 class ConnectedAccountsDetectedRule(FraudRule):
     """Connected accounts detected via graph analysis"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="connected_accounts_detected",
             description="Connected accounts via graph analysis",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.graph_analysis:
             if transaction.network_features.graph_analysis.connected_accounts_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Connected accounts detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Connected accounts detected")
         return None
 
 # ============================================================================
@@ -2366,115 +2970,129 @@ class ConnectedAccountsDetectedRule(FraudRule):
 
 class FailedLoginVelocityATORule(FraudRule):
     """High failed login velocity (brute force)"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="failed_login_velocity_ato",
             description="High failed login velocity",
             base_score=34,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("ato_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ato_signals and transaction.ato_signals.classic_patterns:
             velocity = transaction.ato_signals.classic_patterns.failed_login_velocity
             if velocity and velocity > 10:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message=f"Failed login velocity: {velocity} attempts/min")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message=f"Failed login velocity: {velocity} attempts/min")
         return None
 
 class NewDeviceHighValueATORule(FraudRule):
     """New device with high-value transaction"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="new_device_high_value_ato",
             description="New device with large transaction",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("ato_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ato_signals and transaction.ato_signals.classic_patterns:
             if transaction.ato_signals.classic_patterns.new_device_high_value:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message="New device with high-value transaction")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message="New device with high-value transaction")
         return None
 
 class GeographicImpossibilityATORule(FraudRule):
     """Impossible travel pattern"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="geographic_impossibility_ato",
             description="Geographically impossible travel",
             base_score=35,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "betting", "crypto"]
+            verticals=("lending", "fintech", "payments", "betting", "crypto"),
+            required_fields=("ato_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ato_signals and transaction.ato_signals.classic_patterns:
             if transaction.ato_signals.classic_patterns.geographic_impossibility:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Geographically impossible travel detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Geographically impossible travel detected")
         return None
 
 class TypingPatternDeviationRule(FraudRule):
     """Typing pattern deviates from user baseline"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="typing_pattern_deviation",
             description="Typing pattern deviates from baseline",
             base_score=26,
             severity="high",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("ato_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ato_signals and transaction.ato_signals.behavioral_deviation:
             if transaction.ato_signals.behavioral_deviation.typing_pattern_deviation:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="Typing pattern deviates from baseline")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="Typing pattern deviates from baseline")
         return None
 
 class MouseMovementDeviationRule(FraudRule):
     """Mouse movement pattern deviates"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="mouse_movement_deviation",
             description="Mouse movement deviates from baseline",
             base_score=24,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("ato_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ato_signals and transaction.ato_signals.behavioral_deviation:
             if transaction.ato_signals.behavioral_deviation.mouse_movement_deviation:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Mouse movement deviates from baseline")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Mouse movement deviates from baseline")
         return None
 
 class TransactionPatternDeviationRule(FraudRule):
     """Transaction pattern deviates significantly"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="transaction_pattern_deviation",
             description="Transaction pattern deviates from baseline",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("ato_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ato_signals and transaction.ato_signals.behavioral_deviation:
             if transaction.ato_signals.behavioral_deviation.transaction_pattern_deviation:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Transaction pattern deviates from baseline")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Transaction pattern deviates from baseline")
         return None
 
 class TimeOfDayDeviationRule(FraudRule):
     """Transaction time deviates from user pattern"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="time_of_day_deviation",
             description="Transaction time pattern changed",
             base_score=22,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("ato_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ato_signals and transaction.ato_signals.behavioral_deviation:
             if transaction.ato_signals.behavioral_deviation.time_of_day_deviation:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Time of day pattern changed")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Time of day pattern changed")
         return None
 
 # ============================================================================
@@ -2483,99 +3101,111 @@ class TimeOfDayDeviationRule(FraudRule):
 
 class NewCardWithdrawalSameDayRule(FraudRule):
     """Card added and withdrawn same day"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="new_card_withdrawal_same_day",
             description="Card added and withdrawn same day",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("funding_fraud_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.funding_fraud_signals and transaction.funding_fraud_signals.new_sources:
             if transaction.funding_fraud_signals.new_sources.card_added_withdrew_same_day:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Card added and withdrawn same day")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Card added and withdrawn same day")
         return None
 
 class BINAttackPatternRule(FraudRule):
     """BIN attack pattern detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="bin_attack_pattern",
             description="BIN testing attack detected",
             base_score=30,
             severity="high",
-            verticals=["ecommerce", "payments"]
+            verticals=("ecommerce", "payments"),
+            required_fields=("funding_fraud_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.funding_fraud_signals and transaction.funding_fraud_signals.card_testing:
             if transaction.funding_fraud_signals.card_testing.bin_attack_pattern:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="BIN attack pattern detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="BIN attack pattern detected")
         return None
 
 class DollarOneAuthorizationRule(FraudRule):
     """$1 test authorizations detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="dollar_one_authorization",
             description="Multiple $1 test authorizations",
             base_score=28,
             severity="high",
-            verticals=["ecommerce", "payments"]
+            verticals=("ecommerce", "payments"),
+            required_fields=("funding_fraud_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.funding_fraud_signals and transaction.funding_fraud_signals.card_testing:
             count = transaction.funding_fraud_signals.card_testing.dollar_one_authorizations
             if count and count > 3:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"$1 test auths: {count}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"$1 test auths: {count}")
         return None
 
 class SmallFailsLargeSuccessRule(FraudRule):
     """Small failed transactions followed by large successful"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="small_fails_large_success",
             description="Small fails then large success pattern",
             base_score=29,
             severity="high",
-            verticals=["ecommerce", "payments"]
+            verticals=("ecommerce", "payments"),
+            required_fields=("funding_fraud_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.funding_fraud_signals and transaction.funding_fraud_signals.card_testing:
             if transaction.funding_fraud_signals.card_testing.small_fails_large_success:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.84, message="Small fails then large success pattern")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.84, message="Small fails then large success pattern")
         return None
 
 class MultipleSourcesAddedQuicklyRule(FraudRule):
     """Multiple funding sources added rapidly"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="multiple_sources_added_quickly",
             description="Multiple funding sources added rapidly",
             base_score=26,
             severity="high",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("funding_fraud_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.funding_fraud_signals and transaction.funding_fraud_signals.new_sources:
             if transaction.funding_fraud_signals.new_sources.multiple_sources_added_quickly:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="Multiple funding sources added rapidly")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="Multiple funding sources added rapidly")
         return None
 
 class HighRiskCountryFundingRule(FraudRule):
     """Funding from high-risk country"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="high_risk_country_funding",
             description="Funding source from high-risk country",
             base_score=24,
             severity="medium",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("funding_fraud_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.funding_fraud_signals and transaction.funding_fraud_signals.new_sources:
             if transaction.funding_fraud_signals.new_sources.funding_source_high_risk_country:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Funding from high-risk country")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Funding from high-risk country")
         return None
 
 # ============================================================================
@@ -2584,98 +3214,110 @@ class HighRiskCountryFundingRule(FraudRule):
 
 class RefundAbuseDetectedRule(FraudRule):
     """Refund abuse pattern detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="refund_abuse_detected",
             description="Refund abuse pattern",
             base_score=26,
             severity="high",
-            verticals=["ecommerce", "marketplace"]
+            verticals=ECOM_VERTICALS,
+            required_fields=("merchant_abuse_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.merchant_abuse_signals and transaction.merchant_abuse_signals.abuse_patterns:
             if transaction.merchant_abuse_signals.abuse_patterns.refund_abuse_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Refund abuse pattern detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Refund abuse pattern detected")
         return None
 
 class CashbackAbuseDetectedRule(FraudRule):
     """Cashback abuse pattern detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="cashback_abuse_detected",
             description="Cashback abuse pattern",
             base_score=23,
             severity="medium",
-            verticals=["ecommerce", "payments"]
+            verticals=("ecommerce", "payments"),
+            required_fields=("merchant_abuse_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.merchant_abuse_signals and transaction.merchant_abuse_signals.abuse_patterns:
             if transaction.merchant_abuse_signals.abuse_patterns.cashback_abuse_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Cashback abuse pattern detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Cashback abuse pattern detected")
         return None
 
 class PromoAbuseDetectedRule(FraudRule):
     """Promotion abuse pattern detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="promo_abuse_detected",
             description="Promo abuse pattern",
             base_score=22,
             severity="medium",
-            verticals=["ecommerce", "betting", "payments"]
+            verticals=("ecommerce", "betting", "payments"),
+            required_fields=("merchant_abuse_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.merchant_abuse_signals and transaction.merchant_abuse_signals.abuse_patterns:
             if transaction.merchant_abuse_signals.abuse_patterns.promo_abuse_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Promotion abuse pattern detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Promotion abuse pattern detected")
         return None
 
 class LoyaltyPointsAbuseRule(FraudRule):
     """Loyalty points abuse detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="loyalty_points_abuse",
             description="Loyalty points abuse pattern",
             base_score=20,
             severity="medium",
-            verticals=["ecommerce", "betting"]
+            verticals=("ecommerce", "betting"),
+            required_fields=("merchant_abuse_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.merchant_abuse_signals and transaction.merchant_abuse_signals.abuse_patterns:
             if transaction.merchant_abuse_signals.abuse_patterns.loyalty_points_abuse:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Loyalty points abuse detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Loyalty points abuse detected")
         return None
 
 class ReferralFraudRule(FraudRule):
     """Referral fraud detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="referral_fraud",
             description="Referral fraud pattern",
             base_score=24,
             severity="medium",
-            verticals=["fintech", "betting", "ecommerce"]
+            verticals=("fintech", "betting", "ecommerce"),
+            required_fields=("merchant_abuse_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.merchant_abuse_signals and transaction.merchant_abuse_signals.abuse_patterns:
             if transaction.merchant_abuse_signals.abuse_patterns.referral_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.74, message="Referral fraud detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.74, message="Referral fraud detected")
         return None
 
 class FakeMerchantTransactionsRule(FraudRule):
     """Fake merchant transactions detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="fake_merchant_transactions",
             description="Fake merchant transactions",
             base_score=28,
             severity="high",
-            verticals=["ecommerce", "payments"]
+            verticals=("ecommerce", "payments"),
+            required_fields=("merchant_abuse_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.merchant_abuse_signals and transaction.merchant_abuse_signals.abuse_patterns:
             if transaction.merchant_abuse_signals.abuse_patterns.fake_merchant_transactions:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message="Fake merchant transactions detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message="Fake merchant transactions detected")
         return None
 
 # ============================================================================
@@ -2684,64 +3326,72 @@ class FakeMerchantTransactionsRule(FraudRule):
 
 class OutlierScoreHighRule(FraudRule):
     """High statistical outlier score"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="outlier_score_high",
             description="High statistical outlier score",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("ml_derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ml_derived_features and transaction.ml_derived_features.statistical_outliers:
             score = transaction.ml_derived_features.statistical_outliers.outlier_score
             if score and score > 0.8:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"Outlier score: {score:.2f}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message=f"Outlier score: {score:.2f}")
         return None
 
 class XGBoostHighRiskRule(FraudRule):
     """XGBoost model predicts high risk"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="xgboost_high_risk",
             description="XGBoost model high risk prediction",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto"),
+            required_fields=("ml_derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ml_derived_features and transaction.ml_derived_features.model_scores:
             score = transaction.ml_derived_features.model_scores.xgboost_risk_score
             if score and score > 0.75:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"XGBoost risk: {score:.2f}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"XGBoost risk: {score:.2f}")
         return None
 
 class NeuralNetworkHighRiskRule(FraudRule):
     """Neural network predicts high risk"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="neural_network_high_risk",
             description="Neural network high risk prediction",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("ml_derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ml_derived_features and transaction.ml_derived_features.model_scores:
             score = transaction.ml_derived_features.model_scores.neural_network_score
             if score and score > 0.75:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.83, message=f"NN risk: {score:.2f}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.83, message=f"NN risk: {score:.2f}")
         return None
 
 class EnsembleModelConsensusRule(FraudRule):
     """Multiple ML models agree on high risk"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="ensemble_consensus",
             description="Ensemble models agree on high risk",
             base_score=38,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto"),
+            required_fields=("ml_derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ml_derived_features and transaction.ml_derived_features.model_scores:
@@ -2749,41 +3399,45 @@ class EnsembleModelConsensusRule(FraudRule):
             nn = transaction.ml_derived_features.model_scores.neural_network_score or 0
             rf = transaction.ml_derived_features.model_scores.random_forest_score or 0
             if xgb > 0.7 and nn > 0.7 and rf > 0.7:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="All ML models predict fraud")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="All ML models predict fraud")
         return None
 
 class LSTMSequenceAnomalyRule(FraudRule):
     """LSTM sequence model detects anomaly"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="lstm_sequence_anomaly",
             description="LSTM sequence anomaly detected",
             base_score=26,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("ml_derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ml_derived_features and transaction.ml_derived_features.deep_learning:
             score = transaction.ml_derived_features.deep_learning.lstm_sequence_prediction
             if score and score > 0.8:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"LSTM anomaly: {score:.2f}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"LSTM anomaly: {score:.2f}")
         return None
 
 class GNNGraphAnomalyRule(FraudRule):
     """Graph Neural Network detects anomaly"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="gnn_graph_anomaly",
             description="GNN graph anomaly detected",
             base_score=31,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "crypto"),
+            required_fields=("ml_derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ml_derived_features and transaction.ml_derived_features.deep_learning:
             score = transaction.ml_derived_features.deep_learning.gnn_graph_score
             if score and score > 0.75:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.83, message=f"GNN anomaly: {score:.2f}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.83, message=f"GNN anomaly: {score:.2f}")
         return None
 
 # ============================================================================
@@ -2792,143 +3446,182 @@ class GNNGraphAnomalyRule(FraudRule):
 
 class FraudsterProfileMatchRule(FraudRule):
     """Profile matches known fraudster"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="fraudster_profile_match",
             description="Profile matches known fraudster",
             base_score=38,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.derived_features and transaction.derived_features.similarity:
             similarity = transaction.derived_features.similarity.fraudster_profile_similarity
             if similarity and similarity > 0.85:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message=f"Fraudster match: {similarity:.2f}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message=f"Fraudster match: {similarity:.2f}")
         return None
 
 class EmailSimilarityHighRule(FraudRule):
     """Email similar to known fraud case"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="email_similarity_high",
             description="Email similar to fraud cases",
             base_score=26,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.derived_features and transaction.derived_features.similarity:
             similarity = transaction.derived_features.similarity.email_similarity
             if similarity and similarity > 0.8:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message=f"Email similarity: {similarity:.2f}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message=f"Email similarity: {similarity:.2f}")
         return None
 
 class BehaviorSimilarityHighRule(FraudRule):
     """Behavior similar to known fraudster"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="behavior_similarity_high",
             description="Behavior similar to fraud cases",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.derived_features and transaction.derived_features.similarity:
             similarity = transaction.derived_features.similarity.behavior_similarity
             if similarity and similarity > 0.8:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Behavior similarity: {similarity:.2f}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Behavior similarity: {similarity:.2f}")
         return None
 
 class FamilyConnectionDetectedRule(FraudRule):
     """Family connections detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="family_connection_detected",
             description="Family connections detected",
             base_score=24,
             severity="medium",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.derived_features and transaction.derived_features.clustering:
             if transaction.derived_features.clustering.family_connections_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Family connections detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Family connections detected")
         return None
 
 class BusinessConnectionDetectedRule(FraudRule):
     """Business connections detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="business_connection_detected",
             description="Business connections detected",
             base_score=22,
             severity="medium",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            required_fields=("derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.derived_features and transaction.derived_features.clustering:
             if transaction.derived_features.clustering.business_connections_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Business connections detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Business connections detected")
         return None
 
 class GeographicConnectionDetectedRule(FraudRule):
     """Geographic connections detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="geographic_connection_detected",
             description="Geographic connections detected",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce"]
+            verticals=("lending", "fintech", "payments", "ecommerce"),
+            required_fields=("derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.derived_features and transaction.derived_features.clustering:
             if transaction.derived_features.clustering.geographic_connections_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message="Geographic connections detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message="Geographic connections detected")
         return None
 
 class FraudProbabilityHighRule(FraudRule):
     """Aggregate fraud probability very high"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="fraud_probability_high",
             description="Fraud probability very high",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.derived_features and transaction.derived_features.aggregate_risk:
             prob = transaction.derived_features.aggregate_risk.fraud_probability
             if prob and prob > 0.9:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.95, message=f"Fraud probability: {prob:.1%}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.95, message=f"Fraud probability: {prob:.1%}")
         return None
 
 class RuleViolationCountHighRule(FraudRule):
     """Many rules triggered"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="rule_violation_count_high",
             description="Many fraud rules triggered",
             base_score=35,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto"),
+            required_fields=("derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.derived_features and transaction.derived_features.aggregate_risk:
             count = transaction.derived_features.aggregate_risk.rule_violations_count
             if count and count > 15:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message=f"{count} fraud rules triggered")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message=f"{count} fraud rules triggered")
         return None
 
 
 class FraudRulesEngine:
     """Main fraud detection rules engine"""
 
-    def __init__(self):
-        """Initialize all fraud detection rules"""
+    def __init__(
+        self,
+        early_exit_threshold: Optional[int] = MAX_RISK_SCORE,
+        rule_timer: Optional[Callable[[str, int], None]] = None,
+        compile_dispatch: bool = True,
+    ):
+        """
+        Initialize all fraud detection rules
+
+        Args:
+            early_exit_threshold: Stop evaluating once the cumulative flag score
+                reaches this value. Defaults to the score cap, so the returned
+                score/level/decision are unchanged; None evaluates every rule.
+            rule_timer: Optional callback(rule_name, elapsed_ns) invoked after
+                every rule check, for profiling per-rule cost (e.g.
+                monitoring.record_rule_timing). None skips the timing calls.
+            compile_dispatch: Run each vertical's rules through a generated
+                straight-line function (compile_rule_dispatch) instead of the
+                interpreted loop. Results are identical; set False to debug
+                with the plain loop. Ignored while rule_timer is set.
+        """
+        self.early_exit_threshold = early_exit_threshold
+        self.rule_timer = rule_timer
+        self.compile_dispatch = compile_dispatch
+
         # Core/Lending rules (Rules 1-15)
         self.rules: List[FraudRule] = [
             NewAccountLargeAmountRule(),
@@ -3167,6 +3860,32 @@ class FraudRulesEngine:
             HighConfidenceFraudRule(),
         ]
 
+        self.index_rules()
+
+    def index_rules(self) -> None:
+        """
+        Rebuild the per-vertical dispatch index
+
+        Called once at startup; call again after changing self.rules.
+        self.rules itself keeps declaration order.
+        """
+        # Run high-severity, high-score rules first so early exit skips the tail
+        run_order = sorted(self.rules, key=lambda rule: (-SEVERITY_PRIORITY.get(rule.severity, 0), -rule.base_score))
+
+        # Precompute the applicable rules per vertical so evaluate() never
+        # visits a rule that can't apply
+        self.rules_by_vertical: Dict[str, tuple] = {
+            vertical: tuple(rule for rule in run_order if rule.vertical_mask & bit)
+            for vertical, bit in VERTICAL_BIT.items()
+        }
+        # Compiled per vertical on first use, so engines built only to inspect
+        # rules never pay for code generation
+        self.dispatch_by_vertical: Dict[str, Callable] = {}
+        # First declared rule wins on a duplicate name, matching a scan of self.rules
+        self.rules_by_name: Dict[str, FraudRule] = {}
+        for rule in self.rules:
+            self.rules_by_name.setdefault(rule.name, rule)
+
     def get_rules_for_vertical(self, industry: str) -> List[FraudRule]:
         """
         Get all fraud rules that apply to a specific industry vertical
@@ -3177,13 +3896,14 @@ class FraudRulesEngine:
         Returns:
             List of rules applicable to this vertical
         """
-        return [rule for rule in self.rules if rule.applies_to_vertical(industry)]
+        return list(self.rules_by_vertical.get(industry, ()))
 
     def evaluate(
         self,
         transaction: TransactionCheckRequest,
         context: Dict[str, Any],
-        industry: str = None
+        industry: str = None,
+        mode: str = "score_gate"
     ) -> tuple[int, str, str, List[FraudFlag]]:
         """
         Evaluate fraud detection rules for a specific industry vertical
@@ -3192,48 +3912,71 @@ class FraudRulesEngine:
             transaction: Transaction data
             context: Additional context (consortium data, velocity data, etc.)
             industry: Industry vertical (e.g., "lending", "crypto"). If None, uses transaction.industry
+            mode: How far to evaluate (rules run critical-first):
+                - "score_gate": stop once the score reaches early_exit_threshold (default).
+                  The score and decision are exact, but flags that would fire after
+                  the cap are not returned, so the list is not a full explanation
+                - "any_critical": also stop at the first critical flag, for callers
+                  that only need to know whether to block
+                - "full": run every applicable rule
 
         Returns:
             Tuple of (risk_score, risk_level, decision, flags)
         """
+        if mode not in EVALUATE_MODES:
+            raise ValueError(f"Unknown evaluate mode: {mode}")
+
         # Use transaction's industry if not specified
         if industry is None:
-            industry = str(transaction.industry) if hasattr(transaction.industry, 'value') else transaction.industry
+            industry = getattr(transaction.industry, "value", transaction.industry)
 
         flags: List[FraudFlag] = []
 
         # Get rules for this vertical only
-        applicable_rules = self.get_rules_for_vertical(industry)
-
-        # Run vertical-specific rules
-        for rule in applicable_rules:
-            flag = rule.check(transaction, context)
-            if flag:
-                flags.append(flag)
-
-        # Calculate total risk score
-        total_score = sum(flag.score for flag in flags)
-        risk_score = min(total_score, 100)  # Cap at 100
+        applicable_rules = self.rules_by_vertical.get(industry, ())
+
+        # Run vertical-specific rules, accumulating the score as flags fire
+        early_exit_threshold = None if mode == "full" else self.early_exit_threshold
+        stop_on_critical = mode == "any_critical"
+        rule_timer = self.rule_timer
+        dispatch = None
+        if self.compile_dispatch and rule_timer is None and industry in self.rules_by_vertical:
+            dispatch = self.dispatch_by_vertical.get(industry)
+            if dispatch is None:
+                dispatch = self.dispatch_by_vertical[industry] = compile_rule_dispatch(applicable_rules)
+
+        if dispatch is not None:
+            limit = early_exit_threshold if early_exit_threshold is not None else float("inf")
+            total_score = dispatch(transaction, context, flags, limit, stop_on_critical)
+        else:
+            total_score = 0
+            for rule in applicable_rules:
+                if rule.required_context_keys and rule.required_context_keys.isdisjoint(context):
+                    continue
+                if rule_timer is None:
+                    flag = rule.check(transaction, context)
+                else:
+                    start = perf_counter_ns()
+                    flag = rule.check(transaction, context)
+                    rule_timer(rule.name, perf_counter_ns() - start)
+                if flag is not None:
+                    flags.append(flag)
+                    total_score += flag.score
+                    if early_exit_threshold is not None and total_score >= early_exit_threshold:
+                        break
+                    if stop_on_critical and flag.severity == "critical":
+                        break
+
+        risk_score = min(total_score, MAX_RISK_SCORE)  # Cap at 100
 
         # Determine risk level and decision
-        if risk_score >= 70:
-            risk_level = "high"
-            decision = "decline"
-        elif risk_score >= 40:
-            risk_level = "medium"
-            decision = "review"
-        else:
-            risk_level = "low"
-            decision = "approve"
+        risk_level, decision = RISK_LEVEL_TABLE[int(risk_score) // 10]
 
         return risk_score, risk_level, decision, flags
 
     def get_rule_by_name(self, name: str) -> Optional[FraudRule]:
         """Get a specific rule by name"""
-        for rule in self.rules:
-            if rule.name == name:
-                return rule
-        return None
+        return self.rules_by_name.get(name)
 
     def get_all_rule_names(self) -> List[str]:
         """Get all rule names"""
@@ -3246,6 +3989,7 @@ class FraudRulesEngine:
 
 class EmailDomainAgeRule(FraudRule):
     """Rule 30: Email Domain Age - Newly created email domains"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -3253,13 +3997,14 @@ class EmailDomainAgeRule(FraudRule):
             description="Email from newly created domain",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("email_domain_age_days",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.email_domain_age_days is not None:
             if transaction.email_domain_age_days < 30:  # Less than 30 days old
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"Email domain only {transaction.email_domain_age_days} days old",
@@ -3269,8 +4014,9 @@ class EmailDomainAgeRule(FraudRule):
         return None
 
 
-class SuspiciousIPReputationRule(FraudRule):
+class SuspiciousIPReputationRule(ThresholdRule):
     """Rule 31: IP Reputation - Poor IP reputation score"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -3278,24 +4024,18 @@ class SuspiciousIPReputationRule(FraudRule):
             description="IP address with poor reputation",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="ip_reputation_score",
+            op=lt,
+            threshold=30,  # Low reputation (0-30)
+            confidence=0.88,
+            message="IP reputation score {value}/100 - high risk"
         )
 
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.ip_reputation_score is not None:
-            if transaction.ip_reputation_score < 30:  # Low reputation (0-30)
-                return FraudFlag(
-                    type=self.name,
-                    severity=self.severity,
-                    message=f"IP reputation score {transaction.ip_reputation_score}/100 - high risk",
-                    score=self.base_score,
-                    confidence=0.88
-                )
-        return None
-
 
 class ExcessiveFailedLoginsRule(FraudRule):
     """Rule 32: Excessive Failed Logins - Account takeover indicator"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -3303,12 +4043,12 @@ class ExcessiveFailedLoginsRule(FraudRule):
             description="Too many failed login attempts",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.failed_login_count_24h and transaction.failed_login_count_24h >= 5:
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"{transaction.failed_login_count_24h} failed logins in 24h - possible account takeover",
@@ -3316,7 +4056,7 @@ class ExcessiveFailedLoginsRule(FraudRule):
                 confidence=0.92
             )
         if transaction.failed_login_count_7d and transaction.failed_login_count_7d >= 10:
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"{transaction.failed_login_count_7d} failed logins in 7 days",
@@ -3328,6 +4068,7 @@ class ExcessiveFailedLoginsRule(FraudRule):
 
 class UnusualTransactionTimeRule(FraudRule):
     """Rule 33: Unusual Transaction Time - Outside normal user hours"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -3335,13 +4076,14 @@ class UnusualTransactionTimeRule(FraudRule):
             description="Transaction at unusual time for user",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("is_unusual_time",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.is_unusual_time:
             hour = transaction.transaction_hour or 0
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"Transaction at {hour:02d}:00 - unusual time for user",
@@ -3353,6 +4095,7 @@ class UnusualTransactionTimeRule(FraudRule):
 
 class FirstTransactionAmountRule(FraudRule):
     """Rule 34: First Transaction Amount - Suspiciously large first transaction"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -3360,7 +4103,8 @@ class FirstTransactionAmountRule(FraudRule):
             description="First transaction amount unusually large",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("first_transaction_amount",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
@@ -3370,7 +4114,7 @@ class FirstTransactionAmountRule(FraudRule):
                 if avg_transaction > 0:
                     ratio = transaction.first_transaction_amount / avg_transaction
                     if ratio > 5:  # First transaction 5x larger than user's average
-                        return FraudFlag(
+                        return make_flag(
                             type=self.name,
                             severity=self.severity,
                             message=f"First transaction ₦{transaction.first_transaction_amount:,.0f} - {ratio:.1f}x user average",
@@ -3380,8 +4124,9 @@ class FirstTransactionAmountRule(FraudRule):
         return None
 
 
-class CardBINReputationRule(FraudRule):
+class CardBINReputationRule(ThresholdRule):
     """Rule 35: Card BIN Reputation - Card from suspicious BIN"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -3389,24 +4134,18 @@ class CardBINReputationRule(FraudRule):
             description="Card BIN with poor reputation",
             base_score=30,
             severity="high",
-            verticals=["ecommerce", "fintech", "payments"]
+            verticals=("ecommerce", "fintech", "payments"),
+            attr="card_bin_reputation_score",
+            op=lt,
+            threshold=25,  # Very poor reputation
+            confidence=0.87,
+            message="Card BIN reputation {value}/100 - known fraud BIN"
         )
 
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.card_bin_reputation_score is not None:
-            if transaction.card_bin_reputation_score < 25:  # Very poor reputation
-                return FraudFlag(
-                    type=self.name,
-                    severity=self.severity,
-                    message=f"Card BIN reputation {transaction.card_bin_reputation_score}/100 - known fraud BIN",
-                    score=self.base_score,
-                    confidence=0.87
-                )
-        return None
-
 
 class UnverifiedPhoneRule(FraudRule):
     """Rule 36: Unverified Phone - Transaction from unverified phone"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -3414,13 +4153,13 @@ class UnverifiedPhoneRule(FraudRule):
             description="Transaction from unverified phone number",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if not transaction.phone_verified:
             if transaction.amount > 100000:  # Large transaction from unverified phone
-                return FraudFlag(
+                return make_flag(
                     type=self.name,
                     severity=self.severity,
                     message=f"₦{transaction.amount:,.0f} transaction from unverified phone number",
@@ -3432,6 +4171,7 @@ class UnverifiedPhoneRule(FraudRule):
 
 class MultipleDevicesSameUserRule(FraudRule):
     """Rule 37: Multiple Devices Same User - Many devices for one user"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -3439,7 +4179,7 @@ class MultipleDevicesSameUserRule(FraudRule):
             description="Multiple devices used by same user",
             base_score=20,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
@@ -3447,7 +4187,7 @@ class MultipleDevicesSameUserRule(FraudRule):
         unique_devices = device_history.get("unique_device_count", 1)
 
         if unique_devices >= 7:  # 7+ different devices
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"User has used {unique_devices} different devices - possible multi-accounting",
@@ -3459,6 +4199,7 @@ class MultipleDevicesSameUserRule(FraudRule):
 
 class QuickSignupTransactionRule(FraudRule):
     """Rule 38: Quick Signup Transaction - Transaction shortly after signup"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -3466,14 +4207,15 @@ class QuickSignupTransactionRule(FraudRule):
             description="Large transaction shortly after account creation",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("days_since_signup",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.days_since_signup is not None:
             if transaction.days_since_signup < 1:  # Transaction within 24 hours of signup
                 if transaction.amount > 100000:
-                    return FraudFlag(
+                    return make_flag(
                         type=self.name,
                         severity=self.severity,
                         message=f"₦{transaction.amount:,.0f} transaction {transaction.days_since_signup} days after signup",
@@ -3485,6 +4227,7 @@ class QuickSignupTransactionRule(FraudRule):
 
 class OSInconsistencyRule(FraudRule):
     """Rule 39: OS/Platform Inconsistency - Different OS than usual"""
+    __slots__ = ()
 
     def __init__(self):
         super().__init__(
@@ -3492,12 +4235,13 @@ class OSInconsistencyRule(FraudRule):
             description="Transaction from different OS/platform than usual",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("platform_os",)
         )
 
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.platform_os and not transaction.platform_os_consistent:
-            return FraudFlag(
+            return make_flag(
                 type=self.name,
                 severity=self.severity,
                 message=f"Transaction from {transaction.platform_os} - inconsistent with user history",
@@ -3513,249 +4257,307 @@ class OSInconsistencyRule(FraudRule):
 
 class BrowserFingerprintConsistencyRule(FraudRule):
     """Rule 40: Browser Fingerprint Consistency"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="browser_fingerprint_consistency",
             description="Inconsistent browser fingerprint",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_context_keys=("previous_canvas_fingerprint",),
+            required_fields=("webgl_fingerprint",)
         )
+        self._flag_template = self.flag_template(confidence=0.78, message="Browser fingerprint changed")
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.canvas_fingerprint and transaction.webgl_fingerprint:
-            if context.get("previous_canvas_fingerprint") and context.get("previous_canvas_fingerprint") != transaction.canvas_fingerprint:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="Browser fingerprint changed")
+        if transaction.webgl_fingerprint:
+            if changed_since_last(transaction.canvas_fingerprint, context, "previous_canvas_fingerprint"):
+                return self._flag_template
         return None
 
 class ScreenResolutionAnomalyRule(FraudRule):
     """Rule 41: Screen Resolution Anomaly"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="screen_resolution_anomaly",
             description="Unusual screen resolution",
             base_score=15,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_context_keys=("previous_screen_resolution",)
         )
+        self._flag_template = self.flag_template(confidence=0.65, message="Screen resolution changed")
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.screen_resolution and context.get("previous_screen_resolution") and context.get("previous_screen_resolution") != transaction.screen_resolution:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message="Screen resolution changed")
+        if changed_since_last(transaction.screen_resolution, context, "previous_screen_resolution"):
+            return self._flag_template
         return None
 
+# Timezone hop (in minutes) that counts as suspicious: more than 8 hours
+_TZ_THRESHOLD: Final[int] = 480
+
 class TimezoneHoppingRule(FraudRule):
     """Rule 42: Timezone Hopping"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="timezone_hopping",
             description="Rapid timezone changes",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_context_keys=("previous_timezone_offset",)
         )
+        self._flag_template = self.flag_template(confidence=0.81, message="Rapid timezone change detected")
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.timezone_offset and context.get("previous_timezone_offset"):
-            tz_diff = abs(transaction.timezone_offset - context.get("previous_timezone_offset", 0))
-            if tz_diff > 480:  # More than 8 hours
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.81, message="Rapid timezone change detected")
+        offset = transaction.timezone_offset
+        previous_offset = context.get("previous_timezone_offset")
+        if offset is not None and previous_offset is not None:
+            tz_diff = offset - previous_offset
+            if tz_diff > _TZ_THRESHOLD or tz_diff < -_TZ_THRESHOLD:  # More than 8 hours either way
+                return self._flag_template
         return None
 
 class RobotSessionDetectionRule(FraudRule):
     """Rule 43: Robot Session Detection"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="robot_session_detection",
             description="Likely bot session",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS
         )
+        self._flag_template = self.flag_template(confidence=0.89, message="Bot-like behavior detected")
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.session_duration_seconds and transaction.session_duration_seconds < 5:
-            if transaction.mouse_movement_score and transaction.mouse_movement_score < 20:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.89, message="Bot-like behavior detected")
+        if (duration := transaction.session_duration_seconds) is not None and duration < 5:
+            if (mouse_score := transaction.mouse_movement_score) is not None and mouse_score < 20:
+                return self._flag_template
         return None
 
 class SuspiciousTypingPatternRule(FraudRule):
     """Rule 44: Suspicious Typing Pattern"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="suspicious_typing_pattern",
             description="Abnormal typing speed",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS
         )
+        self._flag_template = self.flag_template(confidence=0.72, message="Unusual typing speed")
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.typing_speed_wpm and (transaction.typing_speed_wpm < 10 or transaction.typing_speed_wpm > 150):
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Unusual typing speed")
+        if (wpm := transaction.typing_speed_wpm) is not None and (wpm < 10 or wpm > 150):
+            return self._flag_template
         return None
 
-class ExcessiveCopyPasteRule(FraudRule):
+class ExcessiveCopyPasteRule(ThresholdRule):
     """Rule 45: Excessive Copy/Paste"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="excessive_copy_paste",
             description="Excessive copy/paste actions",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="copy_paste_count",
+            op=gt,
+            threshold=10,
+            confidence=0.70,
+            message="Excessive copy/paste detected"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.copy_paste_count and transaction.copy_paste_count > 10:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Excessive copy/paste detected")
-        return None
 
 class UnverifiedSocialMediaRule(FraudRule):
     """Rule 46: Unverified Social Media"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="unverified_social_media",
             description="Social media not verified",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS
         )
+        self._flag_template = self.flag_template(confidence=0.68, message="Large transaction without social verification")
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if not transaction.social_media_verified and transaction.amount > 200000:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Large transaction without social verification")
+            return self._flag_template
         return None
 
-class NewSocialMediaAccountRule(FraudRule):
+class NewSocialMediaAccountRule(ThresholdRule):
     """Rule 47: New Social Media Account"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="new_social_media_account",
             description="Very new social media account",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            attr="social_media_age_days",
+            op=lt,
+            threshold=30,
+            confidence=0.75,
+            message="Social account less than 30 days old"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.social_media_age_days and transaction.social_media_age_days < 30:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Social account less than 30 days old")
-        return None
 
 class UnverifiedAddressRule(FraudRule):
     """Rule 48: Unverified Address"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="unverified_address",
             description="Address not verified",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "marketplace"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "marketplace")
         )
+        self._flag_template = self.flag_template(confidence=0.71, message="Unverified address with large transaction")
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if not transaction.address_verified and transaction.amount > 300000:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.71, message="Unverified address with large transaction")
+            return self._flag_template
         return None
 
-class ShippingBillingDistanceRule(FraudRule):
+class ShippingBillingDistanceRule(ThresholdRule):
     """Rule 49: Large Shipping/Billing Distance"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="shipping_billing_distance",
             description="Shipping far from billing",
             base_score=22,
             severity="medium",
-            verticals=["ecommerce", "marketplace"]
+            verticals=ECOM_VERTICALS,
+            attr="shipping_distance_km",
+            op=gt,
+            threshold=500,
+            confidence=0.70,
+            message="Shipping {value}km from billing"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.shipping_distance_km and transaction.shipping_distance_km > 500:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"Shipping {transaction.shipping_distance_km}km from billing")
-        return None
 
-class UnusualTransactionFrequencyRule(FraudRule):
+class UnusualTransactionFrequencyRule(ThresholdRule):
     """Rule 50: Unusual Transaction Frequency"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="unusual_transaction_frequency",
             description="Abnormal transaction frequency",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="transaction_frequency_per_day",
+            op=gt,
+            threshold=20,
+            confidence=0.73,
+            message="High frequency: {value:.1f} txns/day"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.transaction_frequency_per_day and transaction.transaction_frequency_per_day > 20:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.73, message=f"High frequency: {transaction.transaction_frequency_per_day:.1f} txns/day")
-        return None
 
 class AmountAnomalyRule(FraudRule):
     """Rule 51: Amount Anomaly"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="amount_anomaly",
             description="Amount far from average",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.avg_transaction_amount and transaction.avg_transaction_amount > 0:
-            ratio = transaction.amount / transaction.avg_transaction_amount
-            if ratio > 10 or ratio < 0.1:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.74, message=f"Amount {ratio:.1f}x average")
+        if (avg := transaction.avg_transaction_amount) is not None and avg > 0:
+            # Compare against scaled average; divide only when the rule fires
+            amount = transaction.amount
+            if amount > 10 * avg or amount * 10 < avg:
+                ratio = amount / avg
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.74, message=f"Amount {ratio:.1f}x average")
         return None
 
 class ChargebackHistoryRule(FraudRule):
     """Rule 52: Chargeback History"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="chargeback_history",
             description="User with chargeback history",
             base_score=30,
             severity="high",
-            verticals=["ecommerce", "fintech", "payments", "marketplace"]
+            verticals=("ecommerce", "fintech", "payments", "marketplace")
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.chargeback_history_count and transaction.chargeback_history_count > 0:
-            return FraudFlag(type=self.name, severity=self.severity, score=15 + (transaction.chargeback_history_count * 5), confidence=0.86, message=f"{transaction.chargeback_history_count} chargebacks")
+        if (count := transaction.chargeback_history_count) is not None and count > 0:
+            return make_flag(type=self.name, severity=self.severity, score=min(15 + (count * 5), MAX_RISK_SCORE), confidence=0.86, message=f"{count} chargebacks")
         return None
 
-class RefundAbusePatternRule(FraudRule):
+class RefundAbusePatternRule(ThresholdRule):
     """Rule 53: Refund Abuse Pattern"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="refund_abuse_pattern",
             description="Pattern of refunds",
             base_score=28,
             severity="high",
-            verticals=["ecommerce", "fintech", "payments", "marketplace"]
+            verticals=("ecommerce", "fintech", "payments", "marketplace"),
+            attr="refund_history_count",
+            op=gt,
+            threshold=5,
+            confidence=0.84,
+            message="{value} refunds on record"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.refund_history_count and transaction.refund_history_count > 5:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.84, message=f"{transaction.refund_history_count} refunds on record")
-        return None
 
 class HolidayWeekendTransactionRule(FraudRule):
     """Rule 54: Holiday/Weekend Anomaly"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="holiday_weekend_transaction",
             description="Large transaction on holiday/weekend",
             base_score=15,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            required_fields=("holiday_weekend_transaction",)
         )
+        self._flag_template = self.flag_template(confidence=0.68, message="Large transaction on holiday/weekend")
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.holiday_weekend_transaction and transaction.amount > 500000:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Large transaction on holiday/weekend")
+            return self._flag_template
         return None
 
 class BrowserConsistencyRule(FraudRule):
     """Rule 55: Browser Consistency Check"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="browser_consistency",
             description="Inconsistent browser profile",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_context_keys=("previous_browser_fonts_hash",)
         )
+        self._flag_template = self.flag_template(confidence=0.72, message="Browser profile changed")
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.browser_fonts_hash and context.get("previous_browser_fonts_hash"):
-            if context.get("previous_browser_fonts_hash") != transaction.browser_fonts_hash:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Browser profile changed")
+        if changed_since_last(transaction.browser_fonts_hash, context, "previous_browser_fonts_hash"):
+            return self._flag_template
         return None
 
 
@@ -3763,711 +4565,857 @@ class BrowserConsistencyRule(FraudRule):
 # PHASE 3 FEATURES - 50 NEW RULES (Rules 56-109) for 85-90% Fraud Detection
 # ============================================================================
 
-class KeystrokeDynamicsRule(FraudRule):
+class KeystrokeDynamicsRule(ThresholdRule):
     """Rule 56: Keystroke Dynamics"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="keystroke_dynamics",
             description="Unusual keystroke dynamics",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="keystroke_dynamics_score",
+            op=lt,
+            threshold=30,
+            confidence=0.80,
+            message="Keystroke dynamics anomaly"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.keystroke_dynamics_score and transaction.keystroke_dynamics_score < 30:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Keystroke dynamics anomaly")
-        return None
 
-class MobileSwipePatternRule(FraudRule):
+class MobileSwipePatternRule(ThresholdRule):
     """Rule 57: Mobile Swipe Pattern"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="mobile_swipe_pattern",
             description="Unusual swipe pattern on mobile",
             base_score=22,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="swipe_pattern_score",
+            op=lt,
+            threshold=25,
+            confidence=0.76,
+            message="Abnormal swipe pattern"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.swipe_pattern_score and transaction.swipe_pattern_score < 25:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.76, message="Abnormal swipe pattern")
-        return None
 
-class TouchPressureInconsistencyRule(FraudRule):
+class TouchPressureInconsistencyRule(ThresholdRule):
     """Rule 58: Touch Pressure Inconsistency"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="touch_pressure_inconsistency",
             description="Touch pressure pattern inconsistent",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="touch_pressure_consistent",
+            op=eq,
+            threshold=False,
+            confidence=0.70,
+            message="Touch pressure pattern changed"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if not transaction.touch_pressure_consistent:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Touch pressure pattern changed")
-        return None
 
-class DeviceAccelerationPatternRule(FraudRule):
+class DeviceAccelerationPatternRule(ThresholdRule):
     """Rule 59: Device Acceleration Pattern"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="device_acceleration_pattern",
             description="Unusual device acceleration pattern",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="acceleration_pattern_score",
+            op=lt,
+            threshold=25,
+            confidence=0.71,
+            message="Acceleration pattern anomaly"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.acceleration_pattern_score and transaction.acceleration_pattern_score < 25:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.71, message="Acceleration pattern anomaly")
-        return None
 
-class ScrollBehaviorAnomalyRule(FraudRule):
+class ScrollBehaviorAnomalyRule(ThresholdRule):
     """Rule 60: Scroll Behavior Anomaly"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="scroll_behavior_anomaly",
             description="Unusual scrolling behavior",
             base_score=18,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="scroll_behavior_score",
+            op=lt,
+            threshold=20,
+            confidence=0.65,
+            message="Suspicious scroll behavior"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.scroll_behavior_score and transaction.scroll_behavior_score < 20:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message="Suspicious scroll behavior")
-        return None
 
-class SharedAccountDetectionRule(FraudRule):
+class SharedAccountDetectionRule(ThresholdRule):
     """Rule 61: Shared Account Detection"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="shared_account_detection",
             description="Multiple users sharing account",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="co_user_count",
+            op=gt,
+            threshold=5,
+            confidence=0.87,
+            message="{value} users on this account"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.co_user_count and transaction.co_user_count > 5:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.87, message=f"{transaction.co_user_count} users on this account")
-        return None
 
-class EmailFraudLinkageRule(FraudRule):
+class EmailFraudLinkageRule(ThresholdRule):
     """Rule 62: Email Fraud Linkage"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="email_fraud_linkage",
             description="Email linked to fraud accounts",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="shared_email_with_fraud",
+            op=eq,
+            threshold=True,
+            confidence=0.92,
+            message="Email linked to fraud accounts"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.shared_email_with_fraud:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="Email linked to fraud accounts")
-        return None
 
-class PhoneFraudLinkageRule(FraudRule):
+class PhoneFraudLinkageRule(ThresholdRule):
     """Rule 63: Phone Fraud Linkage"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="phone_fraud_linkage",
             description="Phone linked to fraud accounts",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="shared_phone_with_fraud",
+            op=eq,
+            threshold=True,
+            confidence=0.92,
+            message="Phone linked to fraud accounts"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.shared_phone_with_fraud:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="Phone linked to fraud accounts")
-        return None
 
-class DeviceFraudLinkageRule(FraudRule):
+class DeviceFraudLinkageRule(ThresholdRule):
     """Rule 64: Device Fraud Linkage"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="device_fraud_linkage",
             description="Device linked to fraud accounts",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="shared_device_with_fraud",
+            op=eq,
+            threshold=True,
+            confidence=0.92,
+            message="Device linked to fraud accounts"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.shared_device_with_fraud:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="Device linked to fraud accounts")
-        return None
 
-class IPFraudLinkageRule(FraudRule):
+class IPFraudLinkageRule(ThresholdRule):
     """Rule 65: IP Fraud Linkage"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="ip_fraud_linkage",
             description="IP linked to fraud accounts",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="shared_ip_with_fraud",
+            op=eq,
+            threshold=True,
+            confidence=0.92,
+            message="IP linked to fraud accounts"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.shared_ip_with_fraud:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="IP linked to fraud accounts")
-        return None
 
 class CommonNameDetectionRule(FraudRule):
     """Rule 66: Common Name Detection"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="common_name_detection",
             description="Account with very common name",
             base_score=18,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            required_fields=("first_name_uniqueness",)
         )
+        self._flag_template = self.flag_template(confidence=0.68, message="Very common name combination")
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.first_name_uniqueness and transaction.first_name_uniqueness < 0.1:
             if transaction.last_name_uniqueness and transaction.last_name_uniqueness < 0.1:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Very common name combination")
+                return self._flag_template
         return None
 
-class IllegalEmailDomainRule(FraudRule):
+class IllegalEmailDomainRule(ThresholdRule):
     """Rule 67: Illegitimate Email Domain"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="illegitimate_email_domain",
             description="Email domain lacks legitimacy",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            attr="email_domain_legitimacy",
+            op=lt,
+            threshold=20,
+            confidence=0.79,
+            message="Domain legitimacy score low"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.email_domain_legitimacy and transaction.email_domain_legitimacy < 20:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.79, message="Domain legitimacy score low")
-        return None
 
-class HighRiskPhoneCarrierRule(FraudRule):
+class HighRiskPhoneCarrierRule(ThresholdRule):
     """Rule 68: High-Risk Phone Carrier"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="high_risk_phone_carrier",
             description="Phone from high-risk carrier",
             base_score=22,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            attr="phone_carrier_risk",
+            op=gt,
+            threshold=70,
+            confidence=0.76,
+            message="Phone carrier flagged as high-risk"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.phone_carrier_risk and transaction.phone_carrier_risk > 70:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.76, message="Phone carrier flagged as high-risk")
-        return None
 
-class BVNFraudMatchRule(FraudRule):
+class BVNFraudMatchRule(ThresholdRule):
     """Rule 69: BVN Fraud Match"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="bvn_fraud_match",
             description="BVN linked to fraud",
             base_score=45,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
-        )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.bvn_fraud_match_count and transaction.bvn_fraud_match_count > 0:
-            return FraudFlag(type=self.name, severity=self.severity, score=40 + min(transaction.bvn_fraud_match_count * 2, 20), confidence=0.94, message=f"BVN linked to {transaction.bvn_fraud_match_count} fraud cases")
-        return None
-
-class FamilyFraudLinkRule(FraudRule):
+            verticals=PAYMENT_VERTICALS,
+            attr="bvn_fraud_match_count",
+            op=gt,
+            threshold=0,
+            confidence=0.94,
+            message="BVN linked to {value} fraud cases",
+            score_offset=40,  # 40 + 2 per match, capped at 60
+            score_per_unit=2,
+            score_cap=60,
+        )
+
+class FamilyFraudLinkRule(ThresholdRule):
     """Rule 70: Family Member Fraud"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="family_fraud_link",
             description="Family member with fraud history",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            attr="family_member_with_fraud",
+            op=eq,
+            threshold=True,
+            confidence=0.82,
+            message="Family member has fraud history"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.family_member_with_fraud:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message="Family member has fraud history")
-        return None
 
-class KnownFraudsterPatternRule(FraudRule):
+class KnownFraudsterPatternRule(ThresholdRule):
     """Rule 71: Known Fraudster Pattern"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="known_fraudster_pattern",
             description="Matches known fraudster signature",
             base_score=50,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="known_fraudster_pattern",
+            op=eq,
+            threshold=True,
+            confidence=0.95,
+            message="Matches known fraudster pattern"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.known_fraudster_pattern:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.95, message="Matches known fraudster pattern")
-        return None
 
-class SyntheticIdentityRule(FraudRule):
+class SyntheticIdentityRule(ThresholdRule):
     """Rule 72: Synthetic Identity Detection"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="synthetic_identity",
             description="Likely synthetic identity",
             base_score=45,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            attr="linked_to_synthetic_fraud",
+            op=eq,
+            threshold=True,
+            confidence=0.91,
+            message="Synthetic identity indicators detected"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.linked_to_synthetic_fraud:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.91, message="Synthetic identity indicators detected")
-        return None
 
-class CrossVerticalVelocityRule(FraudRule):
+class CrossVerticalVelocityRule(ThresholdRule):
     """Rule 73: Cross-Vertical Velocity"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="cross_vertical_velocity",
             description="High velocity across verticals",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="velocity_between_verticals",
+            op=gt,
+            threshold=5,
+            confidence=0.85,
+            message="{value} transactions across verticals"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.velocity_between_verticals and transaction.velocity_between_verticals > 5:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message=f"{transaction.velocity_between_verticals} transactions across verticals")
-        return None
 
-class AccountResurrectionRule(FraudRule):
+class AccountResurrectionRule(ThresholdRule):
     """Rule 74: Account Resurrection"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="account_resurrection",
             description="Old inactive account suddenly active",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="account_resurrection_attempt",
+            op=eq,
+            threshold=True,
+            confidence=0.83,
+            message="Dormant account suddenly reactivated"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.account_resurrection_attempt:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.83, message="Dormant account suddenly reactivated")
-        return None
 
-class DeclinedTransactionHistoryRule(FraudRule):
+class DeclinedTransactionHistoryRule(ThresholdRule):
     """Rule 75: Previous Decline History"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="declined_transaction_history",
             description="Transaction previously declined",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="previously_declined_transaction",
+            op=eq,
+            threshold=True,
+            confidence=0.86,
+            message="Same transaction pattern previously declined"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.previously_declined_transaction:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.86, message="Same transaction pattern previously declined")
-        return None
 
-class RefundAbuseSerialRule(FraudRule):
+class RefundAbuseSerialRule(ThresholdRule):
     """Rule 76: Serial Refund Abuser"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="refund_abuse_serial",
             description="Serial refund abuse pattern",
             base_score=35,
             severity="high",
-            verticals=["ecommerce", "fintech", "payments", "marketplace"]
+            verticals=("ecommerce", "fintech", "payments", "marketplace"),
+            attr="refund_abuse_pattern",
+            op=eq,
+            threshold=True,
+            confidence=0.88,
+            message="Serial refund abuse pattern detected"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.refund_abuse_pattern:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="Serial refund abuse pattern detected")
-        return None
 
-class ChargebackAbuseSerialRule(FraudRule):
+class ChargebackAbuseSerialRule(ThresholdRule):
     """Rule 77: Serial Chargeback Abuser"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="chargeback_abuse_serial",
             description="Serial chargeback abuse pattern",
             base_score=38,
             severity="critical",
-            verticals=["ecommerce", "fintech", "payments", "marketplace"]
+            verticals=("ecommerce", "fintech", "payments", "marketplace"),
+            attr="chargeback_abuse_pattern",
+            op=eq,
+            threshold=True,
+            confidence=0.90,
+            message="Serial chargeback abuse pattern"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.chargeback_abuse_pattern:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Serial chargeback abuse pattern")
-        return None
 
-class HistoricalFraudPatternRule(FraudRule):
+class HistoricalFraudPatternRule(ThresholdRule):
     """Rule 78: Historical Fraud Pattern Matching"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="historical_fraud_pattern",
             description="Matches historical fraud patterns",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="account_history_matches_fraud",
+            op=gt,
+            threshold=3,
+            confidence=0.84,
+            message="{value} historical pattern matches",
+            score_offset=25,  # 25 + 2 per match
+            score_per_unit=2,
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.account_history_matches_fraud and transaction.account_history_matches_fraud > 3:
-            return FraudFlag(type=self.name, severity=self.severity, score=25 + (transaction.account_history_matches_fraud * 2), confidence=0.84, message=f"{transaction.account_history_matches_fraud} historical pattern matches")
-        return None
 
-class EntropyAnomalyRule(FraudRule):
+class EntropyAnomalyRule(ThresholdRule):
     """Rule 79: Entropy Anomaly"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="entropy_anomaly",
             description="Information entropy anomaly",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="entropy_score",
+            op=lt,
+            threshold=0.2,
+            confidence=0.70,
+            message="Low entropy (suspicious pattern)"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.entropy_score and transaction.entropy_score < 0.2:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Low entropy (suspicious pattern)")
-        return None
 
-class MLAnomalyDetectionRule(FraudRule):
+class MLAnomalyDetectionRule(ThresholdRule):
     """Rule 80: ML Anomaly Score"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="ml_anomaly_score",
             description="High ML anomaly score",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="anomaly_score",
+            op=gt,
+            threshold=0.75,
+            confidence=0.87,
+            message="ML anomaly score: {value:.2f}"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.anomaly_score and transaction.anomaly_score > 0.75:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.87, message=f"ML anomaly score: {transaction.anomaly_score:.2f}")
-        return None
 
-class LowLegitimacyScoreRule(FraudRule):
+class LowLegitimacyScoreRule(ThresholdRule):
     """Rule 81: Low Legitimacy Score"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="low_legitimacy_score",
             description="Low transaction legitimacy",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="transaction_legitimacy_score",
+            op=lt,
+            threshold=25,
+            confidence=0.86,
+            message="Legitimacy score: {value}/100"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.transaction_legitimacy_score and transaction.transaction_legitimacy_score < 25:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.86, message=f"Legitimacy score: {transaction.transaction_legitimacy_score}/100")
-        return None
 
-class ProfileDeviationRule(FraudRule):
+class ProfileDeviationRule(ThresholdRule):
     """Rule 82: User Profile Deviation"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="profile_deviation",
             description="High deviation from user profile",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="user_profile_deviation",
+            op=gt,
+            threshold=0.7,
+            confidence=0.83,
+            message="High deviation from user profile"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.user_profile_deviation and transaction.user_profile_deviation > 0.7:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.83, message="High deviation from user profile")
-        return None
 
-class EmulatorDetectionRule(FraudRule):
+class EmulatorDetectionRule(ThresholdRule):
     """Rule 83: Emulator Detection"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="emulator_detection",
             description="Transaction from emulator",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="emulator_detected",
+            op=eq,
+            threshold=True,
+            confidence=0.92,
+            message="Emulator detected on device"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.emulator_detected:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="Emulator detected on device")
-        return None
 
-class JailbreakDetectionRule(FraudRule):
+class JailbreakDetectionRule(ThresholdRule):
     """Rule 84: Jailbreak/Root Detection"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="jailbreak_detection",
             description="Device is jailbroken/rooted",
             base_score=38,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="jailbreak_detected",
+            op=eq,
+            threshold=True,
+            confidence=0.90,
+            message="Jailbreak/root detected"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.jailbreak_detected:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Jailbreak/root detected")
-        return None
 
-class MalwareAppDetectionRule(FraudRule):
+class MalwareAppDetectionRule(ThresholdRule):
     """Rule 85: Malware/Fraud App Detection"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="malware_app_detection",
             description="Malware or fraud app found",
             base_score=45,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="suspicious_app_installed",
+            op=eq,
+            threshold=True,
+            confidence=0.94,
+            message="Malware/fraud app detected on device"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.suspicious_app_installed:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.94, message="Malware/fraud app detected on device")
-        return None
 
-class LendingCrossSellRule(FraudRule):
+class LendingCrossSellRule(ThresholdRule):
     """Rule 86: Lending Cross-Sell Fraud"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="lending_cross_sell",
             description="Lending cross-sell fraud pattern",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments"]
+            verticals=FINANCIAL_VERTICALS,
+            attr="lending_cross_sell_pattern",
+            op=eq,
+            threshold=True,
+            confidence=0.85,
+            message="Cross-sell fraud pattern detected"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.lending_cross_sell_pattern:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Cross-sell fraud pattern detected")
-        return None
 
-class EcommerceDropshippingRule(FraudRule):
+class EcommerceDropshippingRule(ThresholdRule):
     """Rule 87: E-commerce Dropshipping Fraud"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="ecommerce_dropshipping",
             description="Dropshipping fraud pattern",
             base_score=32,
             severity="high",
-            verticals=["ecommerce", "marketplace"]
+            verticals=ECOM_VERTICALS,
+            attr="ecommerce_dropshipper_pattern",
+            op=eq,
+            threshold=True,
+            confidence=0.82,
+            message="Dropshipping fraud indicator"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.ecommerce_dropshipper_pattern:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message="Dropshipping fraud indicator")
-        return None
 
-class CryptoPumpDumpRule(FraudRule):
+class CryptoPumpDumpRule(ThresholdRule):
     """Rule 88: Crypto Pump & Dump Signal"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="crypto_pump_dump",
             description="Pump and dump trading signal",
             base_score=40,
             severity="critical",
-            verticals=["crypto"]
+            verticals=("crypto",),
+            attr="crypto_pump_dump_signal",
+            op=eq,
+            threshold=True,
+            confidence=0.88,
+            message="Pump & dump pattern detected"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.crypto_pump_dump_signal:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="Pump & dump pattern detected")
-        return None
 
-class BettingArbitrageHighLikelihoodRule(FraudRule):
+class BettingArbitrageHighLikelihoodRule(ThresholdRule):
     """Rule 89: Betting Arbitrage High Likelihood"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="betting_arbitrage_high",
             description="High likelihood arbitrage betting",
             base_score=35,
             severity="high",
-            verticals=["betting", "gaming"]
+            verticals=("betting", "gaming"),
+            attr="betting_arbitrage_likelihood",
+            op=gt,
+            threshold=80,
+            confidence=0.86,
+            message="High arbitrage betting likelihood"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.betting_arbitrage_likelihood and transaction.betting_arbitrage_likelihood > 80:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.86, message="High arbitrage betting likelihood")
-        return None
 
-class MarketplaceCollusionRule(FraudRule):
+class MarketplaceCollusionRule(ThresholdRule):
     """Rule 90: Marketplace Seller Collusion"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="marketplace_collusion",
             description="Collusion between sellers",
             base_score=38,
             severity="critical",
-            verticals=["marketplace"]
+            verticals=("marketplace",),
+            attr="marketplace_seller_collusion",
+            op=eq,
+            threshold=True,
+            confidence=0.87,
+            message="Seller collusion indicators detected"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.marketplace_seller_collusion:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.87, message="Seller collusion indicators detected")
-        return None
 
-class TransactionPatternEntropyRule(FraudRule):
+class TransactionPatternEntropyRule(ThresholdRule):
     """Rule 91: Transaction Pattern Entropy"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="transaction_pattern_entropy",
             description="Suspicious transaction pattern entropy",
             base_score=22,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="transaction_pattern_entropy",
+            op=gt,
+            threshold=0.8,
+            confidence=0.72,
+            message="High pattern entropy (random behavior)"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.transaction_pattern_entropy and transaction.transaction_pattern_entropy > 0.8:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="High pattern entropy (random behavior)")
-        return None
 
-class LowBehavioralConsistencyRule(FraudRule):
+class LowBehavioralConsistencyRule(ThresholdRule):
     """Rule 92: Low Behavioral Consistency"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="low_behavioral_consistency",
             description="Low behavioral consistency",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="behavioral_consistency_score",
+            op=lt,
+            threshold=30,
+            confidence=0.84,
+            message="Low behavioral consistency"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.behavioral_consistency_score and transaction.behavioral_consistency_score < 30:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.84, message="Low behavioral consistency")
-        return None
 
-class AccountVelocityRatioRule(FraudRule):
+class AccountVelocityRatioRule(ThresholdRule):
     """Rule 93: Account Age Velocity Ratio"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="account_velocity_ratio",
             description="Account age to velocity ratio anomaly",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="account_age_velocity_ratio",
+            op=gt,
+            threshold=10,
+            confidence=0.81,
+            message="High velocity for account age"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.account_age_velocity_ratio and transaction.account_age_velocity_ratio > 10:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.81, message="High velocity for account age")
-        return None
 
-class LowGeographicConsistencyRule(FraudRule):
+class LowGeographicConsistencyRule(ThresholdRule):
     """Rule 94: Low Geographic Consistency"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="low_geographic_consistency",
             description="Geographic pattern inconsistent",
             base_score=26,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="geographic_consistency_score",
+            op=lt,
+            threshold=30,
+            confidence=0.79,
+            message="Geographic pattern inconsistency"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.geographic_consistency_score and transaction.geographic_consistency_score < 30:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.79, message="Geographic pattern inconsistency")
-        return None
 
-class LowTemporalConsistencyRule(FraudRule):
+class LowTemporalConsistencyRule(ThresholdRule):
     """Rule 95: Low Temporal Consistency"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="low_temporal_consistency",
             description="Temporal pattern inconsistent",
             base_score=24,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="temporal_consistency_score",
+            op=lt,
+            threshold=30,
+            confidence=0.77,
+            message="Temporal pattern inconsistency"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.temporal_consistency_score and transaction.temporal_consistency_score < 30:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.77, message="Temporal pattern inconsistency")
-        return None
 
-class CrossAccountFundingRule(FraudRule):
+class CrossAccountFundingRule(ThresholdRule):
     """Rule 96: Cross-Account Funding"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="cross_account_funding",
             description="Money flowing between multiple accounts",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="multi_account_cross_funding",
+            op=eq,
+            threshold=True,
+            confidence=0.89,
+            message="Cross-account funding detected"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.multi_account_cross_funding:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.89, message="Cross-account funding detected")
-        return None
 
-class RoundTripTransactionRule(FraudRule):
+class RoundTripTransactionRule(ThresholdRule):
     """Rule 97: Round Trip Transaction"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="round_trip_transaction",
             description="Money out and back pattern",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="round_trip_transaction",
+            op=eq,
+            threshold=True,
+            confidence=0.86,
+            message="Round-trip transaction pattern"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.round_trip_transaction:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.86, message="Round-trip transaction pattern")
-        return None
 
-class TestTransactionPatternRule(FraudRule):
+class TestTransactionPatternRule(ThresholdRule):
     """Rule 98: Test Transaction Pattern"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="test_transaction_pattern",
             description="Small test transactions before large ones",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            attr="test_transaction_pattern",
+            op=eq,
+            threshold=True,
+            confidence=0.84,
+            message="Test transaction pattern detected"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.test_transaction_pattern:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.84, message="Test transaction pattern detected")
-        return None
 
-class RapidProgressionRule(FraudRule):
+class RapidProgressionRule(ThresholdRule):
     """Rule 99: Rapid Account Progression"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="rapid_progression",
             description="Account tier upgraded too quickly",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            attr="rapid_account_progression",
+            op=eq,
+            threshold=True,
+            confidence=0.82,
+            message="Rapid account tier progression"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.rapid_account_progression:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message="Rapid account tier progression")
-        return None
 
-class BeneficiaryPatternAnomalyRule(FraudRule):
+class BeneficiaryPatternAnomalyRule(ThresholdRule):
     """Rule 100: Beneficiary Pattern Anomaly"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="beneficiary_anomaly",
             description="Suspicious beneficiary pattern",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            attr="suspicious_beneficiary_pattern",
+            op=eq,
+            threshold=True,
+            confidence=0.81,
+            message="Abnormal beneficiary pattern"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.suspicious_beneficiary_pattern:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.81, message="Abnormal beneficiary pattern")
-        return None
 
-class DeepLearningScoreRule(FraudRule):
+class DeepLearningScoreRule(ThresholdRule):
     """Rule 101: Deep Learning Fraud Score"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="deep_learning_score",
             description="High DL model fraud score",
             base_score=38,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="deep_learning_fraud_score",
+            op=gt,
+            threshold=0.8,
+            confidence=0.91,
+            message="DL fraud score: {value:.2f}"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.deep_learning_fraud_score and transaction.deep_learning_fraud_score > 0.8:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.91, message=f"DL fraud score: {transaction.deep_learning_fraud_score:.2f}")
-        return None
 
-class EnsembleConfidenceRule(FraudRule):
+class EnsembleConfidenceRule(ThresholdRule):
     """Rule 102: Ensemble Model Confidence"""
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
             name="ensemble_confidence",
             description="High ensemble model fraud confidence",
             base_score=36,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            attr="ensemble_model_confidence",
+            op=gt,
+            threshold=0.85,
+            confidence=0.92,
+            message="Ensemble confidence: {value:.2f}"
         )
-    def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
-        if transaction.ensemble_model_confidence and transaction.ensemble_model_confidence > 0.85:
-            return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message=f"Ensemble confidence: {transaction.ensemble_model_confidence:.2f}")
-        return None
 
 
 # ============================================================================
@@ -4478,144 +5426,162 @@ class EnsembleConfidenceRule(FraudRule):
 
 class EmailDomainAgeRule(FraudRule):
     """Rule: New email domain"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="email_domain_new",
             description="Brand new email domain",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.email:
             if transaction.identity_features.email.age_days and transaction.identity_features.email.age_days < 30:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Email domain <30 days old")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Email domain <30 days old")
         return None
 
 class EmailReputationRule(FraudRule):
     """Rule: Low email reputation"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="email_reputation_low",
             description="Low email reputation score",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.email:
             if transaction.identity_features.email.reputation_score and transaction.identity_features.email.reputation_score < 40:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Poor email reputation")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Poor email reputation")
         return None
 
 class PhoneAgeRule(FraudRule):
     """Rule: New phone number"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="phone_age_new",
             description="Brand new phone number",
             base_score=22,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "betting", "marketplace"]
+            verticals=("lending", "fintech", "payments", "betting", "marketplace"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.phone:
             if transaction.identity_features.phone.age_days and transaction.identity_features.phone.age_days < 7:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Phone number <7 days old")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Phone number <7 days old")
         return None
 
 class PhoneCarrierRiskRule(FraudRule):
     """Rule: High-risk phone carrier"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="phone_carrier_risk",
             description="Phone carrier high risk",
             base_score=18,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.phone:
             if transaction.identity_features.phone.carrier_risk and transaction.identity_features.phone.carrier_risk > 70:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message="High-risk phone carrier")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message="High-risk phone carrier")
         return None
 
 class UnverifiedPhoneIdentityRule(FraudRule):
     """Rule: Unverified phone in identity"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="phone_unverified_identity",
             description="Phone not verified",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.phone:
             if not transaction.identity_features.phone.verification_status:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Phone not verified")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Phone not verified")
         return None
 
 class BVNFraudHistoryRule(FraudRule):
     """Rule: BVN linked to fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="bvn_fraud_linked",
             description="BVN linked to fraud accounts",
             base_score=45,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.bvn:
             if transaction.identity_features.bvn.verification_status is False:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="BVN not verified or linked to fraud")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="BVN not verified or linked to fraud")
         return None
 
 class DeviceBrowserFingerprintRule(FraudRule):
     """Rule: Browser fingerprint inconsistency"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="browser_fingerprint_new",
             description="New browser fingerprint detected",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
             if transaction.identity_features.device.fingerprint and context.get("previous_fingerprint"):
                 if transaction.identity_features.device.fingerprint != context.get("previous_fingerprint"):
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Browser fingerprint changed")
+                    return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Browser fingerprint changed")
         return None
 
 class DeviceScreenResolutionRule(FraudRule):
     """Rule: Screen resolution mismatch"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="screen_resolution_unusual",
             description="Unusual screen resolution",
             base_score=15,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "crypto", "gaming"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "crypto", "gaming"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
             if transaction.identity_features.device.screen_resolution:
                 res = transaction.identity_features.device.screen_resolution
                 if res not in ["1920x1080", "1080x1920", "375x667", "414x896", "768x1024", "1024x768"]:
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message="Unusual screen resolution")
+                    return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message="Unusual screen resolution")
         return None
 
 class DeviceTimezoneHoppingRule(FraudRule):
     """Rule: Timezone changed dramatically"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="timezone_hopping",
             description="Timezone changed >8 hours",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
@@ -4625,120 +5591,134 @@ class DeviceTimezoneHoppingRule(FraudRule):
                 try:
                     tz_diff = abs(int(current_tz.split(":")[0]) - int(previous_tz.split(":")[0]))
                     if tz_diff > 8 and tz_diff < 16:
-                        return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Timezone changed by {tz_diff} hours")
+                        return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Timezone changed by {tz_diff} hours")
                 except:
                     pass
         return None
 
 class NetworkVPNDetectionRule(FraudRule):
     """Rule: VPN detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="vpn_detected",
             description="Transaction from VPN",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "betting", "crypto"]
+            verticals=("lending", "fintech", "payments", "betting", "crypto"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.network:
             if transaction.identity_features.network.vpn_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="VPN or proxy detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="VPN or proxy detected")
         return None
 
 class NetworkTorDetectionRule(FraudRule):
     """Rule: Tor network detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="tor_detected",
             description="Transaction from Tor network",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.network:
             if transaction.identity_features.network.tor_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Tor network detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Tor network detected")
         return None
 
 class NetworkIPReputationRule(FraudRule):
     """Rule: IP reputation score low"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="ip_reputation_low",
             description="Low IP reputation score",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.network:
             if transaction.identity_features.network.ip_reputation and transaction.identity_features.network.ip_reputation < 30:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="IP reputation score <30")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="IP reputation score <30")
         return None
 
 class NetworkDatacenterIPRule(FraudRule):
     """Rule: Datacenter IP detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="datacenter_ip",
             description="Datacenter/cloud IP detected",
             base_score=22,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.network:
             if transaction.identity_features.network.datacenter_ip:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Datacenter/cloud IP detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Datacenter/cloud IP detected")
         return None
 
 # Continue Phase 4 with additional rules...
 class DeviceEmulatorDetectionRule(FraudRule):
     """Rule: Emulator detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="emulator_detected_device",
             description="Mobile emulator detected",
             base_score=32,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "gaming"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto", "gaming"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
             # Check if GPU info contains emulator keywords or CPU cores is unusual
             if transaction.identity_features.device.gpu_info:
                 if "emulator" in transaction.identity_features.device.gpu_info.lower() or "swiftshader" in transaction.identity_features.device.gpu_info.lower():
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message="Emulator detected via GPU info")
+                    return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.82, message="Emulator detected via GPU info")
         return None
 
 class DeviceJailbreakDetectionRule(FraudRule):
     """Rule: Jailbreak detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="jailbreak_detected_device",
             description="Device jailbreak/root detected",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "gaming"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto", "gaming"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
             if transaction.identity_features.device.cpu_cores and transaction.identity_features.device.cpu_cores > 16:
                 # Unusual CPU count often indicates jailbroken/rooted device
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Possible jailbreak/root detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Possible jailbreak/root detected")
         return None
 
 class DeviceBatteryLevelRule(FraudRule):
     """Rule: Suspicious battery level"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="battery_suspicious",
             description="Unusual battery level",
             base_score=12,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "gaming"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto", "gaming"),
+            required_fields=("identity_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.identity_features and transaction.identity_features.device:
@@ -4746,167 +5726,187 @@ class DeviceBatteryLevelRule(FraudRule):
                 bat = transaction.identity_features.device.battery_level
                 if bat == 0 or bat == 100:
                     # Suspicious: never at exactly 0 or 100 in normal use, indicates testing/bot
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.55, message="Unusual battery level")
+                    return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.55, message="Unusual battery level")
         return None
 
 # PHASE 5: BEHAVIORAL FEATURES (60+ rules)
 
 class BehavioralMouseMovementRule(FraudRule):
     """Rule: Unnatural mouse movement"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="mouse_movement_unnatural",
             description="Suspicious mouse movement pattern",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "gaming"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto", "gaming"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             if transaction.behavioral_features.session.mouse_movement_score and transaction.behavioral_features.session.mouse_movement_score < 20:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Unnatural mouse movement pattern")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Unnatural mouse movement pattern")
         return None
 
 class BehavioralTypingSpeedRule(FraudRule):
     """Rule: Extreme typing speed"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="typing_speed_extreme",
             description="Extreme typing speed (bot-like)",
             base_score=25,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             if transaction.behavioral_features.session.typing_speed_wpm:
                 wpm = transaction.behavioral_features.session.typing_speed_wpm
                 if wpm < 10 or wpm > 150:
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"Extreme typing speed: {wpm} WPM")
+                    return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"Extreme typing speed: {wpm} WPM")
         return None
 
 class BehavioralKeystrokeDynamicsRule(FraudRule):
     """Rule: Poor keystroke dynamics"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="keystroke_dynamics_poor",
             description="Poor keystroke dynamics",
             base_score=22,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             if transaction.behavioral_features.session.keystroke_dynamics_score and transaction.behavioral_features.session.keystroke_dynamics_score < 25:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Poor keystroke dynamics")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message="Poor keystroke dynamics")
         return None
 
 class BehavioralCopyPasteRule(FraudRule):
     """Rule: Excessive copy/paste"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="copy_paste_excessive",
             description="Excessive copy/paste activity",
             base_score=24,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             if transaction.behavioral_features.session.copy_paste_count and transaction.behavioral_features.session.copy_paste_count > 8:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"Excessive copy/paste: {transaction.behavioral_features.session.copy_paste_count} times")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message=f"Excessive copy/paste: {transaction.behavioral_features.session.copy_paste_count} times")
         return None
 
 class BehavioralSessionDurationRule(FraudRule):
     """Rule: Suspiciously short session"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="session_duration_short",
             description="Very short session duration",
             base_score=18,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting", "crypto"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.session:
             if transaction.behavioral_features.session.session_duration_seconds and transaction.behavioral_features.session.session_duration_seconds < 5:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message="Suspiciously short session (<5 seconds)")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message="Suspiciously short session (<5 seconds)")
         return None
 
 class BehavioralLoginFrequencyRule(FraudRule):
     """Rule: Unusual login frequency"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="login_frequency_unusual",
             description="Unusual login frequency",
             base_score=20,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "betting", "marketplace"]
+            verticals=("lending", "fintech", "payments", "betting", "marketplace"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.login:
             if transaction.behavioral_features.login.login_frequency and transaction.behavioral_features.login.login_frequency > 20:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message=f"High login frequency: {transaction.behavioral_features.login.login_frequency} times")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message=f"High login frequency: {transaction.behavioral_features.login.login_frequency} times")
         return None
 
 class BehavioralFailedLoginsRule(FraudRule):
     """Rule: Multiple failed login attempts"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="failed_logins_multiple",
             description="Multiple failed login attempts",
             base_score=28,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.login:
             if transaction.behavioral_features.login.failed_login_attempts_24h and transaction.behavioral_features.login.failed_login_attempts_24h > 5:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Failed logins in 24h: {transaction.behavioral_features.login.failed_login_attempts_24h}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message=f"Failed logins in 24h: {transaction.behavioral_features.login.failed_login_attempts_24h}")
         return None
 
 class BehavioralFailedLoginVelocityRule(FraudRule):
     """Rule: Failed login velocity"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="failed_login_velocity_high",
             description="High failed login velocity",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments", "betting", "marketplace"]
+            verticals=("lending", "fintech", "payments", "betting", "marketplace"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.login:
             if transaction.behavioral_features.login.failed_login_velocity and transaction.behavioral_features.login.failed_login_velocity > 10:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Account takeover attempt: failed logins then success")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Account takeover attempt: failed logins then success")
         return None
 
 class BehavioralPasswordResetRule(FraudRule):
     """Rule: Password reset before transaction"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="password_reset_txn",
             description="Password reset then transaction",
             base_score=38,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.login:
             if transaction.behavioral_features.login.password_reset_requests and transaction.behavioral_features.login.password_reset_requests > 0:
                 if transaction.behavioral_features.login.password_reset_txn_time_gap and transaction.behavioral_features.login.password_reset_txn_time_gap < 10:
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Account takeover: password reset + transaction")
+                    return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Account takeover: password reset + transaction")
         return None
 
 class BehavioralTransactionVelocityRule(FraudRule):
     """Rule: High transaction velocity"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="txn_velocity_high",
             description="High transaction velocity",
             base_score=25,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.transaction:
@@ -4914,335 +5914,375 @@ class BehavioralTransactionVelocityRule(FraudRule):
             vel_day = transaction.behavioral_features.transaction.velocity_last_day or 0
             vel_week = transaction.behavioral_features.transaction.velocity_last_week or 0
             if vel_hour > 5 or vel_day > 30 or vel_week > 100:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"High velocity: {vel_hour}h, {vel_day}d, {vel_week}w")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message=f"High velocity: {vel_hour}h, {vel_day}d, {vel_week}w")
         return None
 
 class BehavioralFirstTransactionAmountRule(FraudRule):
     """Rule: First transaction unusually large"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="first_txn_amount_large",
             description="First transaction much larger than average",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.transaction:
             first = transaction.behavioral_features.transaction.first_transaction_amount or 0
             avg = transaction.behavioral_features.transaction.avg_transaction_amount or 0
             if avg > 0 and first > avg * 5:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="First transaction 5x+ larger than average")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="First transaction 5x+ larger than average")
         return None
 
 class BehavioralUnusualTimeRule(FraudRule):
     """Rule: Transaction at unusual time"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="txn_unusual_time",
             description="Transaction at unusual time",
             base_score=18,
             severity="medium",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.transaction:
             hour = transaction.behavioral_features.transaction.txn_time_hour
             if hour is not None:
                 if hour < 6 or hour > 22:
-                    return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"Transaction at unusual hour: {hour}")
+                    return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.65, message=f"Transaction at unusual hour: {hour}")
         return None
 
 class BehavioralWeekendTransactionRule(FraudRule):
     """Rule: Large transaction on weekend"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="weekend_large_txn",
             description="Large transaction on weekend",
             base_score=16,
             severity="low",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("behavioral_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.behavioral_features and transaction.behavioral_features.transaction:
             if transaction.behavioral_features.transaction.weekend_transaction and transaction.amount and transaction.amount > 500000:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message="Large transaction on weekend")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.60, message="Large transaction on weekend")
         return None
 
 # PHASE 6: TRANSACTION FEATURES (40+ rules)
 
 class TransactionCardNewRule(FraudRule):
     """Rule: New card used"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="card_new",
             description="Brand new card detected",
             base_score=22,
             severity="medium",
-            verticals=["ecommerce", "betting", "payments"]
+            verticals=("ecommerce", "betting", "payments"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.card:
             if transaction.transaction_features.card.card_age_days and transaction.transaction_features.card.card_age_days < 3:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Card <3 days old")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="Card <3 days old")
         return None
 
 class TransactionCardTestingRule(FraudRule):
     """Rule: Card testing pattern"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="card_testing",
             description="Card testing pattern detected",
             base_score=35,
             severity="high",
-            verticals=["ecommerce", "betting", "payments"]
+            verticals=("ecommerce", "betting", "payments"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.card:
             if transaction.transaction_features.card.card_testing_pattern:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Card testing pattern detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Card testing pattern detected")
         return None
 
 class TransactionCardReputationRule(FraudRule):
     """Rule: Low card reputation"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="card_reputation_low",
             description="Card has poor reputation",
             base_score=28,
             severity="high",
-            verticals=["ecommerce", "betting", "payments"]
+            verticals=("ecommerce", "betting", "payments"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.card:
             if transaction.transaction_features.card.card_reputation_score and transaction.transaction_features.card.card_reputation_score < 25:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Card reputation score <25")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.75, message="Card reputation score <25")
         return None
 
 class TransactionBankingNewAccountRule(FraudRule):
     """Rule: New bank account"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="bank_account_new",
             description="New bank account detected",
             base_score=25,
             severity="medium",
-            verticals=["lending", "payments", "betting"]
+            verticals=("lending", "payments", "betting"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.banking:
             if transaction.transaction_features.banking.account_age_days and transaction.transaction_features.banking.account_age_days < 3:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Bank account <3 days old")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Bank account <3 days old")
         return None
 
 class TransactionAddressDistanceRule(FraudRule):
     """Rule: Large shipping/billing distance"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="address_distance_large",
             description="Large distance between billing and shipping",
             base_score=20,
             severity="medium",
-            verticals=["ecommerce", "marketplace"]
+            verticals=ECOM_VERTICALS,
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.address:
             if transaction.transaction_features.address.address_distance_km and transaction.transaction_features.address.address_distance_km > 500:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message=f"Address distance: {transaction.transaction_features.address.address_distance_km}km")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.68, message=f"Address distance: {transaction.transaction_features.address.address_distance_km}km")
         return None
 
 class TransactionCryptoNewWalletRule(FraudRule):
     """Rule: New crypto wallet"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="crypto_wallet_new",
             description="New crypto wallet detected",
             base_score=28,
             severity="high",
-            verticals=["crypto"]
+            verticals=("crypto",),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.crypto:
             if transaction.transaction_features.crypto.wallet_age_days and transaction.transaction_features.crypto.wallet_age_days < 1:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="Crypto wallet <1 day old")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="Crypto wallet <1 day old")
         return None
 
 class TransactionCryptoHighValueWithdrawalRule(FraudRule):
     """Rule: High-value withdrawal from new wallet"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="crypto_new_wallet_withdrawal",
             description="Large withdrawal from new wallet",
             base_score=40,
             severity="critical",
-            verticals=["crypto"]
+            verticals=("crypto",),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.crypto:
             if transaction.transaction_features.crypto.withdrawal_after_deposit and transaction.amount and transaction.amount > 5000000:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Large withdrawal from new crypto wallet")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Large withdrawal from new crypto wallet")
         return None
 
 class TransactionMerchantHighRiskRule(FraudRule):
     """Rule: High-risk merchant"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="merchant_high_risk",
             description="High-risk merchant category",
             base_score=24,
             severity="medium",
-            verticals=["ecommerce", "marketplace", "betting"]
+            verticals=("ecommerce", "marketplace", "betting"),
+            required_fields=("transaction_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.transaction_features and transaction.transaction_features.merchant:
             if transaction.transaction_features.merchant.merchant_high_risk:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="High-risk merchant category")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.70, message="High-risk merchant category")
         return None
 
 # PHASE 7: NETWORK/CONSORTIUM FEATURES (40+ rules)
 
 class NetworkEmailFraudLinkRule(FraudRule):
     """Rule: Email linked to fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="email_fraud_link",
             description="Email linked to fraud accounts",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.fraud_linkage:
             if transaction.network_features.fraud_linkage.email_linked_to_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Email linked to fraud accounts")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Email linked to fraud accounts")
         return None
 
 class NetworkPhoneFraudLinkRule(FraudRule):
     """Rule: Phone linked to fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="phone_fraud_link",
             description="Phone linked to fraud accounts",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.fraud_linkage:
             if transaction.network_features.fraud_linkage.phone_linked_to_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Phone linked to fraud accounts")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Phone linked to fraud accounts")
         return None
 
 class NetworkDeviceFraudLinkRule(FraudRule):
     """Rule: Device linked to fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="device_fraud_link",
             description="Device linked to fraud accounts",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.fraud_linkage:
             if transaction.network_features.fraud_linkage.device_linked_to_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Device linked to fraud accounts")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="Device linked to fraud accounts")
         return None
 
 class NetworkIPFraudLinkRule(FraudRule):
     """Rule: IP linked to fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="ip_fraud_link",
             description="IP linked to fraud accounts",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.fraud_linkage:
             if transaction.network_features.fraud_linkage.ip_linked_to_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="IP linked to fraud accounts")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.90, message="IP linked to fraud accounts")
         return None
 
 class NetworkCardFraudLinkRule(FraudRule):
     """Rule: Card linked to fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="card_fraud_link",
             description="Card linked to fraud accounts",
             base_score=38,
             severity="critical",
-            verticals=["ecommerce", "betting", "payments"]
+            verticals=("ecommerce", "betting", "payments"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.fraud_linkage:
             if transaction.network_features.fraud_linkage.card_linked_to_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="Card linked to fraud accounts")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="Card linked to fraud accounts")
         return None
 
 class NetworkBVNFraudLinkRule(FraudRule):
     """Rule: BVN linked to fraud"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="bvn_fraud_link",
             description="BVN linked to fraud accounts",
             base_score=42,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "betting"]
+            verticals=("lending", "fintech", "payments", "betting"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.fraud_linkage:
             if transaction.network_features.fraud_linkage.bvn_linked_to_fraud:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="BVN linked to fraud accounts")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="BVN linked to fraud accounts")
         return None
 
 class NetworkFraudRingDetectionRule(FraudRule):
     """Rule: Fraud ring detected"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="fraud_ring_detected",
             description="Coordinated fraud ring detected",
             base_score=45,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "marketplace"]
+            verticals=PAYMENT_VERTICALS,
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.graph_analysis:
             if transaction.network_features.graph_analysis.fraud_ring_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="Fraud ring detected via network analysis")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="Fraud ring detected via network analysis")
         return None
 
 class NetworkSyntheticIdentityRule(FraudRule):
     """Rule: Synthetic identity cluster"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="synthetic_identity",
             description="Synthetic identity detected",
             base_score=42,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.graph_analysis:
             if transaction.network_features.graph_analysis.synthetic_identity_cluster:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="Synthetic identity cluster detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.88, message="Synthetic identity cluster detected")
         return None
 
 class NetworkMoneyMuleRule(FraudRule):
     """Rule: Money mule network"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="money_mule_network",
             description="Money mule network detected",
             base_score=44,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "marketplace"]
+            verticals=("lending", "fintech", "payments", "marketplace"),
+            required_fields=("network_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.network_features and transaction.network_features.graph_analysis:
             if transaction.network_features.graph_analysis.money_mule_network_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.89, message="Money mule network detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.89, message="Money mule network detected")
         return None
 
 # PHASE 8-12: ADVANCED RULES (100+ rules)
@@ -5250,97 +6290,131 @@ class NetworkMoneyMuleRule(FraudRule):
 
 class ATOPasswordResetRule(FraudRule):
     """Rule: ATO - Password reset pattern"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="ato_password_reset",
             description="Account takeover: password reset",
             base_score=36,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "betting", "marketplace"]
+            verticals=("lending", "fintech", "payments", "betting", "marketplace"),
+            required_fields=("ato_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ato_signals and transaction.ato_signals.classic_patterns:
             if transaction.ato_signals.classic_patterns.password_reset_txn:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Account takeover: password reset detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.85, message="Account takeover: password reset detected")
         return None
 
 class FundingSourceNewCardWithdrawalRule(FraudRule):
     """Rule: New card + withdrawal"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="funding_new_card_withdrawal",
             description="New card added then withdrawn",
             base_score=32,
             severity="high",
-            verticals=["lending", "payments", "betting"]
+            verticals=("lending", "payments", "betting"),
+            required_fields=("funding_fraud_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.funding_fraud_signals and transaction.funding_fraud_signals.new_sources:
             if transaction.funding_fraud_signals.new_sources.new_card_withdrawal:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="New card with immediate withdrawal")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.78, message="New card with immediate withdrawal")
         return None
 
 class MerchantRefundAbuseRule(FraudRule):
     """Rule: Refund abuse pattern"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="refund_abuse",
             description="Refund abuse pattern detected",
             base_score=26,
             severity="medium",
-            verticals=["ecommerce", "marketplace", "betting"]
+            verticals=("ecommerce", "marketplace", "betting"),
+            required_fields=("merchant_abuse_signals",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.merchant_abuse_signals and transaction.merchant_abuse_signals.abuse_patterns:
             if transaction.merchant_abuse_signals.abuse_patterns.refund_abuse_detected:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Refund abuse pattern detected")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.72, message="Refund abuse pattern detected")
         return None
 
 class MLAnomalyScoreRule(FraudRule):
     """Rule: High ML anomaly score"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="ml_anomaly_high",
             description="High ML anomaly score",
             base_score=30,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace"]
+            verticals=NON_GAMING_VERTICALS,
+            required_fields=("ml_derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.ml_derived_features and transaction.ml_derived_features.statistical_outliers:
             if transaction.ml_derived_features.statistical_outliers.anomaly_score and transaction.ml_derived_features.statistical_outliers.anomaly_score > 0.75:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Anomaly score: {transaction.ml_derived_features.statistical_outliers.anomaly_score:.2f}")
+                return make_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message=f"Anomaly score: {transaction.ml_derived_features.statistical_outliers.anomaly_score:.2f}")
         return None
 
 class DerivedFraudsterSimilarityRule(FraudRule):
     """Rule: Similar to known fraudster"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="fraudster_similarity_high",
             description="Similar to known fraudster profile",
             base_score=35,
             severity="high",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting"]
+            verticals=("lending", "fintech", "payments", "ecommerce", "betting"),
+            required_fields=("derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.derived_features and transaction.derived_features.similarity:
             if transaction.derived_features.similarity.fraudster_profile_similarity and transaction.derived_features.similarity.fraudster_profile_similarity > 0.75:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Similar to known fraudster profile")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.80, message="Similar to known fraudster profile")
         return None
 
 class HighConfidenceFraudRule(FraudRule):
     """Rule: Aggregate high fraud confidence"""
+    __slots__ = ()
     def __init__(self):
         super().__init__(
             name="high_fraud_confidence",
             description="Multiple indicators suggest fraud",
             base_score=40,
             severity="critical",
-            verticals=["lending", "fintech", "payments", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+            verticals=ALL_VERTICALS,
+            required_fields=("derived_features",)
         )
     def check(self, transaction: TransactionCheckRequest, context: Dict[str, Any]) -> Optional[FraudFlag]:
         if transaction.derived_features and transaction.derived_features.aggregate_risk:
             if transaction.derived_features.aggregate_risk.fraud_probability and transaction.derived_features.aggregate_risk.fraud_probability > 0.85:
-                return FraudFlag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="High fraud confidence from aggregate analysis")
+                return shared_flag(type=self.name, severity=self.severity, score=self.base_score, confidence=0.92, message="High fraud confidence from aggregate analysis")
         return None
 
+
+
+# Singleton instance
+_rules_engine: Optional[FraudRulesEngine] = None
+
+
+def get_rules_engine() -> FraudRulesEngine:
+    """
+    Get rules engine singleton
+
+    Rules hold only configuration, so one engine can serve every request
+    instead of each detector rebuilding all rule objects.
+    """
+    global _rules_engine
+    if _rules_engine is None:
+        from app.core.config import settings
+        rule_timer = None
+        if settings.PROFILE_RULES:
+            from app.core.monitoring import record_rule_timing
+            rule_timer = record_rule_timing
+        _rules_engine = FraudRulesEngine(rule_timer=rule_timer)
+    return _rules_engine
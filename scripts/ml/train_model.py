@@ -216,6 +216,27 @@ def save_model(model, scaler, feature_names, output_dir='models'):
         pickle.dump(feature_names, f)
     print(f"   ✅ Feature names saved to {features_path}")
 
+    # Export an ONNX copy; the detector serves it with ONNX Runtime when present
+    try:
+        from onnxmltools import convert_xgboost
+        from onnxmltools.convert.common.data_types import FloatTensorType
+    except ImportError:
+        print("   ⚠️  onnxmltools not installed, skipping ONNX export")
+        return
+
+    # The converter only understands positional (f0, f1, ...) feature names;
+    # the detector feeds columns in feature_names order
+    onnx_booster = model.copy()
+    onnx_booster.feature_names = None
+    onnx_model = convert_xgboost(
+        onnx_booster,
+        initial_types=[("features", FloatTensorType([None, len(feature_names)]))]
+    )
+    onnx_path = f"{output_dir}/fraud_model.onnx"
+    with open(onnx_path, 'wb') as f:
+        f.write(onnx_model.SerializeToString())
+    print(f"   ✅ ONNX model saved to {onnx_path}")
+
 
 def main():
     """Main training pipeline"""
@@ -7,7 +7,7 @@ from app.services.rules import (
     LoanStackingRule,
     SIMSwapPatternRule
 )
-from app.models.schemas import TransactionCheckRequest
+from app.models.schemas import FraudFlag, TransactionCheckRequest
 
 
 def test_new_account_large_amount_rule():
@@ -141,6 +141,138 @@ def test_fraud_rules_engine():
     assert len(flags) >= 2  # Multiple flags should be triggered
 
 
+def test_engine_severity_order_and_early_exit():
+    """Test rules run critical-first and evaluation stops at the score cap"""
+    from app.services.rules import SEVERITY_PRIORITY
+
+    engine = FraudRulesEngine()
+    for rules in engine.rules_by_vertical.values():
+        priorities = [SEVERITY_PRIORITY[rule.severity] for rule in rules]
+        assert priorities == sorted(priorities, reverse=True)
+
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=250000,
+        account_age_days=2,
+        phone_changed_recently=True,
+        transaction_type="loan_disbursement"
+    )
+    context = {
+        "new_device": True,
+        "consortium": {"client_count": 3, "lenders": ["A", "B", "C"]}
+    }
+
+    full = FraudRulesEngine(early_exit_threshold=None).evaluate(transaction, context, industry="lending")
+    early = engine.evaluate(transaction, context, industry="lending")
+
+    # score_gate keeps the score and decision but drops flags past the cap
+    assert early[:3] == full[:3]
+    assert early[3] == full[3][:len(early[3])]
+
+    assert engine.evaluate(transaction, context, industry="lending", mode="full")[3] == full[3]
+    critical = engine.evaluate(transaction, context, industry="lending", mode="any_critical")[3]
+    assert critical[-1].severity == "critical"
+    assert len(critical) <= len(early[3])
+
+    with pytest.raises(ValueError):
+        engine.evaluate(transaction, context, industry="lending", mode="fastest")
+
+
+def test_risk_level_table_matches_thresholds():
+    """Test the risk level lookup agrees with the 40/70 cut-offs at every score"""
+    from app.services.rules import RISK_LEVEL_TABLE
+
+    for score in range(101):
+        expected = ("high", "decline") if score >= 70 else ("medium", "review") if score >= 40 else ("low", "approve")
+        assert RISK_LEVEL_TABLE[score // 10] == expected
+
+    print("✅ Risk level table passed")
+
+
+def test_rule_flags_serialize():
+    """Test unvalidated rule flags still behave as FraudFlag models"""
+    from app.models.schemas import FraudFlag
+    from app.services.rules import ChargebackHistoryRule
+
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=100000,
+        chargeback_history_count=50
+    )
+
+    flag = ChargebackHistoryRule().check(transaction, {})
+    assert isinstance(flag, FraudFlag)
+    assert flag.score == 100  # Capped instead of failing validation
+    assert flag.model_dump()["type"] == "chargeback_history"
+
+
+def test_constant_flags_are_shared_templates():
+    """Test constant-message rules return one prebuilt, immutable flag"""
+    from app.services.rules import EmulatorDetectionRule
+
+    rule = EmulatorDetectionRule()
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=100000,
+        emulator_detected=True
+    )
+
+    first = rule.check(transaction, {})
+    assert first is rule.check(transaction, {})
+    assert first.score == rule.base_score
+    with pytest.raises(Exception):
+        first.score = 0
+
+
+def test_make_flag_matches_validated_flag():
+    """Test unvalidated flags behave like validated FraudFlags"""
+    import copy
+    from app.models.schemas import FraudFlag
+    from app.services.rules import make_flag, shared_flag
+
+    fields = dict(type="velocity_check", severity="high", score=35, confidence=0.8, message="5 transactions")
+    for extra in ({}, {"metadata": {"count": 5}}):
+        expected = FraudFlag(**fields, **extra)
+        # shared_flag only serves constant (hashable) arguments, i.e. no metadata
+        built = [make_flag(**fields, **extra)] + ([] if extra else [shared_flag(**fields)])
+        for flag in built:
+            assert flag == expected
+            assert flag.model_fields_set == expected.model_fields_set
+            assert flag.model_dump() == expected.model_dump()
+            assert flag.model_dump_json() == expected.model_dump_json()
+            assert copy.copy(flag) == expected
+            assert copy.deepcopy(flag) == expected
+            assert flag.model_copy() == expected
+            if not extra:
+                assert hash(flag) == hash(expected)
+
+
+def test_formatted_flags_are_reused_per_message():
+    """Test value-message rules reuse one flag per rendered message"""
+    from app.services.rules import DeepLearningScoreRule
+
+    rule = DeepLearningScoreRule()
+    first = rule.flag_for(0.912)
+    assert first.message == "DL fraud score: 0.91"
+    assert rule.flag_for(0.9149) is first
+    assert rule.flag_for(0.93).message == "DL fraud score: 0.93"
+
+
+def test_fixed_precision_messages_match_format():
+    """Test flags looked up by rounded value render exactly what the format spec would"""
+    import random
+    from app.services.rules import EnsembleConfidenceRule, UnusualTransactionFrequencyRule
+
+    for rule in (EnsembleConfidenceRule(), UnusualTransactionFrequencyRule()):
+        assert rule.value_precision is not None
+        for _ in range(2000):
+            value = random.uniform(0, 100)
+            assert rule.flag_for(value).message == rule.message.format(value=value)
+
+
 def test_get_all_rules():
     """Test getting all rule names"""
     engine = FraudRulesEngine()
@@ -348,6 +480,18 @@ def test_vertical_enum_conversion():
     assert risk_score is not None
     assert risk_level is not None
 
+    # Without an explicit industry the enum's value selects the vertical
+    wallet = TransactionCheckRequest(
+        transaction_id="test_enum_002",
+        user_id="user_001",
+        amount=1000000,
+        is_new_wallet=True,
+        industry=Industry.CRYPTO,
+        transaction_type="crypto_withdrawal"
+    )
+    _, _, _, flags = engine.evaluate(wallet, {})
+    assert "new_wallet_high_value" in [flag.type for flag in flags]
+
     print(f"✅ Industry enum conversion works correctly")
 
 
@@ -384,6 +528,40 @@ def test_rule_applies_to_vertical():
     print(f"✅ Rule vertical applicability checks pass")
 
 
+def test_rule_vertical_mask():
+    """Test vertical bitmask matches the rule's vertical list"""
+    from app.services.rules import LoanStackingRule, VERTICAL_BIT
+
+    loan_rule = LoanStackingRule()
+    assert loan_rule.vertical_mask & VERTICAL_BIT["lending"]
+    assert not loan_rule.vertical_mask & VERTICAL_BIT["crypto"]
+    assert loan_rule.applies_to_vertical("unknown") == False
+
+    engine = FraudRulesEngine()
+    for rule in engine.rules:
+        for vertical in VERTICAL_BIT:
+            assert rule.applies_to_vertical(vertical) == (vertical in rule.verticals)
+
+    for vertical, rules in engine.rules_by_vertical.items():
+        assert sorted(rules, key=id) == sorted((rule for rule in engine.rules if vertical in rule.verticals), key=id)
+
+    for rule in engine.rules:
+        assert engine.get_rule_by_name(rule.name) is next(r for r in engine.rules if r.name == rule.name)
+    assert engine.get_rule_by_name("no_such_rule") is None
+
+    # Indexing doesn't reorder self.rules, so a duplicate name resolves to
+    # the first declared rule (CardReputationLowRule, not the later
+    # TransactionCardReputationRule)
+    from app.services.rules import CardReputationLowRule
+
+    declared = list(engine.rules)
+    engine.index_rules()
+    assert engine.rules == declared
+    assert type(engine.get_rule_by_name("card_reputation_low")) is CardReputationLowRule
+
+    print(f"✅ Rule vertical mask checks pass")
+
+
 # ============================================================================
 # PHASE 1 FEATURES - 10 NEW RULES (Rules 30-39) TESTS
 # ============================================================================
@@ -800,6 +978,42 @@ def test_timezone_hopping_rule():
     print("✅ Timezone hopping rule passed")
 
 
+def test_timezone_hopping_rule_utc_offset():
+    """Test timezone hopping treats a UTC (0) offset as real data"""
+    from app.services.rules import TimezoneHoppingRule
+
+    rule = TimezoneHoppingRule()
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=100000,
+        timezone_offset=0
+    )
+
+    assert rule.check(transaction, {"previous_timezone_offset": 540}) is not None
+    assert rule.check(transaction, {"previous_timezone_offset": -540}) is not None
+    assert rule.check(transaction, {"previous_timezone_offset": 60}) is None
+
+    print("✅ Timezone hopping UTC offset passed")
+
+
+def test_robot_session_zero_duration():
+    """Test a zero-second session is treated as data, not as missing"""
+    from app.services.rules import RobotSessionDetectionRule
+
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=100000,
+        session_duration_seconds=0,
+        mouse_movement_score=0
+    )
+
+    assert RobotSessionDetectionRule().check(transaction, {}) is not None
+
+    print("✅ Robot session zero duration passed")
+
+
 def test_robot_session_detection_rule():
     """Test bot/robot session detection"""
     from app.services.rules import RobotSessionDetectionRule
@@ -1110,6 +1324,103 @@ def test_browser_consistency_rule():
     print("✅ Browser consistency rule passed")
 
 
+def test_rule_strings_interned():
+    """Test rule names and severities are interned and shared by their flags"""
+    import sys
+    from app.services.rules import KeystrokeDynamicsRule
+
+    rule = KeystrokeDynamicsRule()
+    assert rule.name is sys.intern("".join(["keystroke", "_dynamics"]))
+    assert rule.severity is sys.intern("".join(["med", "ium"]))
+
+    flag = rule.check(TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=100000,
+        keystroke_dynamics_score=10
+    ), {})
+    assert flag.type is rule.name
+    assert flag.severity is rule.severity
+
+    print("✅ Rule string interning passed")
+
+
+def test_phase2_rules_use_slots():
+    """Test Phase 2 rules carry no per-instance __dict__"""
+    from app.services.rules import BrowserFingerprintConsistencyRule, ChargebackHistoryRule
+
+    for rule in (BrowserFingerprintConsistencyRule(), ChargebackHistoryRule()):
+        assert not hasattr(rule, "__dict__")
+        assert rule.name and rule.vertical_mask
+
+    print("✅ Phase 2 slots check passed")
+
+
+def test_changed_since_last():
+    """Test shared previous-value comparison helper"""
+    from app.services.rules import changed_since_last
+
+    assert changed_since_last("a", {"prev": "b"}, "prev") == True
+    assert changed_since_last("a", {"prev": "a"}, "prev") == False
+    assert changed_since_last("a", {}, "prev") == False
+    assert changed_since_last(None, {"prev": "b"}, "prev") == False
+
+    print("✅ changed_since_last helper passed")
+
+
+def test_threshold_rule():
+    """Test data-driven threshold rules"""
+    from app.services.rules import ThresholdRule, NewSocialMediaAccountRule, ShippingBillingDistanceRule
+
+    rule = NewSocialMediaAccountRule()
+    assert isinstance(rule, ThresholdRule)
+
+    # Zero is real data, not a missing value
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=100000,
+        social_media_age_days=0
+    )
+    assert rule.check(transaction, {}) is not None
+
+    transaction = TransactionCheckRequest(
+        transaction_id="test_002",
+        user_id="user_001",
+        amount=100000,
+        shipping_distance_km=800
+    )
+    result = ShippingBillingDistanceRule().check(transaction, {})
+    assert result.message == "Shipping 800km from billing"
+    assert ShippingBillingDistanceRule().check(TransactionCheckRequest(transaction_id="t", user_id="u", amount=1), {}) is None
+
+    print("✅ Threshold rule passed")
+
+
+def test_engine_skips_rules_missing_context():
+    """Test engine skips rules whose required context keys are absent"""
+    from app.services.rules import BrowserConsistencyRule
+
+    rule = BrowserConsistencyRule()
+    assert rule.required_context_keys == frozenset({"previous_browser_fonts_hash"})
+
+    engine = FraudRulesEngine()
+    engine.rules = [rule]
+    engine.index_rules()
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=100000,
+        browser_fonts_hash="hash123"
+    )
+
+    assert engine.evaluate(transaction, {}, industry="lending")[3] == []
+    flags = engine.evaluate(transaction, {"previous_browser_fonts_hash": "hash456"}, industry="lending")[3]
+    assert [flag.type for flag in flags] == ["browser_consistency"]
+
+    print("✅ Context key gating passed")
+
+
 # ============================================================================
 # PHASE 3 FEATURES - 52 NEW RULES (Rules 56-107) TESTS
 # ============================================================================
@@ -2140,3 +2451,763 @@ def test_total_rule_count_with_phase2_phase3():
     assert len(rule_names) == 109, f"Expected 109 rules, got {len(rule_names)}"
 
     print(f"✅ All 109 rules present (29 original + 10 Phase 1 + 70 Phase 2&3)")
+
+
+# ============================================================================
+# BATCH SCORING TESTS
+# ============================================================================
+
+def _random_phase3_transactions(count, seed=7):
+    """Build transactions with random values for the batch-scored fields"""
+    import random
+    from operator import eq
+    from app.services.batch_scoring import PHASE3_BATCH_RULES
+
+    rng = random.Random(seed)
+    field_types = TransactionCheckRequest.model_fields
+    industries = ["lending", "fintech", "ecommerce", "betting", "crypto", "marketplace", "gaming"]
+    rules = [rule_class() for rule_class in PHASE3_BATCH_RULES]
+    transactions = []
+    for i in range(count):
+        values = {}
+        for rule in rules:
+            if rng.random() < 0.3:
+                continue
+            if rule.op is eq:
+                values[rule.attr] = rng.random() < 0.5
+            elif "float" in str(field_types[rule.attr].annotation):
+                values[rule.attr] = rng.choice([0.0, round(rng.random(), 2), rule.threshold])
+            else:
+                values[rule.attr] = rng.choice([0, rng.randint(1, 100), int(rule.threshold)])
+        transactions.append(TransactionCheckRequest(
+            transaction_id=f"batch_{i}",
+            user_id="user_001",
+            amount=100000,
+            industry=rng.choice(industries),
+            **values
+        ))
+    return transactions
+
+
+def test_batch_scorer_matches_rule_checks():
+    """Test vectorized batch scoring matches per-rule check() exactly"""
+    from app.services.batch_scoring import BatchRuleScorer
+
+    scorer = BatchRuleScorer()
+    transactions = _random_phase3_transactions(200)
+    scores, batch_flags = scorer.evaluate_batch(transactions)
+
+    for transaction, score, flags in zip(transactions, scores, batch_flags):
+        expected = [
+            rule.check(transaction, {})
+            for rule in scorer.rules
+            if rule.applies_to_vertical(transaction.industry)
+        ]
+        expected = [flag for flag in expected if flag]
+        assert [(f.type, f.score, f.confidence, f.message) for f in flags] == [(f.type, f.score, f.confidence, f.message) for f in expected]
+        assert score == min(sum(f.score for f in expected), 100)
+
+    print("✅ Batch scorer parity passed")
+
+
+def test_batch_scorer_columns_match_models():
+    """Test column-oriented batch scoring matches scoring the request models"""
+    import pandas as pd
+    from app.services.batch_scoring import BatchRuleScorer
+
+    scorer = BatchRuleScorer()
+    transactions = _random_phase3_transactions(200)
+    frame = pd.DataFrame([transaction.model_dump(include=set(scorer.fields)) for transaction in transactions])
+
+    scores, flags = scorer.evaluate_columns(frame, [transaction.industry for transaction in transactions])
+    expected_scores, expected_flags = scorer.evaluate_batch(transactions)
+
+    assert (scores == expected_scores).all()
+    assert flags == expected_flags
+
+    # Absent columns skip their rules, the same as all-missing values
+    sparse = frame.drop(columns=["deep_learning_fraud_score", "ensemble_model_confidence"])
+    blank = frame.assign(deep_learning_fraud_score=None, ensemble_model_confidence=None)
+    sparse_scores, sparse_flags = scorer.evaluate_columns(sparse, "lending")
+    blank_scores, blank_flags = scorer.evaluate_columns(blank, "lending")
+    assert (sparse_scores == blank_scores).all()
+    assert sparse_flags == blank_flags
+
+    with pytest.raises(ValueError):
+        scorer.evaluate_columns({"amount": [1]}, "lending")
+
+    print("✅ Column batch scoring passed")
+
+
+def test_compiled_threshold_rules_match_rule_checks():
+    """Test the generated straight-line evaluator matches per-rule check()"""
+    from app.services.batch_scoring import BatchRuleScorer
+    from app.services.rules import compile_threshold_rules
+
+    scorer = BatchRuleScorer()
+    for transaction in _random_phase3_transactions(100):
+        expected = [
+            rule.check(transaction, {})
+            for rule in scorer.rules
+            if rule.applies_to_vertical(transaction.industry)
+        ]
+        expected = [flag for flag in expected if flag]
+        score, flags = scorer.evaluate(transaction)
+        assert flags == expected
+        assert score == min(sum(f.score for f in expected), 100)
+
+    with pytest.raises(ValueError):
+        compile_threshold_rules([NewAccountLargeAmountRule()])
+
+    print("✅ Compiled threshold rules parity passed")
+
+
+def test_batch_kernel_matches_numpy_hits():
+    """Test the fused scoring kernel agrees with the NumPy evaluator"""
+    import numpy as np
+    from app.services.batch_scoring import BatchRuleScorer, _score_kernel
+    from app.services.rules import VERTICAL_BIT
+
+    scorer = BatchRuleScorer()
+    transactions = _random_phase3_transactions(50)
+    values = scorer.field_matrix(transactions)
+    industry_bits = np.array([VERTICAL_BIT[t.industry] for t in transactions], dtype=np.int64)
+
+    hits = np.zeros(values.shape, dtype=np.bool_)
+    scores = np.empty(len(transactions), dtype=np.int64)
+    _score_kernel(values, scorer.ops, scorer.thresholds, scorer.base_scores, scorer.score_offsets, scorer.score_per_unit, scorer.score_caps, scorer.vertical_masks, industry_bits, hits, scores)
+
+    expected = scorer.hits(values, industry_bits)
+    assert (hits == expected).all()
+    assert (scores == scorer.row_scores(values, expected)).all()
+
+    print("✅ Batch kernel parity passed")
+
+
+def test_evaluate_parallel_matches_serial():
+    """Test process-parallel batch evaluation preserves order and results"""
+    from app.services.batch_scoring import evaluate_parallel
+
+    transactions = _random_phase3_transactions(12)
+    engine = FraudRulesEngine()
+    expected = [engine.evaluate(transaction, {}, "lending") for transaction in transactions]
+
+    assert evaluate_parallel(transactions, industry="lending", max_workers=2, chunk_size=5) == expected
+    assert evaluate_parallel(transactions, industry="lending") == expected
+
+    print("✅ Parallel batch evaluation passed")
+
+
+def test_zen_jdm_export_matches_rule_checks():
+    """Test the exported JDM decision fires the same rules as check()"""
+    pytest.importorskip("zen")
+    from app.services.rule_export import ZenRuleEvaluator
+
+    evaluator = ZenRuleEvaluator()
+    for transaction in _random_phase3_transactions(50):
+        expected = [
+            flag for flag in (
+                rule.check(transaction, {}) for rule in evaluator.rules
+                if rule.applies_to_vertical(transaction.industry)
+            )
+            if flag is not None
+        ]
+        assert evaluator.evaluate(transaction) == expected
+
+    print("✅ Zen JDM export parity passed")
+
+
+def test_zen_decision_loads_from_file(tmp_path):
+    """Test a saved JDM file loads and that edited thresholds apply on reload"""
+    pytest.importorskip("zen")
+    import json
+    from app.services.rule_export import ZenRuleEvaluator, save_jdm
+    from app.services.rules import KeystrokeDynamicsRule
+
+    path = tmp_path / "threshold_rules.json"
+    save_jdm(str(path), [KeystrokeDynamicsRule()])
+    evaluator = ZenRuleEvaluator([KeystrokeDynamicsRule], jdm_path=str(path))
+
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=100000,
+        keystroke_dynamics_score=40
+    )
+    assert evaluator.evaluate(transaction) == []
+
+    jdm = json.loads(path.read_text())
+    jdm["nodes"][1]["content"]["rules"][0]["in_keystroke_dynamics_score"] = "< 50"
+    path.write_text(json.dumps(jdm))
+    evaluator.reload()
+
+    flags = evaluator.evaluate(transaction)
+    assert [flag.type for flag in flags] == ["keystroke_dynamics"]
+
+    print("✅ Zen decision file reload passed")
+
+
+def test_hash_bloom_filter():
+    """Test the consortium Bloom filter has no false negatives and few false positives"""
+    import hashlib
+    from app.services.consortium import HashBloomFilter
+
+    def digest(i):
+        return hashlib.sha256(str(i).encode()).hexdigest()
+
+    bloom = HashBloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(digest(i))
+
+    assert all(digest(i) in bloom for i in range(1000))
+    false_positives = sum(digest(i) in bloom for i in range(1000, 11000))
+    assert false_positives < 300
+
+    print("✅ Hash Bloom filter passed")
+
+
+def test_consortium_known_hashes_resync(monkeypatch):
+    """Test filter misses skip the database between resyncs and reports become visible"""
+    from sqlalchemy import create_engine, event
+    from sqlalchemy.dialects.postgresql import JSONB
+    from sqlalchemy.ext.compiler import compiles
+    from sqlalchemy.orm import sessionmaker
+    from app.models.database import ConsortiumIntelligence
+    from app.services import consortium
+    from app.services.consortium import ConsortiumService
+
+    @compiles(JSONB, "sqlite")
+    def _jsonb_as_json(type_, compiler, **kw):
+        return "JSON"
+
+    engine = create_engine("sqlite://")
+    ConsortiumIntelligence.__table__.create(engine)
+    Session = sessionmaker(bind=engine)
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    for name, value in (("_known_hashes", None), ("_known_hashes_synced_at", 0.0), ("_known_hashes_max_id", 0), ("_known_hashes_sync_from", 0)):
+        monkeypatch.setattr(consortium, name, value)
+
+    def transaction(bvn):
+        return TransactionCheckRequest(transaction_id="test_001", user_id="user_001", amount=5000, bvn=bvn)
+
+    checker = ConsortiumService(Session(), "client_a")
+    assert checker.check_fraud_patterns(transaction("12345678901"))["fraud_count"] == 0
+
+    # Between resyncs a miss is answered from the filter alone
+    statements.clear()
+    assert checker.check_fraud_patterns(transaction("12345678901"))["fraud_count"] == 0
+    assert statements == []
+
+    # Reported through another service in this process: visible at once
+    ConsortiumService(Session(), "client_b").report_fraud(transaction("12345678901"), "loan_stacking", 50000)
+    assert checker.check_fraud_patterns(transaction("12345678901"))["fraud_count"] == 1
+
+    # Written by another process: visible after the next resync
+    other_session = Session()
+    other_session.add(ConsortiumIntelligence(bvn_hash=consortium.hash_bvn("10987654321"), fraud_count=1, client_count=1))
+    other_session.commit()
+    assert checker.check_fraud_patterns(transaction("10987654321"))["fraud_count"] == 0
+    monkeypatch.setattr(consortium, "_known_hashes_synced_at", consortium._known_hashes_synced_at - consortium.KNOWN_HASHES_RESYNC_SECONDS)
+    assert checker.check_fraud_patterns(transaction("10987654321"))["fraud_count"] == 1
+
+    print("✅ Consortium known-hash resync passed")
+
+
+def test_hash_bloom_filter_concurrent_adds():
+    """Test adds from several threads never lose a bit"""
+    import hashlib
+    import time
+    from concurrent.futures import ThreadPoolExecutor
+    from app.services.consortium import HashBloomFilter
+
+    class YieldingBits(bytearray):
+        # Give up the GIL between reading a byte and writing it back, so
+        # unsynchronised read-modify-writes would overwrite each other
+        def __getitem__(self, index):
+            value = super().__getitem__(index)
+            time.sleep(0)
+            return value
+
+    def digest(i):
+        return hashlib.sha256(str(i).encode()).hexdigest()
+
+    # Small filter so concurrent adds keep hitting the same bytes
+    bloom = HashBloomFilter(capacity=100, error_rate=0.01)
+    bloom.bits = YieldingBits(bloom.bits)
+    digests = [digest(i) for i in range(800)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda start: [bloom.add(d) for d in digests[start::8]], range(8)))
+
+    assert all(d in bloom for d in digests)
+
+    print("✅ Concurrent Bloom filter adds passed")
+
+
+def test_rule_timer_records_each_check():
+    """Test the engine reports every rule check to rule_timer without changing results"""
+    from app.core.monitoring import get_performance_monitor, record_rule_timing
+
+    timings = []
+    engine = FraudRulesEngine(early_exit_threshold=None, rule_timer=lambda name, ns: timings.append((name, ns)))
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=150000,
+        account_age_days=3
+    )
+
+    result = engine.evaluate(transaction, {}, industry="lending")
+    assert result == FraudRulesEngine(early_exit_threshold=None).evaluate(transaction, {}, industry="lending")
+    assert timings
+    assert all(ns >= 0 for _, ns in timings)
+    assert len({name for name, _ in timings}) == len(timings)
+
+    record_rule_timing("new_account_large_amount", 2500)
+    assert get_performance_monitor().get_statistics("rule.new_account_large_amount")["count"] >= 1
+
+    print("✅ Rule timer passed")
+
+
+def test_disposable_email_rule():
+    """Test disposable domains match case-insensitively anywhere in the address"""
+    from app.services.rules import DisposableEmailRule
+
+    rule = DisposableEmailRule()
+
+    def check(email):
+        return rule.check(TransactionCheckRequest(
+            transaction_id="test_001",
+            user_id="user_001",
+            amount=5000,
+            email=email
+        ), {})
+
+    flag = check("Someone@MAILINATOR.com")
+    assert flag is not None
+    assert flag.message == "Disposable email service detected: mailinator.com"
+    assert check("someone@temp-mail.org").message.endswith("temp-mail.org")
+    assert check("someone@gmail.com") is None
+
+    print("✅ Disposable email rule passed")
+
+
+def test_sequential_applications_rule():
+    """Test sequential email patterns match regardless of case"""
+    from app.services.rules import SequentialApplicationsRule
+
+    rule = SequentialApplicationsRule()
+
+    def check(email):
+        return rule.check(TransactionCheckRequest(
+            transaction_id="test_001",
+            user_id="user_001",
+            amount=5000,
+            email=email
+        ), {})
+
+    assert check("user12@example.com") is not None
+    assert check("TEST3@example.com") is not None
+    assert check("jane.doe@example.com") is None
+
+    print("✅ Sequential applications rule passed")
+
+
+def test_blacklist_rules_need_their_context():
+    """Test blacklist rules match set context and are skipped when the list is absent"""
+    from app.services.rules import CardBINFraudRule, SuspiciousWalletRule
+
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=5000,
+        card_bin="539983",
+        wallet_address="0xabc123def4567890"
+    )
+
+    assert CardBINFraudRule().check(transaction, {"high_risk_bins": frozenset({"539983"})}) is not None
+    assert SuspiciousWalletRule().check(transaction, {"blacklisted_wallets": frozenset({"0xabc123def4567890"})}) is not None
+
+    engine = FraudRulesEngine(early_exit_threshold=None)
+    _, _, _, flags = engine.evaluate(transaction, {}, industry="crypto")
+    assert "suspicious_wallet" not in [flag.type for flag in flags]
+    assert "blacklisted_wallets" in SuspiciousWalletRule().required_context_keys
+
+    print("✅ Blacklist context rules passed")
+
+
+def test_compiled_dispatch_matches_loop():
+    """Test the generated per-vertical dispatch returns exactly what the rule loop does"""
+    compiled = FraudRulesEngine()
+    interpreted = FraudRulesEngine(compile_dispatch=False)
+    transactions = [
+        TransactionCheckRequest(
+            transaction_id="test_001",
+            user_id="user_001",
+            amount=150000,
+            account_age_days=3,
+            email="user12@mailinator.com",
+            card_bin="539983"
+        ),
+        TransactionCheckRequest(
+            transaction_id="test_002",
+            user_id="user_002",
+            amount=5000,
+            account_age_days=400
+        ),
+    ]
+    contexts = [{}, {"high_risk_bins": frozenset({"539983"}), "lender_count": 5}]
+
+    for industry in ("lending", "ecommerce", "crypto"):
+        for mode in ("any_critical", "score_gate", "full"):
+            for transaction in transactions:
+                for context in contexts:
+                    expected = interpreted.evaluate(transaction, context, industry=industry, mode=mode)
+                    assert compiled.evaluate(transaction, context, industry=industry, mode=mode) == expected
+
+    assert set(compiled.dispatch_by_vertical) == {"lending", "ecommerce", "crypto"}
+
+    print("✅ Compiled rule dispatch passed")
+
+
+def test_suspicious_hours_window(monkeypatch):
+    """Test suspicious hours fire from 2:00 through 5:00 inclusive"""
+    from datetime import datetime
+    import app.services.rules as rules_module
+    from app.services.rules import SuspiciousHoursRule
+
+    rule = SuspiciousHoursRule()
+    transaction = TransactionCheckRequest(transaction_id="test_001", user_id="user_001", amount=5000)
+
+    def check_at(hour, minute):
+        class FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return cls(2024, 1, 1, hour, minute)
+
+        monkeypatch.setattr(rules_module, "datetime", FrozenDatetime)
+        return rule.check(transaction, {})
+
+    assert check_at(3, 30).message == "Transaction at 03:30 AM - unusual hours"
+    assert check_at(5, 0) is not None
+    assert check_at(5, 1) is None
+    assert check_at(1, 59) is None
+    assert check_at(14, 0) is None
+
+    print("✅ Suspicious hours window passed")
+
+
+def test_required_fields_gate_matches_checks():
+    """Test rules gated on transaction fields give the same results with falsy and missing values"""
+    from app.services.rules import NewAccountLargeAmountRule
+
+    assert NewAccountLargeAmountRule().required_fields == ("account_age_days",)
+
+    compiled = FraudRulesEngine(early_exit_threshold=None)
+    interpreted = FraudRulesEngine(early_exit_threshold=None, compile_dispatch=False)
+    transactions = [
+        TransactionCheckRequest(transaction_id="test_001", user_id="user_001", amount=5000),
+        TransactionCheckRequest(
+            transaction_id="test_002",
+            user_id="user_002",
+            amount=250000,
+            account_age_days=0,
+            is_first_transaction=True,
+            phone_changed_recently=False,
+            dormant_days=0,
+            email="temp1@tempmail.com"
+        ),
+    ]
+    for industry in ("lending", "fintech", "betting", "marketplace"):
+        for transaction in transactions:
+            assert compiled.evaluate(transaction, {}, industry=industry) == interpreted.evaluate(transaction, {}, industry=industry)
+
+    print("✅ Required fields gate passed")
+
+
+def test_impossible_travel_uses_great_circle_distance():
+    """Test travel distance is the haversine distance between the two points"""
+    from app.services.rules import ImpossibleTravelRule, haversine_km
+
+    # Lagos -> Abuja is roughly 525km as the crow flies
+    assert 515 < haversine_km(6.5244, 3.3792, 9.0765, 7.3986) < 535
+    assert haversine_km(6.5, 3.4, 6.5, 3.4) == 0
+
+    rule = ImpossibleTravelRule()
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=5000,
+        latitude=9.0765,
+        longitude=7.3986
+    )
+    last_location = {"latitude": 6.5244, "longitude": 3.3792}
+
+    assert rule.check(transaction, {"last_location": {**last_location, "time_diff_hours": 8}}) is None
+    flag = rule.check(transaction, {"last_location": {**last_location, "time_diff_hours": 0.25}})
+    assert flag is not None
+    assert flag.severity == "critical"
+
+    print("✅ Impossible travel distance passed")
+
+
+def test_constant_hits_share_one_flag():
+    """Test rules with a fixed message and score return one shared flag per hit site"""
+    from app.services.rules import ArbitrageBettingRule
+
+    rule = ArbitrageBettingRule()
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=5000,
+        bet_pattern_unusual=True
+    )
+
+    first = rule.check(transaction, {})
+    assert first is not None
+    assert first.type == "arbitrage_betting"
+    assert rule.check(transaction, {}) is first
+    assert first.model_dump() == FraudFlag(**first.model_dump()).model_dump()
+
+    print("✅ Shared constant flags passed")
+
+
+def test_ip_range_set_and_vpn_ranges():
+    """Test CIDR membership lookups and VPN detection from configured ranges"""
+    from app.services.rules import IPRangeSet, VPNProxyRule
+
+    ranges = IPRangeSet(["10.0.0.0/8", "10.1.0.0/16", "192.168.0.0/16", "2001:db8::/32"])
+    assert len(ranges) == 3
+    assert "10.255.0.1" in ranges
+    assert "192.168.4.4" in ranges
+    assert "2001:db8::1" in ranges
+    assert "11.0.0.1" not in ranges
+    assert "172.16.0.1" not in ranges
+    assert "not-an-ip" not in ranges
+
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=5000,
+        ip_address="185.220.101.7"
+    )
+    assert VPNProxyRule().check(transaction, {}) is None
+    assert VPNProxyRule().check(transaction, {"is_vpn": True}) is not None
+    assert VPNProxyRule(vpn_cidrs=["185.220.100.0/22"]).check(transaction, {}) is not None
+
+    print("✅ IP range set passed")
+
+
+def test_round_amount_rule():
+    """Test exact round amounts fire only on new accounts"""
+    from app.services.rules import RoundAmountRule
+
+    rule = RoundAmountRule()
+
+    def check(amount, account_age_days):
+        return rule.check(TransactionCheckRequest(
+            transaction_id="test_001",
+            user_id="user_001",
+            amount=amount,
+            account_age_days=account_age_days
+        ), {})
+
+    assert check(100000, 3) is not None
+    assert check(100000.0, 3) is not None
+    assert check(100001, 3) is None
+    assert check(100000, 30) is None
+    assert check(100000, None) is None
+
+    print("✅ Round amount rule passed")
+
+
+def test_high_risk_category_rule():
+    """Test high-risk categories match case-insensitively on new accounts only"""
+    from app.services.rules import HighRiskCategoryRule
+
+    rule = HighRiskCategoryRule()
+
+    def check(product_category, account_age_days):
+        return rule.check(TransactionCheckRequest(
+            transaction_id="test_001",
+            user_id="user_001",
+            amount=50000,
+            product_category=product_category,
+            account_age_days=account_age_days
+        ), {})
+
+    assert check("Gift_Cards", 3).message == "New account purchasing Gift_Cards - high fraud category"
+    assert check("groceries", 3) is None
+    assert check("phones", 14) is None
+    assert check("phones", None) is None
+    assert check(None, 3) is None
+
+    print("✅ High risk category rule passed")
+
+
+def test_batch_scorer_matches_checks_one_ulp_from_thresholds():
+    """Test batch scoring agrees with check() for values one ulp either side of each float threshold"""
+    import math
+    import pandas as pd
+    from app.services.batch_scoring import BatchRuleScorer
+
+    scorer = BatchRuleScorer()
+    float_rules = [rule for rule in scorer.rules if isinstance(rule.threshold, float)]
+    assert float_rules
+
+    transactions = []
+    for rule in float_rules:
+        for value in (math.nextafter(rule.threshold, -math.inf), rule.threshold, math.nextafter(rule.threshold, math.inf)):
+            transactions.append(TransactionCheckRequest(
+                transaction_id="test_001",
+                user_id="user_001",
+                amount=5000,
+                industry="crypto",
+                **{rule.attr: value}
+            ))
+
+    expected = [[rule.name for rule in scorer.rules if rule.check(txn, {})] for txn in transactions]
+    _, flags = scorer.evaluate_batch(transactions, industry="crypto")
+    assert [[flag.type for flag in row] for row in flags] == expected
+
+    frame = pd.DataFrame([txn.model_dump(include=set(scorer.fields)) for txn in transactions])
+    _, flags = scorer.evaluate_columns(frame, "crypto")
+    assert [[flag.type for flag in row] for row in flags] == expected
+
+    print("✅ Batch scorer threshold parity passed")
+
+
+def test_column_rule_scorer_matches_rule_checks():
+    """Test column masks for field-only engine rules match check() on the request models"""
+    import random
+    import pandas as pd
+    from app.services.batch_scoring import ColumnRuleScorer
+
+    rng = random.Random(7)
+    scorer = ColumnRuleScorer()
+    transactions = [
+        TransactionCheckRequest(
+            transaction_id=f"column_{i}",
+            user_id="user_001",
+            amount=rng.choice([50000, 50001, 100000, 100001.5, 475000, 500000, 1000]),
+            industry=rng.choice(["lending", "ecommerce", "betting", "crypto", "marketplace"]),
+            account_age_days=rng.choice([None, 0, 6, 7, 13, 14, 400]),
+            is_first_transaction=rng.choice([True, False]),
+            dormant_days=rng.choice([None, 0, 89, 90, 365]),
+            shipping_address_matches_billing=rng.choice([None, True, False]),
+            withdrawal_count_today=rng.choice([None, 0, 4, 5, 9]),
+            seller_rating=rng.choice([None, 0.0, 1.5, 2.5, 4.8]),
+            seller_account_age_days=rng.choice([None, 0, 3, 7, 90]),
+            is_high_value_item=rng.choice([None, True, False])
+        )
+        for i in range(300)
+    ]
+    fields = {
+        "amount", "account_age_days", "is_first_transaction", "dormant_days", "shipping_address_matches_billing",
+        "withdrawal_count_today", "seller_rating", "seller_account_age_days", "is_high_value_item",
+    }
+    frame = pd.DataFrame([transaction.model_dump(include=fields) for transaction in transactions])
+
+    scores, flags = scorer.evaluate_columns(frame, [transaction.industry for transaction in transactions])
+
+    for transaction, score, row_flags in zip(transactions, scores, flags):
+        expected = [
+            rule.check(transaction, {})
+            for rule in scorer.rules
+            if rule.applies_to_vertical(transaction.industry)
+        ]
+        expected = [flag for flag in expected if flag]
+        assert [(f.type, f.score, f.message) for f in row_flags] == [(f.type, f.score, f.message) for f in expected]
+        assert score == min(sum(f.score for f in expected), 100)
+
+    print("✅ Column rule scorer passed")
+
+
+def test_hashed_string_set_as_wallet_blacklist():
+    """Test the compact hashed set answers membership for blacklist context"""
+    from app.services.rules import HashedStringSet, SuspiciousWalletRule
+
+    wallets = [f"0x{i:040x}" for i in range(5000)]
+    blacklist = HashedStringSet(wallets)
+    assert len(blacklist) == 5000
+    assert all(wallet in blacklist for wallet in wallets)
+    assert not any(f"0x{i:040x}" in blacklist for i in range(5000, 10000))
+    assert None not in blacklist
+
+    transaction = TransactionCheckRequest(
+        transaction_id="test_001",
+        user_id="user_001",
+        amount=5000,
+        wallet_address=wallets[42]
+    )
+    assert SuspiciousWalletRule().check(transaction, {"blacklisted_wallets": blacklist}) is not None
+
+    print("✅ Hashed string set passed")
+
+
+def test_engine_rules_use_slots():
+    """Test every engine rule is fully slotted (no per-instance __dict__)"""
+    engine = FraudRulesEngine()
+    assert [rule.name for rule in engine.rules if hasattr(rule, "__dict__")] == []
+
+    print("✅ Engine rule slots passed")
+
+
+def test_cash_out_transaction_types():
+    """Test transaction-type membership works for enum members and their string values"""
+    from app.services.rules import CASH_OUT_TYPES, ContactChangeWithdrawalRule
+    from app.models.schemas import TransactionType
+
+    assert TransactionType.WITHDRAWAL in CASH_OUT_TYPES
+    assert "loan_disbursement" in CASH_OUT_TYPES
+    assert TransactionType.PURCHASE not in CASH_OUT_TYPES
+
+    rule = ContactChangeWithdrawalRule()
+
+    def check(transaction_type):
+        return rule.check(TransactionCheckRequest(
+            transaction_id="test_001",
+            user_id="user_001",
+            amount=5000,
+            transaction_type=transaction_type,
+            phone_changed_recently=True
+        ), {})
+
+    assert check("withdrawal") is not None
+    assert check("purchase") is None
+
+    print("✅ Cash-out transaction types passed")
+
+
+def test_single_field_engine_rules_are_table_driven():
+    """Test engine rules expressed as ThresholdRule rows keep their boundaries and messages"""
+    from app.services.rules import (
+        ThresholdRule,
+        DormantAccountActivationRule,
+        ExcessiveWithdrawalsRule,
+        SuspiciousIPReputationRule,
+        ArbitrageBettingRule,
+    )
+
+    def check(rule, **fields):
+        return rule.check(TransactionCheckRequest(transaction_id="test_001", user_id="user_001", amount=5000, **fields), {})
+
+    dormant = DormantAccountActivationRule()
+    assert isinstance(dormant, ThresholdRule)
+    assert dormant.required_fields == ("dormant_days",)
+    assert check(dormant, dormant_days=89) is None
+    assert check(dormant, dormant_days=90).message == "Account dormant for 90 days, suddenly active"
+
+    withdrawals = ExcessiveWithdrawalsRule()
+    assert check(withdrawals, withdrawal_count_today=4) is None
+    assert check(withdrawals, withdrawal_count_today=5).message == "5 withdrawals today - possible structuring"
+
+    ip_reputation = SuspiciousIPReputationRule()
+    assert check(ip_reputation, ip_reputation_score=30) is None
+    assert check(ip_reputation, ip_reputation_score=0) is not None
+
+    arbitrage = ArbitrageBettingRule()
+    assert check(arbitrage, bet_pattern_unusual=False) is None
+    assert check(arbitrage, bet_pattern_unusual=True).score == 30
+
+    print("✅ Table-driven engine rules passed")